@@ -0,0 +1 @@
+"""Benchmarks of lostinmsh, run them with asv, see ``./manage.sh --bench``."""
@@ -0,0 +1,110 @@
+"""Regenerate the benchmark table of the 2D meshing algorithms.
+
+For each cell of the table, a representative surface (a square with square
+holes) is meshed with each candidate algorithm and the one with the highest
+throughput is kept::
+
+    $ python -m benchmarks.algorithm_table
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import gmsh
+import numpy as np
+
+from lostinmsh.mesh.algorithm import ALGORITHM_TABLE
+
+CANDIDATES = {1: "MeshAdapt", 5: "Delaunay", 6: "Frontal-Delaunay"}
+
+
+def representative(bounds: list[float | None], default: float) -> float:
+    """Value representing a bin of the table."""
+    lower, upper = bounds
+    if upper is None:
+        return 4 * lower if lower else default
+    if not lower:
+        return upper / 4 if upper > 4 else 1.0
+    return float(np.sqrt(lower * upper))
+
+
+def throughput(
+    nb_loops: int, size_ratio: float, relative_area: float, algorithm: int
+) -> float:
+    """Elements per second of the mesh of a square with square holes, with mesh
+    size 1 on the square and 1 / size_ratio on the holes."""
+    width = np.sqrt(relative_area)
+    n = max(1, int(np.ceil(np.sqrt(nb_loops))))
+    side = width / (3 * n)
+    geo = gmsh.model.geo
+
+    gmsh.initialize()
+    gmsh.option.set_number("General.Terminal", 0)
+    gmsh.option.set_number("Mesh.Algorithm", algorithm)
+    gmsh.model.add("algorithm")
+
+    def square(x: float, y: float, a: float, h: float) -> int:
+        points = [
+            geo.add_point(x + dx, y + dy, 0, h)
+            for dx, dy in ((0, 0), (a, 0), (a, a), (0, a))
+        ]
+        lines = [geo.add_line(p, q) for p, q in zip(points, points[1:] + points[:1])]
+        return geo.add_curve_loop(lines)
+
+    holes = [
+        square(
+            width * (k % n + 1 / 3) / n,
+            width * (k // n + 1 / 3) / n,
+            side,
+            1 / size_ratio,
+        )
+        for k in range(nb_loops)
+    ]
+    geo.add_plane_surface([square(0, 0, width, 1.0), *holes])
+    geo.synchronize()
+
+    start = perf_counter()
+    gmsh.model.mesh.generate(2)
+    elapsed = perf_counter() - start
+
+    _, element_tags, _ = gmsh.model.mesh.get_elements(2)
+    nb_elements = sum(len(tags) for tags in element_tags)
+    gmsh.finalize()
+
+    return nb_elements / elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Measure the algorithms and write the table."""
+    parser = ArgumentParser(prog="python -m benchmarks.algorithm_table")
+    parser.add_argument("-o", "--output", type=Path, default=ALGORITHM_TABLE)
+    args = parser.parse_args(argv)
+
+    table: dict[str, Any] = json.loads(ALGORITHM_TABLE.read_text(encoding="utf-8"))
+    table["source"] = "measured by python -m benchmarks.algorithm_table"
+    table["algorithms"] = {str(key): val for key, val in CANDIDATES.items()}
+
+    for cell in table["cells"]:
+        stats = (
+            int(representative(cell["nb_loops"], 64)),
+            representative(cell["size_ratio"], 16),
+            representative(cell["relative_area"], 4e5),
+        )
+        cell["throughput"] = {
+            str(algorithm): throughput(*stats, algorithm) for algorithm in CANDIDATES
+        }
+        cell["algorithm"] = int(max(cell["throughput"], key=cell["throughput"].get))
+        print(stats, cell["throughput"], "->", cell["algorithm"], flush=True)
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(table, file, indent=4)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
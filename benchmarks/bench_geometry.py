@@ -0,0 +1,89 @@
+"""Micro-benchmarks of the geometry kernels."""
+
+import numpy as np
+
+from lostinmsh.geometry import (
+    Geometry,
+    Polygon,
+    circular_boundary,
+    rectangular_boundary,
+)
+from lostinmsh.geometry.polygon import _compute_pq
+from lostinmsh.geometry.smallest_boundary import smallest_circle
+
+from .generators import polygon_grid, star_vertices
+
+
+class VerticesSuite:
+    """Kernels on the vertices of one polygon."""
+
+    params = [10, 100, 1_000, 10_000, 100_000]
+    param_names = ["nb_vertices"]
+    timeout = 300
+
+    def setup(self, nb_vertices: int) -> None:
+        self.vertices = star_vertices(nb_vertices)
+
+    def time_from_vertices(self, nb_vertices: int) -> None:
+        Polygon.from_vertices(self.vertices, "star")
+
+    def peakmem_from_vertices(self, nb_vertices: int) -> None:
+        Polygon.from_vertices(self.vertices, "star")
+
+    def time_smallest_circle(self, nb_vertices: int) -> None:
+        smallest_circle(self.vertices)
+
+
+class PolygonSuite:
+    """Kernels on one polygon with many vertices."""
+
+    params = [10, 100, 1_000, 10_000, 100_000]
+    param_names = ["nb_vertices"]
+    timeout = 300
+
+    def setup(self, nb_vertices: int) -> None:
+        polygon = Polygon.from_vertices(star_vertices(nb_vertices), "star")
+        self.geometry = Geometry.from_polygon(
+            polygon, rectangular_boundary([polygon], 0.25, "background")
+        )
+
+    def time_discrete_critical_interval(self, nb_vertices: int) -> None:
+        self.geometry.discrete_critical_interval()
+
+
+class ComputePQSuite:
+    """Choice of the corner subdivision (p, q) for 1000 angles."""
+
+    params = [4, 16, 64]
+    param_names = ["max_subdiv"]
+
+    def setup(self, max_subdiv: int) -> None:
+        rng = np.random.default_rng(0)
+        self.angles = rng.uniform(0.05, 2 * np.pi - 0.05, 1_000)
+
+    def time_compute_pq(self, max_subdiv: int) -> None:
+        for angle in self.angles:
+            _compute_pq(angle, max_subdiv)
+
+
+class GeometrySuite:
+    """Kernels on many polygons of 8 vertices."""
+
+    params = [1, 10, 100, 1_000, 10_000]
+    param_names = ["nb_polygons"]
+    timeout = 300
+
+    def setup(self, nb_polygons: int) -> None:
+        self.polygons = polygon_grid(nb_polygons)
+        self.geometry = Geometry.from_polygons(
+            self.polygons, rectangular_boundary(self.polygons, 0.25, "background")
+        )
+
+    def time_circular_boundary(self, nb_polygons: int) -> None:
+        circular_boundary(self.polygons, 0.25, "background", 0.25, "PML")
+
+    def time_rectangular_boundary(self, nb_polygons: int) -> None:
+        rectangular_boundary(self.polygons, 0.25, "background", 0.25, "PML")
+
+    def time_discrete_critical_interval(self, nb_polygons: int) -> None:
+        self.geometry.discrete_critical_interval()
@@ -0,0 +1,124 @@
+"""Seeded generators of synthetic polygons."""
+
+import numpy as np
+
+from lostinmsh.geometry import Polygon
+from lostinmsh.type_alias import MatNx2
+
+
+def star_vertices(nb_vertices: int, seed: int = 0) -> MatNx2:
+    """Vertices of a random star-shaped polygon inscribed in the unit disk.
+
+    Parameters
+    ----------
+    nb_vertices : int
+    seed : int, optional, default 0
+
+    Returns
+    -------
+    MatNx2
+    """
+    rng = np.random.default_rng(seed)
+    # Jittered angles keep the vertices well separated.
+    angles = 2 * np.pi * (np.arange(nb_vertices) + rng.uniform(0, 0.5, nb_vertices))
+    angles /= nb_vertices
+    radii = rng.uniform(0.5, 1.0, nb_vertices)
+    return np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
+
+
+def polygon_grid(
+    nb_polygons: int, nb_vertices: int = 8, seed: int = 0
+) -> list[Polygon]:
+    """Random star-shaped polygons on a square grid, one per cell.
+
+    Parameters
+    ----------
+    nb_polygons : int
+    nb_vertices : int, optional, default 8
+        Number of vertices per polygon.
+    seed : int, optional, default 0
+
+    Returns
+    -------
+    list[Polygon]
+    """
+    n = int(np.ceil(np.sqrt(nb_polygons)))
+    return [
+        Polygon.from_vertices(
+            np.array([2.5 * (k % n), 2.5 * (k // n)])
+            + star_vertices(nb_vertices, seed + k),
+            f"polygon_{k}",
+        )
+        for k in range(nb_polygons)
+    ]
+
+
+def tiling_polygons(nb_polygons: int, seed: int = 0) -> list[Polygon]:
+    """Random octagons, one in each cell of a square grid with gaps of 0.2.
+
+    Parameters
+    ----------
+    nb_polygons : int
+    seed : int, optional, default 0
+
+    Returns
+    -------
+    list[Polygon]
+    """
+    rng = np.random.default_rng(seed)
+    n = int(np.ceil(np.sqrt(nb_polygons)))
+    cell = np.array(
+        [[0, 0], [0.5, 0], [1, 0], [1, 0.5], [1, 1], [0.5, 1], [0, 1], [0, 0.5]]
+    )
+    return [
+        Polygon.from_vertices(
+            np.array([k % n, k // n])
+            + 0.1
+            + 0.8 * cell
+            + rng.uniform(-0.05, 0.05, cell.shape),
+            f"tile_{k}",
+        )
+        for k in range(nb_polygons)
+    ]
+
+
+def cocotte_fleche() -> list[Polygon]:
+    """Polygons of the cocotte and fleche example."""
+    cocotte = np.array([[2, 0], [3, 1], [3, 2], [1, 2], [1, 3], [0, 2], [1, 1], [2, 1]])
+    fleche = np.array([[2, 0], [2, 1], [3, 1], [2, 2], [1, 2], [1, 3], [0, 3], [0, 2]])
+    return [
+        Polygon.from_vertices(cocotte - np.array([3.2, 0]), "cocotte"),
+        Polygon.from_vertices(fleche + np.array([0.2, 0]), "fleche"),
+    ]
+
+
+def bow_tie() -> list[Polygon]:
+    """Polygons of the bow-tie example."""
+    a = 3 * np.pi / 4
+    c, s = np.cos(a / 2), np.sin(a / 2)
+    vertices = np.array([[0.0, 0.0], [c, s], [c, -s]])
+    return [
+        Polygon.from_vertices(np.array([0.1, 0.0]) + vertices, "right"),
+        Polygon.from_vertices(np.array([-0.1, 0.0]) - vertices, "left"),
+    ]
+
+
+def monotile() -> list[Polygon]:
+    """Polygon of the aperiodic monotile example."""
+    s3 = np.sqrt(3)
+    vertices = [
+        [0, 0],
+        [0, s3],
+        [1, s3],
+        [3 / 2, 3 * s3 / 2],
+        [3, s3],
+        [3, 0],
+        [4, 0],
+        [9 / 2, -s3 / 2],
+        [3, -s3],
+        [3 / 2, -s3 / 2],
+        [1, -s3],
+        [-1, -s3],
+        [-3 / 2, -s3 / 2],
+    ]
+    return [Polygon.from_vertices(vertices, "cavity")]
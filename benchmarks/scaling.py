@@ -0,0 +1,284 @@
+"""End-to-end scaling of the meshing time and memory.
+
+Each case is meshed in a fresh process and records the wall time, the peak
+resident set size, the number of elements per second and the size of the mesh
+file. The empirical scaling exponents are fitted in log-log scale, the run fails
+if the wall time grows faster than ``elements ** max_exponent``::
+
+    $ python -m benchmarks.scaling -o scaling.json
+    $ python -m benchmarks.scaling --baseline scaling.json
+
+With ``--baseline``, the run also fails if an exponent grows by more than
+``--tolerance`` compared to a previous result file.
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+import numpy as np
+
+import lostinmsh as lsm
+from lostinmsh.geometry import Polygon
+
+from .generators import (
+    bow_tie,
+    cocotte_fleche,
+    monotile,
+    star_vertices,
+    tiling_polygons,
+)
+
+METHODS: dict[str, Callable[..., Any]] = {
+    "unstructured": lsm.mesh_unstructured,
+    "locally_structured": lsm.mesh_locally_structured,
+}
+
+WORKLOADS: dict[str, Callable[[], list[Polygon]]] = {
+    "monotile": monotile,
+    "cocotte_fleche": cocotte_fleche,
+    "bow_tie": bow_tie,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """A geometry meshed with a method and a mesh size."""
+
+    sweep: str
+    workload: str
+    method: str
+    value: float
+    mesh_size: float
+    polygons: list[Polygon]
+
+
+@dataclass(frozen=True, slots=True)
+class Record:
+    """Measures of a case."""
+
+    sweep: str
+    workload: str
+    method: str
+    value: float
+    mesh_size: float
+    nb_vertices: int
+    nb_polygons: int
+    wall_time: float
+    peak_rss: int | None
+    nb_elements: int
+    elements_per_second: float
+    file_size: int
+
+
+def cases(methods: list[str], scale: int) -> Iterator[Case]:
+    """Cases of the sweeps, `scale` sets the number of points of each sweep."""
+    for method in methods:
+        for k in range(scale):
+            nb_vertices = 16 * 2**k
+            yield Case(
+                "vertices",
+                "star",
+                method,
+                nb_vertices,
+                0.1,
+                [Polygon.from_vertices(star_vertices(nb_vertices, k), "star")],
+            )
+
+        for k in range(scale):
+            nb_polygons = 4**k
+            yield Case(
+                "polygons",
+                "tiling",
+                method,
+                nb_polygons,
+                0.1,
+                tiling_polygons(nb_polygons, k),
+            )
+
+        for workload, polygons in WORKLOADS.items():
+            for k in range(scale):
+                mesh_size = 0.2 / 2**k
+                yield Case(
+                    "inverse_mesh_size",
+                    workload,
+                    method,
+                    1 / mesh_size,
+                    mesh_size,
+                    polygons(),
+                )
+
+
+def run_case(case: Case) -> Record:
+    """Mesh a case, to be called in a fresh process."""
+    boundary = lsm.rectangular_boundary(case.polygons, 0.25, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygons(case.polygons, boundary)
+    profiler = lsm.Profiler()
+
+    with TemporaryDirectory() as tmp:
+        filename = Path(tmp) / "mesh.msh"
+        METHODS[case.method](
+            geometry,
+            case.mesh_size,
+            lsm.GmshOptions(filename=filename, profiler=profiler),
+        )
+        file_size = filename.stat().st_size
+
+    report = profiler.report
+    peaks = [phase.peak_rss for phase in report.phases if phase.peak_rss is not None]
+    nb_elements = sum(
+        val for key, val in report.nb_elements.items() if not key.startswith("Point")
+    )
+    return Record(
+        case.sweep,
+        case.workload,
+        case.method,
+        case.value,
+        case.mesh_size,
+        sum(len(polygon.vertices) for polygon in case.polygons),
+        len(case.polygons),
+        report.wall_time,
+        max(peaks) if peaks else None,
+        nb_elements,
+        nb_elements / report.wall_time,
+        file_size,
+    )
+
+
+def fit_exponents(records: list[Record]) -> dict[str, dict[str, float]]:
+    """Fit the scaling exponents of each sweep, workload and method.
+
+    Returns
+    -------
+    dict[str, dict[str, float]]
+        For each ``"sweep/workload/method"``, the exponents of the wall time,
+        peak RSS and number of elements with respect to the sweep value, and of
+        the wall time with respect to the number of elements.
+    """
+    groups: dict[str, list[Record]] = {}
+    for record in records:
+        key = f"{record.sweep}/{record.workload}/{record.method}"
+        groups.setdefault(key, []).append(record)
+
+    exponents: dict[str, dict[str, float]] = {}
+    for key, group in groups.items():
+        if len(group) < 2:
+            continue
+
+        value = np.array([r.value for r in group], dtype=float)
+        elements = np.array([r.nb_elements for r in group], dtype=float)
+        time = np.array([r.wall_time for r in group], dtype=float)
+
+        exponents[key] = {
+            "wall_time": _slope(value, time),
+            "nb_elements": _slope(value, elements),
+            "wall_time_per_elements": _slope(elements, time),
+        }
+        if all(r.peak_rss is not None for r in group):
+            rss = np.array([r.peak_rss for r in group], dtype=float)
+            exponents[key]["peak_rss"] = _slope(value, rss)
+
+    return exponents
+
+
+def _slope(x: np.ndarray, y: np.ndarray) -> float:
+    """Slope of the least squares line in log-log scale."""
+    if np.ptp(np.log(x)) == 0:
+        return 0.0
+    return float(np.polyfit(np.log(x), np.log(y), 1)[0])
+
+
+def check(
+    exponents: dict[str, dict[str, float]],
+    max_exponent: float,
+    baseline: dict[str, dict[str, float]] | None,
+    tolerance: float,
+) -> list[str]:
+    """Return the scaling regressions."""
+    regressions: list[str] = []
+    for key, exps in exponents.items():
+        if exps["wall_time_per_elements"] > max_exponent:
+            regressions.append(
+                f"{key}: wall time ~ elements^{exps['wall_time_per_elements']:.2f}"
+            )
+
+        if baseline is None or key not in baseline:
+            continue
+
+        for name, exp in exps.items():
+            old = baseline[key].get(name)
+            if old is not None and exp > old + tolerance:
+                regressions.append(f"{key}: {name} exponent {old:.2f} -> {exp:.2f}")
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the scaling harness."""
+    parser = ArgumentParser(
+        prog="python -m benchmarks.scaling", description="Meshing scaling harness."
+    )
+    parser.add_argument("--method", choices=[*METHODS, "both"], default="both")
+    parser.add_argument(
+        "--scale", type=int, default=4, help="number of points per sweep"
+    )
+    parser.add_argument("-o", "--output", type=Path, help="JSON result file")
+    parser.add_argument(
+        "--max-exponent",
+        type=float,
+        default=1.25,
+        help="maximum exponent of the wall time with respect to the elements",
+    )
+    parser.add_argument("--baseline", type=Path, help="previous JSON result file")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    methods = list(METHODS) if args.method == "both" else [args.method]
+
+    records: list[Record] = []
+    # gmsh keeps a global state and the peak RSS is per process.
+    with ProcessPoolExecutor(
+        1, mp_context=get_context("spawn"), max_tasks_per_child=1
+    ) as pool:
+        for record in pool.map(run_case, cases(methods, args.scale)):
+            print(
+                f"{record.sweep:<17} {record.workload:<14} {record.method:<18} "
+                f"{record.value:>8g} {record.nb_elements:>9} elements "
+                f"{record.wall_time:8.3f}s {record.elements_per_second:>10.0f} el/s",
+                flush=True,
+            )
+            records.append(record)
+
+    exponents = fit_exponents(records)
+    for key, exps in exponents.items():
+        print(key, ", ".join(f"{name}: {exp:.2f}" for name, exp in exps.items()))
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(
+                {"records": [asdict(r) for r in records], "exponents": exponents},
+                file,
+                indent=2,
+            )
+
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["exponents"]
+
+    regressions = check(exponents, args.max_exponent, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,16 +8,30 @@ __all__: list[str] = [
     "__author__",
     "geometry",
     "Polygon",
+    "Similarity",
     "CircularBoundary",
     "circular_boundary",
     "RectangularBoundary",
     "rectangular_boundary",
     "Geometry",
+    "save_geometry",
+    "load_geometry",
+    "find_symmetry",
     "mesh",
     "GmshOptions",
+    "ExteriorOptions",
+    "CornerOptions",
     "open_msh_file",
+    "Profiler",
+    "estimate_mesh",
     "mesh_unstructured",
     "mesh_locally_structured",
+    "MeshData",
+    "remesh_adaptive",
+    "mesh_hierarchy",
+    "elevate_order",
+    "mesh_tiling",
+    "mesh_symmetric",
     "plot",
     "plot_polygon",
     "plot_geometry",
@@ -30,8 +44,27 @@ from .geometry import (
     Geometry,
     Polygon,
     RectangularBoundary,
+    Similarity,
     circular_boundary,
+    find_symmetry,
+    load_geometry,
     rectangular_boundary,
+    save_geometry,
+)
+from .mesh import (
+    CornerOptions,
+    ExteriorOptions,
+    GmshOptions,
+    MeshData,
+    Profiler,
+    elevate_order,
+    estimate_mesh,
+    mesh_hierarchy,
+    mesh_locally_structured,
+    mesh_symmetric,
+    mesh_tiling,
+    mesh_unstructured,
+    open_msh_file,
+    remesh_adaptive,
 )
-from .mesh import GmshOptions, mesh_locally_structured, mesh_unstructured, open_msh_file
 from .plot import plot_geometry, plot_mesh, plot_polygon  # type: ignore
@@ -0,0 +1,250 @@
+"""Command line interface to mesh many geometry files in parallel.
+
+Examples
+--------
+Mesh every geometry file of a directory with 8 processes::
+
+    $ lostinmsh geometries/*.json --mesh-size 0.1 --mode both -j 8 -o meshes/
+
+The geometry files are created by `save_geometry`. The key of the job of each
+mesh is stored next to it in a ``.key`` file, a mesh is up to date, and skipped,
+if it was created by the same job. A manifest is a JSON list of
+jobs, each job being an object with a ``"geometry"`` path and optionally
+``"mesh_size"``, ``"method"``, ``"output"`` and ``"options"`` overriding the
+command line values; relative paths are relative to the manifest.
+"""
+
+import json
+import sys
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from .geometry import geometry_to_dict, load_geometry
+from .jobs import METHODS, MeshJob, run_job
+
+SUFFIXES = {"unstructured": "unst", "locally_structured": "lost"}
+
+
+@dataclass(frozen=True, slots=True)
+class Task:
+    """A job with its input and output files."""
+
+    source: Path
+    output: Path
+    job: MeshJob
+
+    @property
+    def key_file(self) -> Path:
+        """File storing the key of the job that created the output."""
+        return self.output.with_name(f"{self.output.name}.key")
+
+    def is_up_to_date(self) -> bool:
+        """Return True if the output was created by the same job."""
+        return (
+            self.output.exists()
+            and self.key_file.exists()
+            and self.key_file.read_text(encoding="utf-8") == self.job.key()
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Parameters
+    ----------
+    argv : list[str] | None, optional, default None
+        Command line arguments, if None use `sys.argv`.
+
+    Returns
+    -------
+    int
+        Exit code, 1 if at least one job failed.
+    """
+    args = _parse_args(argv)
+    tasks, invalid = _collect_tasks(args)
+
+    progress = Progress(len(tasks) + len(invalid))
+    for source, error in invalid:
+        progress("FAIL", source, None, error)
+
+    todo: list[Task] = []
+    for task in tasks:
+        if not args.force and task.is_up_to_date():
+            progress("skip", task.output, None)
+        else:
+            todo.append(task)
+
+    start = perf_counter()
+    times: list[float] = []
+    failures = len(invalid)
+    with ProcessPoolExecutor(args.jobs, mp_context=get_context("spawn")) as pool:
+        futures: dict[Future[float], Task] = {}
+        for task in todo:
+            task.output.parent.mkdir(parents=True, exist_ok=True)
+            futures[pool.submit(run_job, task.job, task.output)] = task
+
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                elapsed = future.result()
+            except Exception as error:
+                failures += 1
+                progress("FAIL", task.output, None, f"{error}")
+            else:
+                task.key_file.write_text(task.job.key(), encoding="utf-8")
+                times.append(elapsed)
+                progress("ok", task.output, elapsed)
+
+    _report(
+        len(tasks) + len(invalid),
+        len(tasks) - len(todo),
+        times,
+        failures,
+        perf_counter() - start,
+    )
+
+    return 1 if failures else 0
+
+
+def _parse_args(argv: list[str] | None) -> Namespace:
+    """Parse the command line arguments."""
+    parser = ArgumentParser(
+        prog="lostinmsh", description="Mesh many geometry files in parallel."
+    )
+    parser.add_argument("geometries", nargs="*", type=Path, help="geometry files")
+    parser.add_argument("-m", "--manifest", type=Path, help="JSON manifest of jobs")
+    parser.add_argument("-s", "--mesh-size", type=float, help="mesh size")
+    parser.add_argument(
+        "--mode",
+        choices=[*METHODS, "both"],
+        default="locally_structured",
+        help="meshing method, default locally_structured",
+    )
+    parser.add_argument("-o", "--output-dir", type=Path, help="output directory")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="processes")
+    parser.add_argument("--element-order", type=int, default=1)
+    parser.add_argument("--renumber-nodes", default="RCMK")
+    parser.add_argument(
+        "-f", "--force", action="store_true", help="mesh up to date outputs too"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.geometries and args.manifest is None:
+        parser.error("give geometry files or a manifest")
+
+    if args.jobs < 1:
+        parser.error("the number of jobs must be at least one")
+
+    return args
+
+
+def _collect_tasks(args: Namespace) -> tuple[list[Task], list[tuple[Path, str]]]:
+    """Create the tasks from the geometry files and the manifest, and return
+    the geometry files that cannot be loaded or meshed with the options, with
+    the error. Exit if the manifest is malformed."""
+    methods = list(METHODS) if args.mode == "both" else [args.mode]
+    defaults: dict[str, Any] = {
+        "mesh_size": args.mesh_size,
+        "options": {
+            "element_order": args.element_order,
+            "renumber_nodes": args.renumber_nodes,
+        },
+    }
+
+    entries: list[tuple[Path, dict[str, Any]]] = [
+        (path, {}) for path in args.geometries
+    ]
+    if args.manifest is not None:
+        with open(args.manifest, encoding="utf-8") as file:
+            root = args.manifest.parent
+            for entry in json.load(file):
+                if "geometry" not in entry:
+                    raise SystemExit(
+                        f"lostinmsh: error: a job of {args.manifest} has no geometry"
+                    )
+                entries.append((root / entry["geometry"], entry))
+
+    tasks: list[Task] = []
+    invalid: list[tuple[Path, str]] = []
+    for source, entry in entries:
+        mesh_size = entry.get("mesh_size", defaults["mesh_size"])
+        if mesh_size is None:
+            raise SystemExit(f"lostinmsh: error: no mesh size for {source}")
+
+        if "method" in entry and entry["method"] not in METHODS:
+            raise SystemExit(
+                f"lostinmsh: error: unknown method {entry['method']!r} for {source}"
+            )
+        entry_methods = [entry["method"]] if "method" in entry else methods
+
+        try:
+            geometry = geometry_to_dict(load_geometry(source))
+            options = defaults["options"] | entry.get("options", {})
+            jobs = [
+                MeshJob(geometry, mesh_size, method, options)
+                for method in entry_methods
+            ]
+        except Exception as error:
+            invalid.append((source, f"{type(error).__name__}: {error}"))
+            continue
+
+        for method, job in zip(entry_methods, jobs):
+            if "output" not in entry:
+                directory = args.output_dir if args.output_dir else source.parent
+                output = directory / f"{source.stem}_{SUFFIXES[method]}.msh"
+            elif len(entry_methods) == 1:
+                output = args.manifest.parent / entry["output"]
+            else:
+                output = args.manifest.parent / entry["output"]
+                output = output.with_stem(f"{output.stem}_{SUFFIXES[method]}")
+
+            tasks.append(Task(source, output, job))
+
+    return (tasks, invalid)
+
+
+@dataclass(slots=True)
+class Progress:
+    """Print one progress line per job."""
+
+    total: int
+    count: int = 0
+
+    def __call__(
+        self, status: str, output: Path, elapsed: float | None, info: str = ""
+    ) -> None:
+        self.count += 1
+        width = len(str(self.total))
+        time = f"{elapsed:8.2f}s" if elapsed is not None else " " * 9
+        line = (
+            f"[{self.count:>{width}}/{self.total}] {status:<4} {time} {output} {info}"
+        )
+        print(line.rstrip(), flush=True)
+        return None
+
+
+def _report(
+    total: int, skipped: int, times: list[float], failures: int, wall: float
+) -> None:
+    """Print the aggregate timing report."""
+    cumulated = sum(times)
+    lines = [
+        f"jobs: {total}, meshed: {len(times)}, skipped: {skipped}, failed: {failures}",
+        f"wall time: {wall:.2f}s, cumulated job time: {cumulated:.2f}s",
+    ]
+    if times:
+        lines.append(
+            f"job time mean: {cumulated / len(times):.2f}s, max: {max(times):.2f}s,"
+            f" parallel speedup: {cumulated / wall:.2f}"
+        )
+    print("\n".join(lines), file=sys.stderr)
+    return None
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@
 __all__: list[str] = [
     "Corner",
     "Polygon",
+    "Similarity",
     "smallest_circle",
     "smallest_rectangle",
     "ExteriorBoundary",
@@ -11,6 +12,12 @@ __all__: list[str] = [
     "RectangularBoundary",
     "rectangular_boundary",
     "Geometry",
+    "geometry_to_dict",
+    "geometry_from_dict",
+    "save_geometry",
+    "load_geometry",
+    "Symmetry",
+    "find_symmetry",
 ]
 
 from .boundary import (
@@ -22,4 +29,12 @@ from .boundary import (
 )
 from .geometry import Geometry
 from .polygon import Corner, Polygon
+from .serialize import (
+    geometry_from_dict,
+    geometry_to_dict,
+    load_geometry,
+    save_geometry,
+)
+from .similarity import Similarity
 from .smallest_boundary import smallest_circle, smallest_rectangle
+from .symmetry import Symmetry, find_symmetry
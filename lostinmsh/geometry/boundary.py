@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 from typing import Self
 
-from numpy import amax, amin, asarray, inf, vstack
+from numpy import amax, amin, asarray, inf, isclose, vstack
 from numpy.linalg import norm
 from numpy.typing import ArrayLike
 
 from ..type_alias import MatNx2, Vec2
 from .polygon import Polygon
+from .similarity import Similarity
 from .smallest_boundary import smallest_circle, smallest_rectangle
 
 
@@ -41,6 +42,15 @@ class ExteriorBoundary:
         """
         raise NotImplementedError()
 
+    def transformed(self, similarity: Similarity) -> Self:
+        """Image of the boundary by a similarity.
+
+        Parameters
+        ----------
+        similarity : Similarity
+        """
+        raise NotImplementedError()
+
 
 @dataclass(init=False, slots=True)
 class CircularBoundary(ExteriorBoundary):
@@ -81,6 +91,19 @@ class CircularBoundary(ExteriorBoundary):
     def dist_to_inner_boundary(self, points: MatNx2) -> float:
         return self.radius - norm(points - self.center, axis=1).max()
 
+    def transformed(self, similarity: Similarity) -> Self:
+        return type(self)(
+            center=similarity.apply(self.center),
+            radius=similarity.scale * self.radius,
+            background_name=self.background_name,
+            thickness=(
+                similarity.scale * self.thickness
+                if self.thickness is not None
+                else None
+            ),
+            thickness_name=self.thickness_name,
+        )
+
 
 def circular_boundary(
     polygons: list[Polygon],
@@ -162,6 +185,31 @@ class RectangularBoundary(ExteriorBoundary):
         _min = amin(points, axis=0)
         return min(amin(_min - self.corner_low), amin(self.corner_high - _max))
 
+    def transformed(self, similarity: Similarity) -> Self:
+        """Image of the rectangle by a similarity.
+
+        Raises
+        ------
+        ValueError
+            If the angle is not a multiple of π/2.
+        """
+        matrix = similarity.matrix()
+        if not isclose(matrix[0, 0] * matrix[0, 1], 0, atol=1e-12):
+            raise ValueError("A rectangle can only be rotated by multiples of π/2.")
+
+        corners = similarity.apply(vstack((self.corner_low, self.corner_high)))
+        return type(self)(
+            corner_low=amin(corners, axis=0),
+            corner_high=amax(corners, axis=0),
+            background_name=self.background_name,
+            thickness=(
+                similarity.scale * self.thickness
+                if self.thickness is not None
+                else None
+            ),
+            thickness_name=self.thickness_name,
+        )
+
 
 def rectangular_boundary(
     polygons: list[Polygon],
@@ -7,6 +7,7 @@ from numpy import inf
 
 from .boundary import ExteriorBoundary
 from .polygon import Polygon
+from .similarity import Similarity
 
 
 @dataclass(kw_only=True, slots=True)
@@ -46,6 +47,29 @@ class Geometry:
         """
         return cls(polygons=list(polygons), boundary=boundary)
 
+    def transformed(self: Self, similarity: Similarity) -> Geometry:
+        """Image of the geometry by a similarity.
+
+        Parameters
+        ----------
+        similarity : Similarity
+
+        Returns
+        -------
+        Geometry
+            The polygons keep their corners, see `Polygon.transformed`.
+
+        Raises
+        ------
+        ValueError
+            If the boundary is a rectangle and the angle is not a multiple of
+            π/2.
+        """
+        return Geometry(
+            polygons=[polygon.transformed(similarity) for polygon in self.polygons],
+            boundary=self.boundary.transformed(similarity),
+        )
+
     def critical_interval(self: Self) -> tuple[float, float]:
         """Compute the critical interval of polygons.
 
@@ -0,0 +1,60 @@
+"""Merge of the coincident points, and closed polylines."""
+
+from numpy import arange, asarray, minimum, roll, unique
+from numpy.linalg import norm
+from scipy.spatial import KDTree
+
+from ..circular_iterable import circular_pairwise
+from ..type_alias import IntArray, MatNx2, Vec2
+
+# Relative tolerance on the coordinates of the coincident points.
+RTOL = 1e-9
+
+
+def merge_points(
+    points: MatNx2, tol: float | None = None, candidates: IntArray | None = None
+) -> tuple[MatNx2, IntArray]:
+    """Merge the points at distance less than `tol` in the first of them.
+
+    Parameters
+    ----------
+    points : MatNx2
+    tol : float | None, optional, default None
+        If None, `RTOL` times the diameter of the points.
+    candidates : IntArray | None, optional, default None
+        Indices of the points that may be merged, if None all the points.
+
+    Returns
+    -------
+    tuple[MatNx2, IntArray]
+        The distinct points, the first of each group, and the index of each
+        point in them.
+    """
+    points = asarray(points, dtype=float)
+    if tol is None:
+        tol = RTOL * float(norm(points.max(axis=0) - points.min(axis=0)))
+    if candidates is None:
+        candidates = arange(points.shape[0])
+
+    pairs = KDTree(points[candidates]).query_pairs(tol, output_type="ndarray")
+    first = arange(points.shape[0])
+    minimum.at(first, candidates[pairs[:, 1]], candidates[pairs[:, 0]])
+    used, inverse = unique(first, return_inverse=True)
+
+    return (points[used], inverse.reshape(-1))
+
+
+def signed_area(outline: MatNx2) -> float:
+    """Signed area of a closed polyline, positive if counterclockwise."""
+    x, y = outline[:, 0], outline[:, 1]
+    return float((x * roll(y, -1) - roll(x, -1) * y).sum()) / 2
+
+
+def contains(outline: MatNx2, point: tuple[float, float] | Vec2) -> bool:
+    """Whether a point is inside a closed polyline, by the even-odd rule."""
+    inside = False
+    for (ax, ay), (bx, by) in circular_pairwise(outline):
+        if (ay > point[1]) != (by > point[1]):
+            x = ax + (point[1] - ay) * (bx - ax) / (by - ay)
+            inside ^= bool(point[0] < x)
+    return inside
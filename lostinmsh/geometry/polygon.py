@@ -3,12 +3,29 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Self
 
-from numpy import abs, arange, arctan2, asarray, greater, inf, lexsort, log, pi
+from numpy import (
+    abs,
+    arange,
+    arctan2,
+    array,
+    asarray,
+    cos,
+    einsum,
+    greater,
+    inf,
+    lexsort,
+    log,
+    pi,
+    roll,
+    sin,
+    stack,
+)
 from numpy.linalg import norm
 from numpy.typing import ArrayLike
 
 from ..circular_iterable import circular_triplewise
 from ..type_alias import Mat2x2, MatNx2, Vec2, VecN
+from .similarity import Similarity
 
 
 @dataclass(frozen=True, slots=True)
@@ -88,6 +105,57 @@ class Polygon:
             lengths=_compute_lengths(pts),
         )
 
+    def transformed(
+        self: Self, similarity: Similarity, *, name: str | None = None
+    ) -> Self:
+        """Image of the polygon by a similarity.
+
+        The angles and (p, q) of the corners are kept, their axes are rotated
+        and the lengths are scaled, without the validation of `from_vertices`.
+
+        Parameters
+        ----------
+        similarity : Similarity
+        name : str | None, optional, default None
+            Name of the image, the same name if None.
+
+        Returns
+        -------
+        Polygon
+        """
+        matrix = similarity.matrix()
+        vertices = similarity.apply(self.vertices)
+        axes = matrix @ stack([corner.axis for corner in self.corners])
+        lengths = similarity.scale * self.lengths
+        if name is None:
+            name = self.name
+
+        if not similarity.reflection:
+            corners = [
+                Corner(corner.angle, axis, corner.p, corner.q)
+                for corner, axis in zip(self.corners, axes)
+            ]
+            return type(self)(
+                name=name, vertices=vertices, corners=corners, lengths=lengths
+            )
+
+        # The reflection reverses the orientation, the second side of a corner
+        # becomes its first side.
+        angles = array([corner.angle for corner in self.corners])
+        seconds = einsum("nij,nj->ni", axes, stack((cos(angles), sin(angles)), axis=1))
+        corners = [
+            Corner(
+                corner.angle, asarray([[v[0], -v[1]], [v[1], v[0]]]), corner.p, corner.q
+            )
+            for corner, v in zip(self.corners, seconds)
+        ]
+        return type(self)(
+            name=name,
+            vertices=vertices[::-1, :],
+            corners=corners[::-1],
+            lengths=roll(lengths[::-1], -1),
+        )
+
     def critical_interval(self: Self) -> tuple[float, float]:
         """Compute the critical interval of the polygon.
 
@@ -205,7 +273,8 @@ def _compute_pq(angle: float, max_subdiv: int) -> tuple[int, int]:
     """Compute p and q for a given angle."""
     r = (2 * pi - angle) / angle
 
-    p_min, q_min = 0, 0
+    # p = q = 1 is the best choice for angles close to π.
+    p_min, q_min = 1, 1
     _min = abs(log(r))
     for n in range(4, max_subdiv + 1):
         p, q = arange(1, n - 1), arange(n - 1, 1, -1)
@@ -0,0 +1,199 @@
+"""Serialization of geometries to JSON compatible dictionaries."""
+
+import json
+from dataclasses import replace
+from pathlib import PurePath
+from typing import Any
+
+from .boundary import CircularBoundary, ExteriorBoundary, RectangularBoundary
+from .geometry import Geometry
+from .polygon import Polygon
+
+
+def polygon_to_dict(polygon: Polygon) -> dict[str, Any]:
+    """Convert a polygon to a JSON compatible dictionary.
+
+    Parameters
+    ----------
+    polygon : Polygon
+
+    Returns
+    -------
+    dict[str, Any]
+    """
+    return {
+        "name": polygon.name,
+        "vertices": polygon.vertices.tolist(),
+        "pq": [[int(corner.p), int(corner.q)] for corner in polygon.corners],
+    }
+
+
+def polygon_from_dict(data: dict[str, Any]) -> Polygon:
+    """Create a polygon from a dictionary created by `polygon_to_dict`.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+
+    Returns
+    -------
+    Polygon
+    """
+    polygon = Polygon.from_vertices(data["vertices"], data["name"])
+
+    if "pq" in data:
+        if len(data["pq"]) != len(polygon.corners):
+            raise ValueError("There must be one (p, q) pair per vertex.")
+
+        polygon.corners = [
+            replace(corner, p=int(p), q=int(q))
+            for corner, (p, q) in zip(polygon.corners, data["pq"])
+        ]
+
+    return polygon
+
+
+def boundary_to_dict(boundary: ExteriorBoundary) -> dict[str, Any]:
+    """Convert an exterior boundary to a JSON compatible dictionary.
+
+    Parameters
+    ----------
+    boundary : ExteriorBoundary
+
+    Returns
+    -------
+    dict[str, Any]
+
+    Raises
+    ------
+    ValueError
+    """
+    data: dict[str, Any] = {
+        "background_name": boundary.background_name,
+        "thickness": boundary.thickness,
+        "thickness_name": boundary.thickness_name,
+    }
+
+    if isinstance(boundary, CircularBoundary):
+        data.update(
+            {
+                "type": "circular",
+                "center": boundary.center.tolist(),
+                "radius": boundary.radius,
+            }
+        )
+        return data
+
+    if isinstance(boundary, RectangularBoundary):
+        data.update(
+            {
+                "type": "rectangular",
+                "corner_low": boundary.corner_low.tolist(),
+                "corner_high": boundary.corner_high.tolist(),
+            }
+        )
+        return data
+
+    raise ValueError("Unknown boundary shape.")
+
+
+def boundary_from_dict(data: dict[str, Any]) -> ExteriorBoundary:
+    """Create an exterior boundary from a dictionary created by
+    `boundary_to_dict`.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+
+    Returns
+    -------
+    ExteriorBoundary
+
+    Raises
+    ------
+    ValueError
+    """
+    options = {
+        "background_name": data["background_name"],
+        "thickness": data.get("thickness"),
+        "thickness_name": data.get("thickness_name", "thickness"),
+    }
+
+    match data["type"]:
+        case "circular":
+            return CircularBoundary(
+                center=data["center"], radius=data["radius"], **options
+            )
+
+        case "rectangular":
+            return RectangularBoundary(
+                corner_low=data["corner_low"],
+                corner_high=data["corner_high"],
+                **options,
+            )
+
+        case _:
+            raise ValueError("Unknown boundary shape.")
+
+
+def geometry_to_dict(geometry: Geometry) -> dict[str, Any]:
+    """Convert a geometry to a JSON compatible dictionary.
+
+    Parameters
+    ----------
+    geometry : Geometry
+
+    Returns
+    -------
+    dict[str, Any]
+    """
+    return {
+        "polygons": [polygon_to_dict(polygon) for polygon in geometry.polygons],
+        "boundary": boundary_to_dict(geometry.boundary),
+    }
+
+
+def geometry_from_dict(data: dict[str, Any]) -> Geometry:
+    """Create a geometry from a dictionary created by `geometry_to_dict`.
+
+    Parameters
+    ----------
+    data : dict[str, Any]
+
+    Returns
+    -------
+    Geometry
+    """
+    return Geometry.from_polygons(
+        (polygon_from_dict(polygon) for polygon in data["polygons"]),
+        boundary_from_dict(data["boundary"]),
+    )
+
+
+def save_geometry(geometry: Geometry, filename: PurePath | str) -> None:
+    """Save a geometry to a JSON file.
+
+    Parameters
+    ----------
+    geometry : Geometry
+    filename : PurePath | str
+    """
+    with open(filename, "w", encoding="utf-8") as file:
+        json.dump(geometry_to_dict(geometry), file, indent=2)
+
+    return None
+
+
+def load_geometry(filename: PurePath | str) -> Geometry:
+    """Load a geometry from a JSON file created by `save_geometry`.
+
+    Parameters
+    ----------
+    filename : PurePath | str
+
+    Returns
+    -------
+    Geometry
+    """
+    with open(filename, encoding="utf-8") as file:
+        return geometry_from_dict(json.load(file))
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Self
+
+from numpy import array, asarray, cos, sin
+
+from ..type_alias import Mat2x2, MatNx2
+
+
+@dataclass(frozen=True, slots=True)
+class Similarity:
+    """Similarity of the plane, x ↦ translation + scale R S x.
+
+    Attributes
+    ----------
+    scale : float, default 1.0
+        Scaling factor, must be > 0.
+    angle : float, default 0.0
+        Angle of the rotation R.
+    translation : tuple[float, float], default (0.0, 0.0)
+    reflection : bool, default False
+        If True, S is the reflection about the x axis, applied first.
+    """
+
+    scale: float = 1.0
+    angle: float = 0.0
+    translation: tuple[float, float] = (0.0, 0.0)
+    reflection: bool = False
+
+    def __post_init__(self: Self) -> None:
+        if self.scale <= 0:
+            raise ValueError("Scale must be > 0.")
+        return None
+
+    def matrix(self: Self) -> Mat2x2:
+        """Orthogonal part R S of the similarity."""
+        c, s = cos(self.angle), sin(self.angle)
+        if self.reflection:
+            return array([[c, s], [s, -c]])
+        return array([[c, -s], [s, c]])
+
+    def apply(self: Self, points: MatNx2) -> MatNx2:
+        """Image of points of shape (N, 2), or (2,)."""
+        return (
+            asarray(self.translation) + self.scale * asarray(points) @ self.matrix().T
+        )
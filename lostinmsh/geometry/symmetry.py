@@ -0,0 +1,188 @@
+"""Symmetries of a geometry."""
+
+from dataclasses import dataclass
+from typing import Self
+
+from numpy import (
+    arange,
+    arctan2,
+    argmax,
+    array,
+    concatenate,
+    cos,
+    diff,
+    flatnonzero,
+    pi,
+    repeat,
+    sin,
+    sort,
+    vstack,
+)
+from numpy.linalg import det, norm
+from scipy.spatial import KDTree
+
+from ..type_alias import Mat2x2, MatNx2, Vec2
+from .boundary import CircularBoundary, ExteriorBoundary, RectangularBoundary
+from .geometry import Geometry
+from .points import RTOL
+
+
+@dataclass(frozen=True, slots=True)
+class Symmetry:
+    """Group of symmetries of a geometry, cyclic or dihedral.
+
+    Attributes
+    ----------
+    center : Vec2
+        Fixed point of the symmetries, the center of the exterior boundary.
+    order : int
+        Order n of the group of rotations, by the multiples of 2π / n.
+    reflections : bool, default False
+        If True, the group also has the n reflections about the axes at angles
+        `angle` + kπ / n.
+    angle : float, default 0.0
+        Angle of the first side of the fundamental sector, a mirror axis if
+        there are reflections.
+    """
+
+    center: Vec2
+    order: int
+    reflections: bool = False
+    angle: float = 0.0
+
+    def size(self: Self) -> int:
+        """Number of symmetries, the identity included."""
+        return 2 * self.order if self.reflections else self.order
+
+    def opening(self: Self) -> float:
+        """Angle of the fundamental sector, 2π / n or π / n with reflections."""
+        return (pi if self.reflections else 2 * pi) / self.order
+
+    def transforms(self: Self) -> list[Mat2x2]:
+        """Linear parts of the symmetries about the center.
+
+        The rotations come first from the identity, then the reflections in
+        the same order composed with the reflection about the first side of
+        the fundamental sector.
+        """
+        rotations = [_rotation(2 * pi * k / self.order) for k in range(self.order)]
+        if not self.reflections:
+            return rotations
+
+        mirror = _reflection(self.angle)
+        return rotations + [rotation @ mirror for rotation in rotations]
+
+
+def find_symmetry(geometry: Geometry, rtol: float = RTOL) -> Symmetry:
+    """Largest group of symmetries of a geometry.
+
+    The symmetries fix the center of the exterior boundary, map the exterior
+    boundary onto itself and each polygon onto a polygon with the same name.
+
+    Parameters
+    ----------
+    geometry : Geometry
+    rtol : float, optional, default 1e-9
+        Tolerance on the vertices relative to the size of the polygons.
+
+    Returns
+    -------
+    Symmetry
+        The group of order 1 without reflections if there is no symmetry.
+    """
+    center = _center(geometry.boundary)
+    vertices = vstack([polygon.vertices for polygon in geometry.polygons]) - center
+    radii = norm(vertices, axis=1)
+    tol = rtol * float(radii.max())
+
+    # A symmetry maps the farthest vertex to a vertex on the same circle.
+    i = argmax(radii)
+    on_circle = vertices[flatnonzero(abs(radii - radii[i]) < tol)]
+    start = _angle(vertices[i])
+    phases = (arctan2(on_circle[:, 1], on_circle[:, 0]) - start) % (2 * pi)
+
+    order = 1
+    for phase in phases:
+        n = round(2 * pi / phase) if phase > pi / on_circle.shape[0] else 0
+        if n > order and _is_symmetry(geometry, center, _rotation(2 * pi / n), tol):
+            order = n
+
+    for phase in sort(phases):
+        axis = float(start + phase / 2) % (pi / order)
+        if _is_symmetry(geometry, center, _reflection(axis), tol):
+            return Symmetry(center, order, True, axis)
+
+    # Without reflections, the sides of the sector avoid the vertices.
+    opening = 2 * pi / order
+    far = vertices[radii > tol]
+    angles = sort(arctan2(far[:, 1], far[:, 0]) % opening)
+    gaps = diff(concatenate((angles, [angles[0] + opening])))
+    k = argmax(gaps)
+    return Symmetry(center, order, False, float(angles[k] + gaps[k] / 2) % opening)
+
+
+def _center(boundary: ExteriorBoundary) -> Vec2:
+    """Center of the exterior boundary."""
+    if isinstance(boundary, CircularBoundary):
+        return boundary.center
+    if isinstance(boundary, RectangularBoundary):
+        return (boundary.corner_low + boundary.corner_high) / 2
+    raise ValueError("Unknown boundary shape.")
+
+
+def _is_symmetry(geometry: Geometry, center: Vec2, matrix: Mat2x2, tol: float) -> bool:
+    """Whether the linear map about the center is a symmetry of the geometry."""
+    boundary = geometry.boundary
+    if isinstance(boundary, RectangularBoundary):
+        (xl, yl), (xh, yh) = boundary.corner_low, boundary.corner_high
+        corners = array([[xl, yl], [xh, yl], [xh, yh], [xl, yh]])
+        distances, _ = KDTree(corners).query(_apply(corners, center, matrix))
+        if (distances > tol).any():
+            return False
+
+    polygons = geometry.polygons
+    tree = KDTree(vstack([polygon.vertices for polygon in polygons]))
+    sizes = [len(polygon.vertices) for polygon in polygons]
+    owners = repeat(arange(len(polygons)), sizes)
+    local = concatenate([arange(size) for size in sizes])
+
+    # The orientation of the vertices is kept by the rotations only.
+    step = 1 if det(matrix) > 0 else -1
+    for polygon in polygons:
+        distances, index = tree.query(_apply(polygon.vertices, center, matrix))
+        if (distances > tol).any():
+            return False
+
+        image = polygons[owners[index[0]]]
+        m = len(polygon.vertices)
+        if (
+            (owners[index] != owners[index[0]]).any()
+            or image.name != polygon.name
+            or len(image.vertices) != m
+            or ((diff(local[index]) - step) % m != 0).any()
+        ):
+            return False
+
+    return True
+
+
+def _apply(points: MatNx2, center: Vec2, matrix: Mat2x2) -> MatNx2:
+    """Image of the points by the linear map about the center."""
+    return center + (points - center) @ matrix.T
+
+
+def _angle(vector: Vec2) -> float:
+    """Polar angle of a vector."""
+    return float(arctan2(vector[1], vector[0]))
+
+
+def _rotation(angle: float) -> Mat2x2:
+    """Rotation by the angle."""
+    c, s = cos(angle), sin(angle)
+    return array([[c, -s], [s, c]])
+
+
+def _reflection(angle: float) -> Mat2x2:
+    """Reflection about the axis at the angle."""
+    c, s = cos(2 * angle), sin(2 * angle)
+    return array([[c, s], [s, -c]])
@@ -0,0 +1,150 @@
+"""Self-contained meshing jobs shared by the mesh server and the command line."""
+
+import json
+import os
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path, PurePath
+from time import perf_counter
+from typing import Any, Callable, Final, Self
+
+from .geometry import Geometry, geometry_from_dict, geometry_to_dict
+from .mesh import GmshOptions, mesh_locally_structured, mesh_unstructured
+
+METHODS: Final[dict[str, Callable[..., PurePath | None]]] = {
+    "unstructured": mesh_unstructured,
+    "locally_structured": mesh_locally_structured,
+}
+
+JOB_OPTIONS: Final = ("element_order", "additional_options", "renumber_nodes")
+
+
+@dataclass(frozen=True, slots=True)
+class MeshJob:
+    """Meshing job.
+
+    Attributes
+    ----------
+    geometry : dict[str, Any]
+        Serialized geometry, see `geometry_to_dict`.
+    mesh_size : float
+    method : str, default "locally_structured"
+        Either "unstructured" or "locally_structured".
+    options : dict[str, Any]
+        Keyword arguments of `GmshOptions` among `JOB_OPTIONS`.
+    """
+
+    geometry: dict[str, Any]
+    mesh_size: float
+    method: str = "locally_structured"
+    options: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self: Self) -> None:
+        if self.method not in METHODS:
+            raise ValueError(f"Unknown meshing method {self.method!r}.")
+
+        if not self.mesh_size > 0:
+            raise ValueError("Mesh size must be positive.")
+
+        unknown = set(self.options) - set(JOB_OPTIONS)
+        if unknown:
+            raise ValueError(f"Unsupported job options: {sorted(unknown)}.")
+
+    @classmethod
+    def from_geometry(
+        cls,
+        geometry: Geometry,
+        mesh_size: float,
+        method: str = "locally_structured",
+        **options: Any,
+    ) -> Self:
+        """Create a job from a geometry.
+
+        Parameters
+        ----------
+        geometry : Geometry
+        mesh_size : float
+        method : str, optional, default "locally_structured"
+        **options : Any
+            Keyword arguments of `GmshOptions` among `JOB_OPTIONS`.
+        """
+        return cls(geometry_to_dict(geometry), float(mesh_size), method, options)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Create a job from a dictionary created by `to_dict`.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+        """
+        return cls(
+            data["geometry"],
+            float(data["mesh_size"]),
+            data.get("method", "locally_structured"),
+            dict(data.get("options", {})),
+        )
+
+    def to_dict(self: Self) -> dict[str, Any]:
+        """Convert the job to a JSON compatible dictionary."""
+        return {
+            "geometry": self.geometry,
+            "mesh_size": self.mesh_size,
+            "method": self.method,
+            "options": self.options,
+        }
+
+    def key(self: Self) -> str:
+        """Return a hash identifying the job, identical jobs share the same
+        key."""
+        text = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+        return sha256(text.encode()).hexdigest()
+
+    def run(self: Self, filename: PurePath | str) -> float:
+        """Mesh the geometry and save it.
+
+        Parameters
+        ----------
+        filename : PurePath | str
+            Path to the output mesh file.
+
+        Returns
+        -------
+        float
+            Wall time in seconds.
+        """
+        start = perf_counter()
+        METHODS[self.method](
+            geometry_from_dict(self.geometry),
+            self.mesh_size,
+            GmshOptions(filename=filename, **self.options),
+        )
+        return perf_counter() - start
+
+
+def run_job(job: MeshJob, filename: PurePath | str) -> float:
+    """Run a job so that the mesh file appears atomically.
+
+    The mesh is first written to a temporary file next to `filename` which is
+    then renamed, so concurrent readers never see a partial file.
+
+    Parameters
+    ----------
+    job : MeshJob
+    filename : PurePath | str
+        Path to the output mesh file.
+
+    Returns
+    -------
+    float
+        Wall time in seconds.
+    """
+    path = Path(filename)
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp{path.suffix}")
+    try:
+        elapsed = job.run(tmp)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    return elapsed
@@ -2,11 +2,40 @@
 
 __all__: list[str] = [
     "GmshOptions",
+    "ExteriorOptions",
+    "CornerOptions",
+    "corner_template_info",
     "open_msh_file",
+    "Profiler",
+    "MeshProfile",
+    "GmshEvent",
+    "log_event",
+    "MeshEstimate",
+    "estimate_mesh",
     "mesh_unstructured",
     "mesh_locally_structured",
+    "MeshData",
+    "remesh_adaptive",
+    "sizes_from_indicator",
+    "mesh_hierarchy",
+    "refine_uniformly",
+    "elevate_order",
+    "mesh_tiling",
+    "tile_mesh",
+    "mesh_symmetric",
 ]
 
+from .adapt import remesh_adaptive, sizes_from_indicator
 from .context_manager import GmshOptions, open_msh_file
-from .mesh_lost import mesh_locally_structured
+from .corner_patch import corner_template_info
+from .elevate import elevate_order
+from .estimate import MeshEstimate, estimate_mesh
+from .gmsh_events import GmshEvent, log_event
+from .mesh_boundary import ExteriorOptions
+from .mesh_data import MeshData
+from .mesh_lost import CornerOptions, mesh_locally_structured
 from .mesh_unst import mesh_unstructured
+from .profiling import MeshProfile, Profiler
+from .refine import mesh_hierarchy, refine_uniformly
+from .symmetric import mesh_symmetric
+from .tiling import mesh_tiling, tile_mesh
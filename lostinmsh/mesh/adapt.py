@@ -0,0 +1,200 @@
+"""Adaptive remeshing from the mesh sizes or an error indicator."""
+
+from pathlib import PurePath
+from typing import Final
+
+from numpy import (
+    asarray,
+    clip,
+    full,
+    inf,
+    maximum,
+    minimum,
+    ones_like,
+    roll,
+    sqrt,
+    zeros,
+)
+from numpy.typing import ArrayLike
+
+from ..geometry import Geometry
+from ..type_alias import MatNx2, VecN
+from .context_manager import GmshContextManager, GmshOptions
+from .lost_parameters import corner_radii
+from .mesh_boundary import ExteriorOptions
+from .mesh_data import MeshData
+from .mesh_lost import CornerOptions, _build_lost
+from .mesh_size import MeshSize, MeshSizes
+from .mesh_unst import _build_unst
+from .size_field import SizeMap
+
+# Smallest ratio between the new and the previous mesh size of a triangle.
+MIN_RATIO: Final = 0.25
+
+
+def remesh_adaptive(
+    geometry: Geometry,
+    previous: MeshData | PurePath | str,
+    mesh_size: MeshSize,
+    gmsh_options: GmshOptions = GmshOptions(),
+    *,
+    target_sizes: ArrayLike | None = None,
+    indicator: ArrayLike | None = None,
+    method: str = "locally_structured",
+    exterior_options: ExteriorOptions = ExteriorOptions(),
+    corner_options: CornerOptions = CornerOptions(),
+) -> PurePath | None:
+    """Remesh a geometry with the mesh sizes required on a previous mesh.
+
+    The mesh is only refined: the new size on a triangle of the previous mesh
+    is at most its size. The sizes are interpolated by a background field on the
+    unstructured regions. For the locally structured mesh, the mesh size of a
+    polygon, hence its corner radius, corner mesh size and edge subdivision, is
+    scaled by the smallest ratio between the new and the previous sizes of the
+    triangles at distance at most the corner radius of its boundary, which
+    keeps the T-conform corners.
+
+    Parameters
+    ----------
+    geometry : Geometry
+    previous : MeshData | PurePath | str
+        Previous mesh of the geometry, or its mesh file.
+    mesh_size : float | Mapping[str, float]
+        Mesh size of the previous mesh, see `mesh_locally_structured`.
+    gmsh_options : GmshOptions, optional
+    target_sizes : ArrayLike | None, optional, default None
+        New mesh size on each triangle of `previous`, in the order of
+        `MeshData.element_tags`.
+    indicator : ArrayLike | None, optional, default None
+        Error indicator on each triangle of `previous`, see
+        `sizes_from_indicator`.
+    method : str, optional, default "locally_structured"
+        Either "unstructured" or "locally_structured".
+    exterior_options : ExteriorOptions, optional
+    corner_options : CornerOptions, optional
+        Only used by the locally structured mesh.
+
+    Returns
+    -------
+    PurePath | None
+        Filename of the output mesh file or None if not saved.
+
+    Raises
+    ------
+    ValueError
+        If not exactly one of `target_sizes` and `indicator` is given, if it
+        does not have one positive value per triangle, or if the method is
+        unknown.
+    """
+    if method not in ("unstructured", "locally_structured"):
+        raise ValueError(f"Unknown meshing method {method!r}.")
+    if (target_sizes is None) == (indicator is None):
+        raise ValueError("Give either target sizes or an indicator.")
+
+    mesh = previous if isinstance(previous, MeshData) else MeshData.from_msh(previous)
+    sizes = mesh.sizes()
+
+    if target_sizes is None:
+        assert indicator is not None
+        targets = sizes_from_indicator(
+            mesh, indicator, gmsh_options.key_val["Mesh.ElementOrder"]
+        )
+    else:
+        targets = _validate_values(mesh, target_sizes)
+    targets = clip(targets, MIN_RATIO * sizes, sizes)
+
+    mesh_sizes = MeshSizes.from_mesh_size(geometry, mesh_size)
+    region_sizes = {geometry.boundary.background_name: mesh_sizes.default}
+    region_sizes.update(mesh_sizes.sizes)
+
+    if method == "unstructured":
+        with GmshContextManager(gmsh_options) as ctx:
+            _build_unst(
+                ctx,
+                geometry,
+                region_sizes,
+                exterior_options,
+                size_map=SizeMap(mesh, targets),
+            )
+        return gmsh_options.filename
+
+    # The bands of the structured meshes are scaled, the field is set outside.
+    centroids = mesh.centroids()
+    in_bands = zeros(centroids.shape[0], dtype=bool)
+    polygon_sizes = [mesh_sizes[polygon.name] for polygon in geometry.polygons]
+    for polygon, h, radius in zip(
+        geometry.polygons, polygon_sizes, corner_radii(geometry, polygon_sizes)
+    ):
+        band = _distance_to_boundary(centroids, polygon.vertices) <= radius
+        if band.any():
+            region_sizes[polygon.name] = h * float((targets / sizes)[band].min())
+        in_bands |= band
+
+    with GmshContextManager(gmsh_options) as ctx:
+        _build_lost(
+            ctx,
+            geometry,
+            region_sizes,
+            exterior_options,
+            corner_options=corner_options,
+            size_map=SizeMap(mesh.select(~in_bands), targets[~in_bands]),
+        )
+
+    return gmsh_options.filename
+
+
+def sizes_from_indicator(
+    mesh: MeshData, indicator: ArrayLike, element_order: int = 1
+) -> VecN:
+    """Mesh sizes equidistributing an error indicator.
+
+    The indicator of a triangle of size h is assumed to scale as
+    ``h^(element_order + 1)``, the new size is the one giving the mean of the
+    indicator, bounded by `MIN_RATIO` times h and h.
+
+    Parameters
+    ----------
+    mesh : MeshData
+    indicator : ArrayLike
+        Nonnegative error indicator on each triangle.
+    element_order : int, optional, default 1
+
+    Returns
+    -------
+    VecN
+
+    Raises
+    ------
+    ValueError
+        If the indicator does not have one nonnegative value per triangle.
+    """
+    values = asarray(indicator, dtype=float)
+    if values.shape != (mesh.triangles.shape[0],) or (values < 0).any():
+        raise ValueError("The indicator needs a nonnegative value per triangle.")
+
+    # Only the triangles above the mean are refined.
+    ratios = ones_like(values)
+    refined = values > values.mean()
+    ratios[refined] = (values.mean() / values[refined]) ** (1 / (element_order + 1))
+
+    return maximum(ratios, MIN_RATIO) * mesh.sizes()
+
+
+def _validate_values(mesh: MeshData, values: ArrayLike) -> VecN:
+    """Positive values on the triangles."""
+    array = asarray(values, dtype=float)
+    if array.shape != (mesh.triangles.shape[0],) or (array <= 0).any():
+        raise ValueError("The target sizes need a positive value per triangle.")
+    return array
+
+
+def _distance_to_boundary(points: MatNx2, vertices: MatNx2) -> VecN:
+    """Distance of the points to the boundary of a polygon."""
+    distances = full(points.shape[0], inf)
+    for a, b in zip(vertices, roll(vertices, -1, axis=0)):
+        u = b - a
+        t = clip((points - a) @ u / (u @ u), 0, 1)
+        distances = minimum(
+            distances, sqrt(((points - a - t[:, None] * u) ** 2).sum(axis=1))
+        )
+    return distances
@@ -0,0 +1,183 @@
+"""Choice of the 2D meshing algorithm of the exterior surfaces."""
+
+import json
+import logging
+import warnings
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any, Final, Self
+
+import gmsh
+
+from ..geometry import Geometry
+from ..type_alias import DimName, Tag
+from .estimate import boundary_areas, polygon_area
+
+LOGGER: Final = logging.getLogger("lostinmsh.mesh")
+
+GEO: Final = gmsh.model.geo
+
+# Table of the algorithms. The shipped one is seeded from the gmsh documentation
+# and not measured, regenerate it on the target machine with
+# ``python -m benchmarks.algorithm_table``.
+ALGORITHM_TABLE: Final = Path(__file__).with_name("algorithm_table.json")
+
+
+@dataclass(frozen=True, slots=True)
+class SurfaceStatistics:
+    """Cheap statistics of a surface to mesh.
+
+    Attributes
+    ----------
+    nb_loops : int
+        Number of inner loops (holes).
+    size_ratio : float
+        Ratio between the mesh size of the surface and the smallest mesh size
+        on its inner loops.
+    relative_area : float
+        Area of the surface divided by the square of its mesh size.
+    """
+
+    nb_loops: int
+    size_ratio: float
+    relative_area: float
+
+    def __str__(self: Self) -> str:
+        return (
+            f"{self.nb_loops} inner loops, size ratio {self.size_ratio:.3g}, "
+            f"relative area {self.relative_area:.3g}"
+        )
+
+
+@cache
+def load_algorithm_table(filename: Path = ALGORITHM_TABLE) -> dict[str, Any]:
+    """Load a table of the meshing algorithms.
+
+    Parameters
+    ----------
+    filename : Path, optional, default `ALGORITHM_TABLE`
+
+    Returns
+    -------
+    dict[str, Any]
+    """
+    with open(filename, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def is_measured(table: dict[str, Any]) -> bool:
+    """Check if the algorithms of a table were chosen by measuring their
+    throughput, see ``python -m benchmarks.algorithm_table``."""
+    return all("throughput" in cell for cell in table["cells"])
+
+
+def choose_algorithm(
+    statistics: SurfaceStatistics, table: dict[str, Any] | None = None
+) -> int:
+    """Choose the 2D meshing algorithm from the table.
+
+    Parameters
+    ----------
+    statistics : SurfaceStatistics
+    table : dict[str, Any] | None, optional, default None
+        If None, use the table shipped with lostinmsh.
+
+    Returns
+    -------
+    int
+        Value of the gmsh option ``Mesh.Algorithm``.
+    """
+    if table is None:
+        table = load_algorithm_table()
+
+    for cell in table["cells"]:
+        if all(
+            _in_bin(getattr(statistics, key), cell[key])
+            for key in ("nb_loops", "size_ratio", "relative_area")
+        ):
+            return int(cell["algorithm"])
+
+    raise ValueError(f"No cell of the algorithm table matches {statistics}.")
+
+
+def set_exterior_algorithms(
+    geometry: Geometry,
+    mesh_size: float,
+    inner_mesh_size: float,
+    domain_tags: dict[DimName, list[Tag]],
+) -> dict[Tag, int]:
+    """Set the meshing algorithm of the surfaces created by `mesh_exterior`.
+
+    Parameters
+    ----------
+    geometry : Geometry
+    mesh_size : float
+        Mesh size of the exterior.
+    inner_mesh_size : float
+        Smallest mesh size on the polygon loops.
+    domain_tags : dict[DimName, list[Tag]]
+        Tags returned by `mesh_exterior`.
+
+    Returns
+    -------
+    dict[Tag, int]
+        Algorithm of each surface.
+
+    Warns
+    -----
+    UserWarning
+        If the table shipped with lostinmsh is not measured.
+    """
+    if not is_measured(load_algorithm_table()):
+        warnings.warn(
+            "The algorithm table is not measured, the algorithms follow the "
+            "gmsh documentation. Regenerate it with "
+            "python -m benchmarks.algorithm_table.",
+            stacklevel=2,
+        )
+
+    boundary = geometry.boundary
+    area_background, area_thickness = boundary_areas(boundary)
+    area_background -= sum(map(polygon_area, geometry.polygons))
+
+    surfaces = [
+        (
+            boundary.background_name,
+            SurfaceStatistics(
+                len(geometry.polygons),
+                mesh_size / inner_mesh_size,
+                area_background / mesh_size**2,
+            ),
+        )
+    ]
+    if boundary.thickness is not None:
+        surfaces.append(
+            (
+                boundary.thickness_name,
+                SurfaceStatistics(1, 1.0, area_thickness / mesh_size**2),
+            )
+        )
+
+    algorithms: dict[Tag, int] = {}
+    for name, statistics in surfaces:
+        algorithm = choose_algorithm(statistics)
+        for tag in domain_tags.get((2, name), []):
+            GEO.mesh.set_algorithm(2, tag, algorithm)
+            algorithms[tag] = algorithm
+
+        LOGGER.info(
+            "%s: %s -> Mesh.Algorithm %d (%s)",
+            name,
+            statistics,
+            algorithm,
+            load_algorithm_table()["algorithms"].get(str(algorithm), "?"),
+        )
+
+    return algorithms
+
+
+def _in_bin(value: float, bounds: list[float | None]) -> bool:
+    """Check if lower <= value < upper, None is infinite."""
+    lower, upper = bounds
+    return (lower is None or lower <= value) and (upper is None or value < upper)
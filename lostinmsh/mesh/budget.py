@@ -0,0 +1,303 @@
+"""Choose the mesh size from a budget of elements or degrees of freedom."""
+
+import warnings
+from collections.abc import Callable
+from copy import copy
+from dataclasses import dataclass
+from typing import Final, Self
+
+import gmsh
+from numpy import log, sqrt
+
+from ..geometry import Geometry
+from .context_manager import GmshContextManager, GmshOptions
+from .corner_patch import CornerOptions
+from .estimate import MeshEstimate, estimate_mesh
+
+# Maximum number of meshes at the chosen size before giving up.
+MAX_TRIALS: Final = 4
+
+# Mesh sizes are searched in [mesh_size / SEARCH_RANGE, mesh_size * SEARCH_RANGE].
+SEARCH_RANGE: Final = 1e4
+
+Builder = Callable[[GmshContextManager, Geometry, float], None]
+
+
+@dataclass(frozen=True, slots=True)
+class MeshBudget:
+    """Budget of a mesh.
+
+    Attributes
+    ----------
+    target_elements : int | None, default None
+        Maximum number of 2D elements.
+    target_dofs : int | None, default None
+        Maximum number of nodes of the mesh of order `element_order`, that is
+        the number of degrees of freedom of Lagrange finite elements.
+    element_order : int, default 1
+    """
+
+    target_elements: int | None = None
+    target_dofs: int | None = None
+    element_order: int = 1
+
+    def __post_init__(self: Self) -> None:
+        if self.target_elements is None and self.target_dofs is None:
+            raise ValueError("Give a target number of elements or of dofs.")
+
+        for target in (self.target_elements, self.target_dofs):
+            if target is not None and target < 1:
+                raise ValueError("Targets must be positive.")
+
+    def usage(self: Self, nb_dofs: float, nb_elements: float) -> float:
+        """Fraction of the budget used, the mesh fits if it is at most 1.
+
+        Parameters
+        ----------
+        nb_dofs : float
+        nb_elements : float
+
+        Returns
+        -------
+        float
+        """
+        usage = 0.0
+        if self.target_elements is not None:
+            usage = max(usage, nb_elements / self.target_elements)
+        if self.target_dofs is not None:
+            usage = max(usage, nb_dofs / self.target_dofs)
+        return usage
+
+
+@dataclass(slots=True)
+class SizeSearch:
+    """Search of the smallest mesh size within a budget.
+
+    The number of dofs and of elements are predicted by `estimate_mesh`
+    multiplied by calibration factors measured on actual meshes, the mesh size
+    is then found by bisection on the predictions.
+
+    Attributes
+    ----------
+    geometry : Geometry
+    method : str
+        Either "unstructured" or "locally_structured".
+    budget : MeshBudget
+    calibration : tuple[float, float], default (1.0, 1.0)
+        Ratios between the actual and the estimated number of dofs and elements.
+    graded_edges : bool, default False
+        As in `estimate_mesh`.
+    corner_options : CornerOptions, optional
+        As in `estimate_mesh`.
+    """
+
+    geometry: Geometry
+    method: str
+    budget: MeshBudget
+    calibration: tuple[float, float] = (1.0, 1.0)
+    graded_edges: bool = False
+    corner_options: CornerOptions = CornerOptions()
+
+    def estimate(self: Self, mesh_size: float) -> MeshEstimate:
+        """Estimate of the mesh, without the warnings."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return estimate_mesh(
+                self.geometry,
+                mesh_size,
+                self.method,
+                graded_edges=self.graded_edges,
+                corner_options=self.corner_options,
+            )
+
+    def calibrate(self: Self, mesh_size: float, nb_dofs: int, nb_elements: int) -> None:
+        """Calibrate the predictions on an actual mesh.
+
+        Parameters
+        ----------
+        mesh_size : float
+        nb_dofs : int
+        nb_elements : int
+        """
+        estimate = self.estimate(mesh_size)
+        self.calibration = (
+            nb_dofs / max(1, estimate.nb_dofs(self.budget.element_order)),
+            nb_elements / max(1, estimate.nb_triangles),
+        )
+        return None
+
+    def usage(self: Self, mesh_size: float) -> float:
+        """Predicted fraction of the budget used with `mesh_size`."""
+        estimate = self.estimate(mesh_size)
+        c_dofs, c_elements = self.calibration
+        return self.budget.usage(
+            c_dofs * estimate.nb_dofs(self.budget.element_order),
+            c_elements * estimate.nb_triangles,
+        )
+
+    def next_size(self: Self, mesh_size: float, tol: float = 1e-3) -> float:
+        """Smallest mesh size whose prediction fits in the budget.
+
+        Parameters
+        ----------
+        mesh_size : float
+            Initial guess.
+        tol : float, optional, default 1e-3
+            Relative tolerance on the mesh size.
+
+        Returns
+        -------
+        float
+        """
+        # The number of elements scales like 1 / mesh_size², bracket the
+        # solution around the guess given by this scaling.
+        guess = mesh_size * sqrt(self.usage(mesh_size))
+        small, large = guess, guess
+        while self.usage(small) <= 1 and small > mesh_size / SEARCH_RANGE:
+            small /= 2
+        while self.usage(large) > 1 and large < mesh_size * SEARCH_RANGE:
+            large *= 2
+
+        while log(large / small) > tol:
+            middle = float(sqrt(small * large))
+            if self.usage(middle) > 1:
+                small = middle
+            else:
+                large = middle
+
+        return float(large)
+
+
+def count_mesh() -> tuple[int, int]:
+    """Number of nodes and of 2D elements of the current mesh."""
+    node_tags, _, _ = gmsh.model.mesh.get_nodes()
+    _, element_tags, _ = gmsh.model.mesh.get_elements(2)
+    return (len(node_tags), sum(len(tags) for tags in element_tags))
+
+
+def mesh_within_budget(
+    build: Builder,
+    method: str,
+    geometry: Geometry,
+    mesh_size: float,
+    gmsh_options: GmshOptions,
+    budget: MeshBudget,
+    *,
+    graded_edges: bool = False,
+    corner_options: CornerOptions = CornerOptions(),
+) -> float:
+    """Mesh a geometry with the smallest mesh size fitting in a budget.
+
+    Parameters
+    ----------
+    build : Builder
+        Function building the CAD model of the geometry for a mesh size.
+    method : str
+        Either "unstructured" or "locally_structured".
+    geometry : Geometry
+    mesh_size : float
+        Mesh size of the calibration mesh, it should be coarse.
+    gmsh_options : GmshOptions
+    budget : MeshBudget
+    graded_edges : bool, optional, default False
+        As in `mesh_locally_structured`, for the estimates.
+    corner_options : CornerOptions, optional
+        As in `mesh_locally_structured`, for the estimates.
+
+    Returns
+    -------
+    float
+        The mesh size used.
+
+    Raises
+    ------
+    RuntimeError
+        If no mesh fits in the budget after `MAX_TRIALS` trials.
+    """
+    search = SizeSearch(
+        geometry,
+        method,
+        budget,
+        graded_edges=graded_edges,
+        corner_options=corner_options,
+    )
+
+    if method == "unstructured":
+        # All the mesh sizes are proportional to mesh_size, the CAD model is
+        # built once and the trial meshes are scaled by Mesh.MeshSizeFactor.
+        chosen: list[float] = []
+
+        def generate() -> None:
+            gmsh.model.mesh.generate(2)
+            search.calibrate(mesh_size, *count_mesh())
+
+            for _ in range(MAX_TRIALS):
+                h = search.next_size(mesh_size)
+                gmsh.model.mesh.clear()
+                gmsh.option.set_number("Mesh.MeshSizeFactor", h / mesh_size)
+                gmsh.model.mesh.generate(2)
+
+                counts = count_mesh()
+                if budget.usage(*counts) <= 1:
+                    chosen.append(h)
+                    return None
+                search.calibrate(h, *counts)
+
+            raise RuntimeError("No mesh fits in the budget.")
+
+        with GmshContextManager(gmsh_options, generate=generate) as ctx:
+            build(ctx, geometry, mesh_size)
+
+        return chosen[0]
+
+    # The locally structured CAD model depends on the mesh size.
+    # The calibration mesh keeps the meshing options, but is not saved.
+    trial_options = copy(gmsh_options)
+    trial_options.filename = None
+    trial_options.renumber_nodes = None
+    trial_options.show_gui = False
+    trial_options.profiler = None
+    trial_options.event_handler = None
+    with GmshContextManager(
+        trial_options, generate=lambda: _generate_calibration(search, mesh_size)
+    ) as ctx:
+        build(ctx, geometry, mesh_size)
+
+    for _ in range(MAX_TRIALS):
+        h = search.next_size(mesh_size)
+        try:
+            with GmshContextManager(
+                gmsh_options, generate=lambda: _generate_checked(budget)
+            ) as ctx:
+                build(ctx, geometry, h)
+        except _OverBudgetError as error:
+            search.calibrate(h, error.nb_dofs, error.nb_elements)
+        else:
+            return h
+
+    raise RuntimeError("No mesh fits in the budget.")
+
+
+class _OverBudgetError(RuntimeError):
+    """Raised when a mesh does not fit in the budget."""
+
+    def __init__(self: Self, nb_dofs: int, nb_elements: int) -> None:
+        super().__init__(f"{nb_dofs} dofs and {nb_elements} elements over budget.")
+        self.nb_dofs = nb_dofs
+        self.nb_elements = nb_elements
+
+
+def _generate_calibration(search: SizeSearch, mesh_size: float) -> None:
+    """Generate the calibration mesh."""
+    gmsh.model.mesh.generate(2)
+    search.calibrate(mesh_size, *count_mesh())
+    return None
+
+
+def _generate_checked(budget: MeshBudget) -> None:
+    """Generate the mesh and check that it fits in the budget."""
+    gmsh.model.mesh.generate(2)
+    nb_dofs, nb_elements = count_mesh()
+    if budget.usage(nb_dofs, nb_elements) > 1:
+        raise _OverBudgetError(nb_dofs, nb_elements)
+    return None
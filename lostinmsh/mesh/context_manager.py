@@ -1,6 +1,8 @@
 """GMSH as a context manager."""
 
 from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager, nullcontext
 from dataclasses import dataclass, field
 from pathlib import PurePath
 from types import TracebackType
@@ -9,6 +11,8 @@ from typing import Any, Self
 import gmsh
 
 from ..type_alias import DimName, Tag
+from .gmsh_events import GmshEvent, GmshEventParser
+from .profiling import Profiler
 
 
 @dataclass(slots=True)
@@ -30,6 +34,14 @@ class GmshOptions:
             If True, show Gmsh terminal output.
         show_gui: bool, default False
             If True, launch the Gmsh GUI.
+        mesh_algorithm: int | str, default 6
+            2D meshing algorithm, or "auto" to choose it for each exterior surface.
+        nb_threads: int | None, default None
+            Number of threads of gmsh, 0 for the system default.
+        profiler: Profiler | None, default None
+            If given, profile the phases of the mesh run.
+        event_handler: Callable[[GmshEvent], None] | None, default None
+            If given, called with the events parsed from the gmsh logger.
 
     Raises:
         ValueError: If the element order is less than 1.
@@ -39,6 +51,9 @@ class GmshOptions:
     key_val: dict[str, Any]
     renumber_nodes: str | None
     show_gui: bool
+    mesh_algorithm: int | str
+    profiler: Profiler | None
+    event_handler: Callable[[GmshEvent], None] | None
 
     def __init__(
         self,
@@ -49,6 +64,10 @@ class GmshOptions:
         renumber_nodes: str | None = "RCMK",
         show_terminal_output: bool = False,
         show_gui: bool = False,
+        mesh_algorithm: int | str = 6,
+        nb_threads: int | None = None,
+        profiler: Profiler | None = None,
+        event_handler: Callable[[GmshEvent], None] | None = None,
     ) -> None:
         """Initialized gmsh options.
 
@@ -67,11 +86,36 @@ class GmshOptions:
             If True, show Gmsh terminal output.
         show_gui: bool, default False
             If True, launch the Gmsh GUI.
+        mesh_algorithm: int | str, default 6
+            Value of the gmsh option Mesh.Algorithm. If "auto", the algorithm
+            of each surface created by `mesh_exterior` is chosen from the number
+            of polygons, the size ratio and the area with the table
+            `ALGORITHM_TABLE`, and the choice is logged by the "lostinmsh.mesh"
+            logger; the other surfaces use the default algorithm 6. The shipped
+            table follows the gmsh documentation and is not measured, a
+            warning asks to regenerate it with
+            ``python -m benchmarks.algorithm_table``.
+        nb_threads: int | None, default None
+            If given, value of the gmsh options General.NumThreads and
+            Mesh.MaxNumThreads2D, 0 for the system default. Gmsh meshes the
+            surfaces in parallel, see `ExteriorOptions` to partition the
+            background.
+        profiler: Profiler | None, default None
+            If given, profile the phases of the mesh run, the report is then
+            available as `profiler.report`.
+        event_handler: Callable[[GmshEvent], None] | None, default None
+            If given, called with the events parsed from the gmsh logger, such
+            as the meshing progress, the warnings and the element counts. The
+            events are dispatched each time a gmsh call returns, the mesh
+            generation is split by dimension for that purpose: the events of
+            a long 2D generation, progress included, only come when it is
+            done, as the gmsh API cannot be polled from another thread. Use
+            `log_event` to forward them to the `logging` module.
 
         Raises
         ------
         ValueError
-            If the element order is less than 1.
+            If the element order is less than 1 or the mesh algorithm unknown.
         """
         self.filename = PurePath(filename) if filename is not None else None
 
@@ -82,17 +126,28 @@ class GmshOptions:
 
         self.show_gui = show_gui
 
+        if isinstance(mesh_algorithm, str) and mesh_algorithm != "auto":
+            raise ValueError('Mesh algorithm must be an integer or "auto".')
+        self.mesh_algorithm = mesh_algorithm
+
+        self.profiler = profiler
+        self.event_handler = event_handler
+
         key_val = {
             "General.Terminal": int(show_terminal_output),
             "General.SmallAxes": 0,
             "Mesh.ElementOrder": element_order,
             "Mesh.TransfiniteTri": 1,
             "Mesh.Smoothing": 0,
-            "Mesh.Algorithm": 6,  # 5 is better than 6 at capturing sharp mesh size transitions.
+            # 5 is better than 6 at capturing sharp mesh size transitions.
+            "Mesh.Algorithm": 6 if mesh_algorithm == "auto" else mesh_algorithm,
             "Mesh.MeshSizeExtendFromBoundary": 1,
             "Mesh.SurfaceFaces": 1,
             "Mesh.ColorCarousel": 2,
         }
+        if nb_threads is not None:
+            key_val["General.NumThreads"] = nb_threads
+            key_val["Mesh.MaxNumThreads2D"] = nb_threads
         if additional_options is not None:
             key_val.update(additional_options)
 
@@ -105,6 +160,9 @@ class GmshOptions:
             ("filename", self.filename),
             ("Launch GMSH GUI", self.show_gui),
             ("Renumber nodes", self.renumber_nodes),
+            ("Mesh algorithm", self.mesh_algorithm),
+            ("Profile", self.profiler is not None),
+            ("Capture gmsh events", self.event_handler is not None),
             ("Gmsh options", ""),
         ]
         data.extend(((f"  {key}", val) for key, val in self.key_val.items()))
@@ -118,22 +176,54 @@ class GmshOptions:
 
 @dataclass(frozen=True, slots=True)
 class GmshContextManager:
-    """Context manager for GMSH."""
+    """Context manager for GMSH.
+
+    Attributes
+    ----------
+    options : GmshOptions
+    domain_tags : dict[DimName, list[Tag]]
+        Tags of the physical groups.
+    generate : Callable[[], None] | None, default None
+        Replace the mesh generation, it must leave a 2D mesh of the model.
+    """
 
     options: GmshOptions
     domain_tags: dict[DimName, list[Tag]] = field(
         default_factory=lambda: defaultdict(list)
     )
+    generate: Callable[[], None] | None = None
+    _cad_phase: ExitStack = field(default_factory=ExitStack, repr=False)
+    _events: GmshEventParser | None = field(init=False, repr=False)
+
+    def __post_init__(self: Self) -> None:
+        handler = self.options.event_handler
+        events = GmshEventParser(handler) if handler is not None else None
+        object.__setattr__(self, "_events", events)
+        return None
 
     def update_domain_tags(self: Self, domain_tags: dict[DimName, list[Tag]]) -> None:
         for key, val in domain_tags.items():
             self.domain_tags[key].extend(val)
         return None
 
+    @contextmanager
+    def _phase(self: Self, name: str) -> Iterator[None]:
+        """Profile a phase and dispatch its gmsh events if requested."""
+        profiler = self.options.profiler
+        with profiler.phase(name) if profiler is not None else nullcontext():
+            try:
+                yield None
+            finally:
+                if self._events is not None:
+                    self._events.flush()
+
     def __enter__(self: Self) -> Self:
         # Initialize the Gmsh API.
         gmsh.initialize()
 
+        if self._events is not None:
+            self._events.start()
+
         for key, val in self.options.key_val.items():
             gmsh.option.set_number(key, val)
 
@@ -143,6 +233,11 @@ class GmshContextManager:
         else:
             gmsh.model.add(self.options.filename.stem)
 
+        if self.options.profiler is not None:
+            self.options.profiler.start_run()
+            # The CAD construction happens in the body of the with statement.
+            self._cad_phase.enter_context(self._phase("cad"))
+
         return self
 
     def __exit__(
@@ -151,19 +246,53 @@ class GmshContextManager:
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
+        self._cad_phase.close()
+
+        try:
+            # After an error, the model is not meshed, gmsh is only finalized.
+            if exc_type is None:
+                self._finish()
+
+        finally:
+            if self.options.profiler is not None:
+                self.options.profiler.end_run()
+
+            if self._events is not None:
+                self._events.stop()
+
+            # Finalize the Gmsh API.
+            gmsh.finalize()
+
+        return None
+
+    def _finish(self: Self) -> None:
+        """Synchronize, mesh and write the model."""
         # Synchronize the built-in CAD representation with the current Gmsh model.
-        gmsh.model.geo.synchronize()
+        with self._phase("synchronize"):
+            gmsh.model.geo.synchronize()
 
-        for (dim, name), tags in self.domain_tags.items():
-            gmsh.model.add_physical_group(dim=dim, tags=tags, name=name)
+        with self._phase("physical_groups"):
+            for (dim, name), tags in self.domain_tags.items():
+                gmsh.model.add_physical_group(dim=dim, tags=tags, name=name)
 
         # Generate a mesh of the current model, up to dimension dim 2.
-        gmsh.model.mesh.generate(2)
+        with self._phase("generate"):
+            if self.generate is not None:
+                self.generate()
+            elif self._events is None:
+                gmsh.model.mesh.generate(2)
+            else:
+                for dim in (1, 2):
+                    gmsh.model.mesh.generate(dim)
+                    self._events.flush()
 
         if self.options.renumber_nodes is not None:
             # Renumber the nodes to improve the matrix bandwidth.
-            old, new = gmsh.model.mesh.compute_renumbering(self.options.renumber_nodes)
-            gmsh.model.mesh.renumber_nodes(old, new)
+            with self._phase("renumber"):
+                old, new = gmsh.model.mesh.compute_renumbering(
+                    self.options.renumber_nodes
+                )
+                gmsh.model.mesh.renumber_nodes(old, new)
 
         if self.options.show_gui:
             # Create and run the FLTK graphical user interface.
@@ -171,25 +300,16 @@ class GmshContextManager:
 
         if self.options.filename is not None:
             # Write a file. The export format is determined by the file extension.
-            match self.options.filename.suffix:
-                case ".msh":
-                    gmsh.write(str(self.options.filename))
-                case _:
-                    gmsh.fltk.initialize()
-                    gmsh.write(str(self.options.filename))
-                    gmsh.fltk.finalize()
-
-        # Finalize the Gmsh API.
-        gmsh.finalize()
-
-        if exc_type is not None:
-            print(f"\n{exc_type}")
+            with self._phase("write"):
+                match self.options.filename.suffix:
+                    case ".msh":
+                        gmsh.write(str(self.options.filename))
+                    case _:
+                        gmsh.fltk.initialize()
+                        gmsh.write(str(self.options.filename))
+                        gmsh.fltk.finalize()
 
-        if exc_value is not None:
-            print(f"\n{exc_value}")
-
-        if traceback is not None:
-            print(f"\n{traceback}")
+        return None
 
 
 def open_msh_file(filename: PurePath | str) -> None:
@@ -0,0 +1,341 @@
+"""Corner patches of the locally structured mesh."""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from typing import Final, Self
+
+from numpy import concatenate, cos, eye, linspace, pi, sin, vstack, zeros
+
+from ..circular_iterable import circular_pairwise
+from ..geometry import Corner
+from ..type_alias import Mat2x2, MatNx2, Vec2
+
+# Decimals of the angles in the keys of the templates.
+ANGLE_DECIMALS: Final = 12
+
+
+@dataclass(frozen=True, slots=True)
+class CornerOptions:
+    """Options of the corner patches of the locally structured mesh.
+
+    Attributes
+    ----------
+    nb_rings : int, default 2
+        Number of rings around the vertex.
+    radial_ratio : float, default 1/3
+        Ratio between the radii of two consecutive rings, the outer ring is at
+        the corner radius. Must be in (0, 1).
+    angular_refinement : int, default 2
+        Ratio between the numbers of angular subdivisions of two consecutive
+        inner rings, 1 keeps the same number. The outer ring always has twice
+        the subdivisions of the previous ring, the edges are connected to it.
+    """
+
+    nb_rings: int = 2
+    radial_ratio: float = 1 / 3
+    angular_refinement: int = 2
+
+    def __post_init__(self: Self) -> None:
+        if self.nb_rings < 1:
+            raise ValueError("Number of rings must be an integer >= 1.")
+        if not 0 < self.radial_ratio < 1:
+            raise ValueError("Radial ratio must be in (0, 1).")
+        if self.angular_refinement < 1:
+            raise ValueError("Angular refinement must be an integer >= 1.")
+        return None
+
+    def subdivisions(self: Self) -> list[int]:
+        """Angular subdivisions of each ring, in multiple of (p, q)."""
+        factors = [self.angular_refinement**k for k in range(self.nb_rings - 1)]
+        return [*factors, 2 * factors[-1]] if factors else [2]
+
+    def radii(self: Self, radius: float) -> list[float]:
+        """Radius of each ring."""
+        return [
+            radius * self.radial_ratio ** (self.nb_rings - 1 - k)
+            for k in range(self.nb_rings)
+        ]
+
+
+@dataclass(frozen=True, slots=True)
+class CornerTemplate:
+    """Corner patch of radius 1 at the origin, with its first side along the x
+    axis. The lines are numbered from 1, a negative number is a reversed line.
+
+    The sides are the edges from the vertex, counterclockwise. The sector k is
+    between the sides k and k + 1, for a corner of a polygon the sector 0 is
+    inside the polygon and the sector 1 outside.
+
+    The gmsh entities of a corner are created in the order of the template:
+    the points, then the lines up to `nb_lines[i]` before the surface i.
+
+    Attributes
+    ----------
+    points : MatNx2
+        The vertex, then the points of the rings from the inner one.
+    lines : list[tuple[int, int]]
+        Indices of the two points of each line.
+    surfaces : list[tuple[tuple[int, ...], int, bool]]
+        Loop of lines of each surface, its sector, and whether it is a
+        quadrangle.
+    nb_lines : list[int]
+        Number of lines created before each surface.
+    boundary : list[list[int]]
+        Lines on each side, from the vertex.
+    outer_points : list[int]
+        Indices of the points of the outer ring.
+    outer_lines : list[int]
+        Lines of the outer ring, line i from the outer point i to i + 1.
+    sides : list[int]
+        Index in the outer ring of the point on each side.
+    """
+
+    points: MatNx2
+    lines: list[tuple[int, int]]
+    surfaces: list[tuple[tuple[int, ...], int, bool]]
+    nb_lines: list[int]
+    boundary: list[list[int]]
+    outer_points: list[int]
+    outer_lines: list[int]
+    sides: list[int]
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateStats:
+    """Statistics of the cache of the corner templates.
+
+    Attributes
+    ----------
+    hits : int
+        Number of corners meshed from a cached template.
+    misses : int
+        Number of templates computed.
+    size : int
+        Number of cached templates.
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+    def hit_rate(self: Self) -> float:
+        """Fraction of the corners meshed from a cached template."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+def corner_template(corner: Corner, options: CornerOptions) -> CornerTemplate:
+    """Template of the corners with the same angle, up to `ANGLE_DECIMALS`,
+    the same (p, q) and the same options.
+
+    The templates are computed once and cached, see `corner_template_info`.
+
+    Parameters
+    ----------
+    corner : Corner
+    options : CornerOptions
+
+    Returns
+    -------
+    CornerTemplate
+        With the sector 0 of angle `corner.angle` and p subdivisions, and the
+        sector 1 of q subdivisions.
+    """
+    angle = round(float(corner.angle), ANGLE_DECIMALS)
+    return _corner_template((angle, 2 * pi - angle), (corner.p, corner.q), options)
+
+
+def junction_template(
+    angles: Sequence[float], subdivisions: Sequence[int], options: CornerOptions
+) -> CornerTemplate:
+    """Template of a vertex shared by several polygons, with a sector between
+    each pair of consecutive edges.
+
+    The templates are cached with those of `corner_template`.
+
+    Parameters
+    ----------
+    angles : Sequence[float]
+        Angle of each sector counterclockwise, their sum is 2π.
+    subdivisions : Sequence[int]
+        Angular subdivisions of each sector, in the inner ring.
+    options : CornerOptions
+
+    Returns
+    -------
+    CornerTemplate
+    """
+    return _corner_template(
+        tuple(round(float(angle), ANGLE_DECIMALS) for angle in angles),
+        tuple(int(n) for n in subdivisions),
+        options,
+    )
+
+
+def corner_template_info() -> TemplateStats:
+    """Statistics of the cache of the corner templates since the start."""
+    info = _corner_template.cache_info()
+    return TemplateStats(info.hits, info.misses, info.currsize)
+
+
+def patch_points(
+    center: Vec2,
+    axis: Mat2x2,
+    radius: float,
+    angles: Sequence[float],
+    subdivisions: Sequence[int],
+    options: CornerOptions,
+) -> MatNx2:
+    """Points of a patch rotated by `axis`, scaled by the radius and moved to
+    the vertex, in the order of `CornerTemplate.points`.
+
+    They are computed from the exact angles of the vertex, the template only
+    holds the topology shared by the vertices with the same rounded angles.
+
+    Parameters
+    ----------
+    center : Vec2
+    axis : Mat2x2
+    radius : float
+    angles : Sequence[float]
+        Angle of each sector counterclockwise, their sum is 2π.
+    subdivisions : Sequence[int]
+        Angular subdivisions of each sector, in the inner ring.
+    options : CornerOptions
+
+    Returns
+    -------
+    MatNx2
+    """
+    bounds = [0.0, *accumulate(angles[:-1]), 2 * pi]
+
+    points = [center.reshape(1, 2)]
+    for factor, r in zip(options.subdivisions(), options.radii(radius)):
+        # The side k is at angles[factor * sum(subdivisions[:k])].
+        angles_ring = concatenate(
+            [
+                linspace(a, b, num=factor * n + 1)[0:-1]
+                for a, b, n in zip(bounds[:-1], bounds[1:], subdivisions)
+            ]
+        )
+        ring = center.reshape(2, 1) + r * (
+            axis @ vstack((cos(angles_ring), sin(angles_ring)))
+        )
+        points.append(ring.T)
+    return concatenate(points)
+
+
+@lru_cache(maxsize=None)
+def _corner_template(
+    angles: tuple[float, ...], subdivisions: tuple[int, ...], options: CornerOptions
+) -> CornerTemplate:
+    """T-conform patch of a corner, see `corner_template`."""
+    factors = options.subdivisions()
+
+    rings: list[list[int]] = []
+    nb_points = 1
+    for factor in factors:
+        size = factor * sum(subdivisions)
+        rings.append(list(range(nb_points, nb_points + size)))
+        nb_points += size
+
+    lines: list[tuple[int, int]] = []
+
+    def line(a: int, b: int) -> int:
+        lines.append((a, b))
+        return len(lines)
+
+    surfaces: list[tuple[tuple[int, ...], int, bool]] = []
+    nb_lines: list[int] = []
+
+    def cell(loop: tuple[int, ...], sector: int, quadrangle: bool) -> None:
+        surfaces.append((loop, sector, quadrangle))
+        nb_lines.append(len(lines))
+        return None
+
+    lt_rad = [line(0, j) for j in rings[0]]
+    lt_ang = [[line(a, b) for a, b in circular_pairwise(ring)] for ring in rings]
+
+    sides = [0, *accumulate(subdivisions[:-1])]
+    sectors = [k for k, n in enumerate(subdivisions) for _ in range(n)]
+
+    f0 = factors[0]
+    for i, ((lr0, lr1), la) in enumerate(zip(circular_pairwise(lt_rad), lt_ang[0])):
+        cell((lr0, la, -lr1), sectors[i // f0], False)
+
+    boundary = [[lt_rad[f0 * s]] for s in sides]
+    for k in range(1, len(rings)):
+        spokes = _ring(
+            line,
+            cell,
+            rings[k - 1],
+            lt_ang[k - 1],
+            rings[k],
+            lt_ang[k],
+            [sectors[i // factors[k - 1]] for i in range(len(rings[k - 1]))],
+            [factors[k - 1] * s for s in sides],
+        )
+        for lines_side, spoke in zip(boundary, spokes):
+            lines_side.append(spoke)
+
+    return CornerTemplate(
+        patch_points(zeros(2), eye(2), 1.0, angles, subdivisions, options),
+        lines,
+        surfaces,
+        nb_lines,
+        boundary,
+        rings[-1],
+        lt_ang[-1],
+        [factors[-1] * s for s in sides],
+    )
+
+
+def _ring(
+    line: Callable[[int, int], int],
+    cell: Callable[[tuple[int, ...], int, bool], None],
+    pt_inn: list[int],
+    lt_inn: list[int],
+    pt_out: list[int],
+    lt_out: list[int],
+    sectors: list[int],
+    sides: list[int],
+) -> list[int]:
+    """T-conform patch between two rings, the outer ring has m times more points.
+
+    Each inner segment i, in the sector `sectors[i]`, is the base of a fan of
+    triangles: from the inner point i to the first half of the outer points
+    m*i, ..., m*(i+1), the middle triangle, and from the inner point i+1 to the
+    second half. If m = 1, the segments i of the two rings bound a quadrangle.
+    Return the lines on the sides, from the inner points `sides`.
+    """
+    n, m = len(pt_inn), len(pt_out) // len(pt_inn)
+    mid = m // 2
+
+    spokes: dict[tuple[int, int], int] = {}
+
+    def spoke(i: int, j: int) -> int:
+        """Line from the inner point i to the outer point j."""
+        key = (i % n, j % len(pt_out))
+        if key not in spokes:
+            spokes[key] = line(pt_inn[key[0]], pt_out[key[1]])
+        return spokes[key]
+
+    for i in range(n):
+        if m == 1:
+            loop = (spoke(i, i), lt_out[i], -spoke(i + 1, i + 1), -lt_inn[i])
+            cell(loop, sectors[i], True)
+            continue
+
+        for j in range(m * i, m * i + mid):
+            cell((spoke(i, j), lt_out[j], -spoke(i, j + 1)), sectors[i], False)
+        cell(
+            (spoke(i, m * i + mid), -spoke(i + 1, m * i + mid), -lt_inn[i]),
+            sectors[i],
+            False,
+        )
+        for j in range(m * i + mid, m * (i + 1)):
+            cell((spoke(i + 1, j), lt_out[j], -spoke(i + 1, j + 1)), sectors[i], False)
+
+    return [spoke(s, m * s) for s in sides]
@@ -0,0 +1,96 @@
+"""Meshes of higher order from a mesh of order 1."""
+
+from pathlib import PurePath
+
+from numpy import arange, array, concatenate, newaxis, where
+
+from .mesh_data import MeshData
+
+
+def elevate_order(mesh: MeshData | PurePath | str, order: int) -> MeshData:
+    """Mesh of order k with the triangles of a mesh of order 1.
+
+    The nodes of the edges and of the interiors are placed on the straight
+    triangles, the nodes shared by two triangles are created once. The nodes of
+    the mesh of order 1 keep their indices.
+
+    Parameters
+    ----------
+    mesh : MeshData | PurePath | str
+        Mesh of order 1, or its mesh file.
+    order : int
+        Order k of the new mesh, must be >= 1.
+
+    Returns
+    -------
+    MeshData
+
+    Raises
+    ------
+    ValueError
+        If the order is less than 1 or if the mesh is not of order 1.
+    """
+    if order < 1:
+        raise ValueError("Element order must be an integer >= 1.")
+    if not isinstance(mesh, MeshData):
+        mesh = MeshData.from_msh(mesh)
+    if mesh.order() != 1:
+        raise ValueError("Only meshes of order 1 can be elevated.")
+    if order == 1:
+        return mesh
+
+    nb_nodes = mesh.nodes.shape[0]
+    nb_triangles = mesh.triangles.shape[0]
+    edges, triangle_edges = mesh.edges()
+    nb_edges = edges.shape[0]
+
+    # Node s of the edge e from its first vertex: nb_nodes + e * (k - 1) + s - 1.
+    steps = arange(1, order)
+    lo, hi = mesh.nodes[edges[:, 0]], mesh.nodes[edges[:, 1]]
+    edge_nodes = lo[:, newaxis] + (steps / order)[:, newaxis] * (hi - lo)[:, newaxis]
+
+    columns = [mesh.triangles]
+    for k in range(3):
+        e = triangle_edges[:, k]
+        forward = (mesh.triangles[:, k] == edges[e, 0])[:, newaxis]
+        first = (nb_nodes + e * (order - 1))[:, newaxis]
+        columns.append(first + where(forward, steps - 1, order - 1 - steps))
+
+    # Nodes of the interior of the triangles, in the gmsh ordering.
+    lattice = array(_lattice(order)[3 * order :], dtype=float).reshape(-1, 2) / order
+    nb_interior = lattice.shape[0]
+    a, b, c = (mesh.nodes[mesh.triangles[:, k], newaxis] for k in range(3))
+    interior_nodes = (
+        a + lattice[:, 0, newaxis] * (b - a) + lattice[:, 1, newaxis] * (c - a)
+    )
+    first = nb_nodes + nb_edges * (order - 1)
+    columns.append(
+        first + arange(nb_triangles * nb_interior).reshape(nb_triangles, nb_interior)
+    )
+
+    return MeshData(
+        concatenate(
+            (mesh.nodes, edge_nodes.reshape(-1, 2), interior_nodes.reshape(-1, 2))
+        ),
+        concatenate(columns, axis=1),
+        mesh.element_tags,
+        mesh.physical_tags,
+        mesh.physical_names,
+    )
+
+
+def _lattice(order: int) -> list[tuple[int, int]]:
+    """Nodes (i, j) of a triangle (abc) of order k in the gmsh ordering, at
+    a + i/k (b - a) + j/k (c - a): the vertices, the nodes of the edges (ab),
+    (bc), (ca), then the interior nodes, ordered as a triangle of order k - 3."""
+    if order == 0:
+        return [(0, 0)]
+
+    nodes = [(0, 0), (order, 0), (0, order)]
+    nodes.extend((i, 0) for i in range(1, order))
+    nodes.extend((order - i, i) for i in range(1, order))
+    nodes.extend((0, order - i) for i in range(1, order))
+    if order >= 3:
+        nodes.extend((i + 1, j + 1) for i, j in _lattice(order - 3))
+
+    return nodes
@@ -0,0 +1,409 @@
+"""Estimate the size of a mesh without calling gmsh."""
+
+import warnings
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Final, Self
+
+from numpy import arange, isclose, log, pi, repeat, roll, sin, sqrt, vstack
+from scipy.spatial import KDTree
+
+from ..circular_iterable import circular_pairwise
+from ..geometry import (
+    CircularBoundary,
+    Corner,
+    Geometry,
+    Polygon,
+    RectangularBoundary,
+)
+from ..geometry.boundary import ExteriorBoundary
+from .corner_patch import CornerOptions, corner_template
+from .lost_parameters import (
+    corner_mesh_size,
+    corner_radius,
+    edge_subdivision,
+    graded_edge_subdivision,
+    max_corner_radius,
+)
+
+# Number of triangles per unit area of an unstructured mesh of mesh size 1, that
+# is the inverse of the area of an equilateral triangle of side 1.
+TRIANGLE_DENSITY: Final = 4 / sqrt(3)
+
+# Warn if a small feature divides the corner radius by more than this factor.
+TINY_FEATURE_FACTOR: Final = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class MeshEstimate:
+    """Estimate of the size of a mesh.
+
+    Attributes
+    ----------
+    nb_nodes : int
+        Number of nodes of the first order mesh.
+    nb_triangles : int
+    nb_structured : int
+        Number of triangles of the structured corners and edges, this part of
+        the count is exact.
+    regions : dict[str, int]
+        Number of triangles per region.
+    corner_radius : float | None
+        Corner radius of the locally structured mesh.
+    """
+
+    nb_nodes: int
+    nb_triangles: int
+    nb_structured: int = 0
+    regions: dict[str, int] = field(default_factory=dict)
+    corner_radius: float | None = None
+
+    @property
+    def nb_edges(self: Self) -> int:
+        """Number of edges given by the Euler formula of a disk."""
+        return self.nb_nodes + self.nb_triangles - 1
+
+    def nb_dofs(self: Self, element_order: int = 1) -> int:
+        """Number of nodes of the mesh of order `element_order`.
+
+        Parameters
+        ----------
+        element_order : int, optional, default 1
+        """
+        k = element_order
+        return (
+            self.nb_nodes
+            + (k - 1) * self.nb_edges
+            + (k - 1) * (k - 2) // 2 * self.nb_triangles
+        )
+
+    def __str__(self: Self) -> str:
+        data: list[tuple[str, Any]] = [
+            ("Nodes", self.nb_nodes),
+            ("Triangles", self.nb_triangles),
+            ("Structured triangles", self.nb_structured),
+            *((f"  {key}", val) for key, val in self.regions.items()),
+        ]
+        if self.corner_radius is not None:
+            data.insert(0, ("Corner radius", f"{self.corner_radius:.3e}"))
+
+        n = max(len(key) for key, _ in data) + 1
+        return "".join(f"{key} {'.' * (n - len(key))} {val}\n" for key, val in data)
+
+
+def estimate_mesh(
+    geometry: Geometry,
+    mesh_size: float,
+    method: str = "locally_structured",
+    *,
+    graded_edges: bool = False,
+    corner_options: CornerOptions = CornerOptions(),
+) -> MeshEstimate:
+    """Estimate the number of nodes and triangles of a mesh before meshing.
+
+    The structured corners and edges of the locally structured mesh are counted
+    exactly, the unstructured parts are approximated by their area divided by
+    the area of an equilateral triangle of side the local mesh size.
+
+    Parameters
+    ----------
+    geometry : Geometry
+    mesh_size : float
+    method : str, optional, default "locally_structured"
+        Either "unstructured" or "locally_structured".
+    graded_edges : bool, optional, default False
+        As in `mesh_locally_structured`.
+    corner_options : CornerOptions, optional
+        As in `mesh_locally_structured`.
+
+    Returns
+    -------
+    MeshEstimate
+
+    Warns
+    -----
+    UserWarning
+        If a small feature of the geometry divides the corner radius of the
+        locally structured mesh by more than `TINY_FEATURE_FACTOR`.
+    """
+    if method == "unstructured":
+        return _estimate_unstructured(geometry, mesh_size)
+
+    if method != "locally_structured":
+        raise ValueError(f"Unknown meshing method {method!r}.")
+
+    radius = corner_radius(geometry, mesh_size)
+    estimate = _estimate_lost(geometry, mesh_size, radius, graded_edges, corner_options)
+
+    if TINY_FEATURE_FACTOR * radius < 1.5 * mesh_size:
+        warnings.warn(
+            f"The corner radius {radius:.3e} is limited by "
+            f"{_limiting_feature(geometry)}, the mesh has about "
+            f"{estimate.nb_triangles} triangles.",
+            stacklevel=2,
+        )
+
+    return estimate
+
+
+def _estimate_unstructured(geometry: Geometry, mesh_size: float) -> MeshEstimate:
+    """Estimate of the unstructured mesh."""
+    regions: Counter[str] = Counter()
+    for polygon in geometry.polygons:
+        regions[polygon.name] += _nb_unstructured(polygon_area(polygon), mesh_size)
+
+    perimeter = sum(float(polygon.lengths.sum()) for polygon in geometry.polygons)
+    _add_exterior(regions, geometry, mesh_size, 0.0, perimeter, mesh_size)
+
+    return _finalize(geometry, mesh_size, regions, 0, None)
+
+
+def _estimate_lost(
+    geometry: Geometry,
+    mesh_size: float,
+    corner_radius: float,
+    graded_edges: bool,
+    corner_options: CornerOptions,
+) -> MeshEstimate:
+    """Estimate of the locally structured mesh."""
+    r = corner_radius
+    f = corner_options.subdivisions()[-1]
+    background_name = geometry.boundary.background_name
+
+    regions: Counter[str] = Counter()
+    nb_structured = 0
+    area_out = 0.0  # area of the structured part outside the polygons
+    length_out = 0.0  # length of the outer loops of the structured part
+    nb_segments_out = 0
+    for polygon in geometry.polygons:
+        corners = polygon.corners
+        h = [corner_mesh_size(corner, r, f) for corner in corners]
+
+        # Corner: the cells of its template, the circle of radius r is
+        # approximated by fp (resp. fq) chords inside (resp. outside).
+        nb_inn, nb_out = 0, 0
+        for corner in corners:
+            nb_corner_inn, nb_corner_out = _nb_corner_triangles(corner, corner_options)
+            nb_inn += nb_corner_inn
+            nb_out += nb_corner_out
+        area_inn = polygon_area(polygon) - sum(
+            _sector_area(corner.angle, f * corner.p, r) for corner in corners
+        )
+        area_out += sum(
+            _sector_area(2 * pi - corner.angle, f * corner.q, r) for corner in corners
+        )
+
+        # Unstructured interior meshed with the size of its boundary segments,
+        # the chords next to the edges bound the strips.
+        length_inn = sum(
+            (f * corner.p - 2) * r * 2 * sin(corner.angle / (2 * f * corner.p))
+            for corner in corners
+        )
+        nb_segments_inn = sum(f * corner.p - 2 for corner in corners)
+        length_out += sum(
+            (f * corner.q - 2)
+            * r
+            * 2
+            * sin((2 * pi - corner.angle) / (2 * f * corner.q))
+            for corner in corners
+        )
+        nb_segments_out += sum(f * corner.q - 2 for corner in corners)
+
+        # Edge: a strip of n-1 quadrangles on each side of the edge.
+        for ((c0, h0), (cp, hp)), length in zip(
+            circular_pairwise(list(zip(corners, h))), polygon.lengths
+        ):
+            if graded_edges:
+                n, _ = graded_edge_subdivision(length, r, r, h0, hp, mesh_size)
+            else:
+                n = edge_subdivision(length, r, r, h0, hp, mesh_size)
+            nb_inn += 2 * (n - 1)
+            nb_out += 2 * (n - 1)
+
+            width_inn = r * (sin(c0.angle / (f * c0.p)) + sin(cp.angle / (f * cp.p)))
+            width_out = r * (
+                sin((2 * pi - c0.angle) / (f * c0.q))
+                + sin((2 * pi - cp.angle) / (f * cp.q))
+            )
+            area_inn -= (length - 2 * r) * width_inn / 2
+            area_out += (length - 2 * r) * width_out / 2
+
+            length_inn += length - 2 * r
+            nb_segments_inn += n - 1
+            length_out += length - 2 * r
+            nb_segments_out += n - 1
+
+        nb_structured += nb_inn + nb_out
+        regions[polygon.name] += nb_inn + _nb_unstructured(
+            area_inn, length_inn / nb_segments_inn
+        )
+        regions[background_name] += nb_out
+
+    _add_exterior(
+        regions, geometry, mesh_size, area_out, length_out, length_out / nb_segments_out
+    )
+
+    return _finalize(geometry, mesh_size, regions, nb_structured, corner_radius)
+
+
+def _nb_corner_triangles(corner: Corner, options: CornerOptions) -> tuple[int, int]:
+    """Number of triangles of a corner inside and outside the polygon, a
+    quadrangle of the template is meshed by two triangles."""
+    nb_triangles = [0, 0]
+    for _, sector, quadrangle in corner_template(corner, options).surfaces:
+        nb_triangles[sector] += 2 if quadrangle else 1
+    return (nb_triangles[0], nb_triangles[1])
+
+
+def _add_exterior(
+    regions: Counter[str],
+    geometry: Geometry,
+    mesh_size: float,
+    area_out: float,
+    inner_length: float,
+    inner_size: float,
+) -> None:
+    """Add the unstructured background, without its structured part of area
+    `area_out`, and the thickness.
+
+    The background is bounded by inner loops of total length `inner_length`
+    meshed with `inner_size`, and by the exterior boundary meshed with
+    `mesh_size`.
+    """
+    boundary = geometry.boundary
+    area_background, area_thickness = boundary_areas(boundary)
+
+    regions[boundary.background_name] += _nb_graded(
+        area_background - sum(map(polygon_area, geometry.polygons)) - area_out,
+        inner_length,
+        inner_size,
+        _perimeter(boundary),
+        mesh_size,
+    )
+    if boundary.thickness is not None:
+        regions[boundary.thickness_name] += _nb_unstructured(area_thickness, mesh_size)
+
+    return None
+
+
+def _finalize(
+    geometry: Geometry,
+    mesh_size: float,
+    regions: Counter[str],
+    nb_structured: int,
+    corner_radius: float | None,
+) -> MeshEstimate:
+    """Count the nodes with the Euler formula of a disk: with T triangles and B
+    boundary segments, there are (3T + B)/2 edges and 1 + (T + B)/2 nodes."""
+    nb_triangles = int(sum(regions.values()))
+    nb_boundary = _nb_boundary_segments(geometry.boundary, mesh_size)
+    return MeshEstimate(
+        nb_nodes=1 + (nb_triangles + nb_boundary) // 2,
+        nb_triangles=nb_triangles,
+        nb_structured=int(nb_structured),
+        regions={name: int(nb) for name, nb in regions.items()},
+        corner_radius=corner_radius,
+    )
+
+
+def _nb_unstructured(area: float, mesh_size: float) -> int:
+    """Number of triangles of an unstructured mesh of a surface."""
+    return max(0, int(round(TRIANGLE_DENSITY * area / mesh_size**2)))
+
+
+def _nb_graded(
+    area: float,
+    inner_length: float,
+    inner_size: float,
+    outer_length: float,
+    outer_size: float,
+) -> int:
+    """Number of triangles of an unstructured mesh of a surface between inner
+    loops and an outer loop meshed with different sizes.
+
+    Gmsh extends the sizes of the boundaries into the surface, the mesh size is
+    taken linear in the distance to the inner loops, across a band of constant
+    width whose length is linear from `inner_length` to `outer_length`.
+    """
+    a, b = inner_size, outer_size
+    if area <= 0 or isclose(a, b):
+        return _nb_unstructured(area, b)
+
+    width = 2 * area / (inner_length + outer_length)
+    growth = (outer_length - inner_length) / (b - a)
+    integral = inner_length * (1 / a - 1 / b) + growth * (log(b / a) - 1 + a / b)
+    return max(0, int(round(TRIANGLE_DENSITY * width / (b - a) * integral)))
+
+
+def _sector_area(angle: float, nb_chords: int, radius: float) -> float:
+    """Area of a circular sector approximated by chords."""
+    return float(nb_chords * radius**2 * sin(angle / nb_chords) / 2)
+
+
+def polygon_area(polygon: Polygon) -> float:
+    """Area of a polygon."""
+    x, y = polygon.vertices.T
+    return float((x * roll(y, -1) - y * roll(x, -1)).sum() / 2)
+
+
+def boundary_areas(boundary: ExteriorBoundary) -> tuple[float, float]:
+    """Area enclosed by the exterior boundary and area of the thickness."""
+    t = boundary.thickness if boundary.thickness is not None else 0.0
+
+    if isinstance(boundary, CircularBoundary):
+        r = boundary.radius
+        return (pi * r**2, pi * ((r + t) ** 2 - r**2))
+
+    if isinstance(boundary, RectangularBoundary):
+        w, h = boundary.corner_high - boundary.corner_low
+        return (float(w * h), float((w + 2 * t) * (h + 2 * t) - w * h))
+
+    raise ValueError("Unknown boundary shape.")
+
+
+def _perimeter(boundary: ExteriorBoundary) -> float:
+    """Length of the exterior boundary, inside the thickness."""
+    if isinstance(boundary, CircularBoundary):
+        return float(2 * pi * boundary.radius)
+
+    if isinstance(boundary, RectangularBoundary):
+        w, h = boundary.corner_high - boundary.corner_low
+        return float(2 * (w + h))
+
+    raise ValueError("Unknown boundary shape.")
+
+
+def _nb_boundary_segments(boundary: ExteriorBoundary, mesh_size: float) -> int:
+    """Number of segments of the outer boundary."""
+    t = boundary.thickness if boundary.thickness is not None else 0.0
+
+    if isinstance(boundary, CircularBoundary):
+        return max(4, round(2 * pi * (boundary.radius + t) / mesh_size))
+
+    if isinstance(boundary, RectangularBoundary):
+        w, h = boundary.corner_high - boundary.corner_low
+        return max(4, round(2 * (w + h + 4 * t) / mesh_size))
+
+    raise ValueError("Unknown boundary shape.")
+
+
+def _limiting_feature(geometry: Geometry) -> str:
+    """Describe the feature of the geometry limiting the corner radius."""
+    polygons = geometry.polygons
+    points = vstack([polygon.vertices for polygon in polygons])
+    owners = repeat(arange(len(polygons)), [len(p.vertices) for p in polygons])
+
+    distances, indices = KDTree(points).query(points, k=2)
+    i = int(distances[:, 1].argmin())
+    j = int(indices[i, 1])
+    distance = float(distances[i, 1])
+
+    if distance / 2 > max_corner_radius(geometry):
+        return "the distance between the polygons and the exterior boundary"
+
+    a, b = polygons[owners[i]], polygons[owners[j]]
+    x, y = points[i], points[j]
+    return (
+        f"the vertices ({x[0]:.4g}, {x[1]:.4g}) of {a.name!r} and "
+        f"({y[0]:.4g}, {y[1]:.4g}) of {b.name!r} at distance {distance:.3e}"
+    )
@@ -0,0 +1,192 @@
+"""Structured events parsed from the gmsh logger."""
+
+import logging
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Final, Self
+
+import gmsh
+
+LOGGER: Final = logging.getLogger("lostinmsh.gmsh")
+
+ENTITY_DIM: Final = {"point": 0, "curve": 1, "surface": 2, "volume": 3}
+
+_MESSAGE = re.compile(r"^(?P<level>\w+)\s*:\s*(?P<text>.*)$", re.DOTALL)
+_PROGRESS = re.compile(r"^\[\s*(?P<percent>\d+)%\]\s*(?P<text>.*)$", re.DOTALL)
+_START = re.compile(r"^Meshing (?P<dim>\d)D\.\.\.")
+_ENTITY = re.compile(r"^Meshing (?P<kind>point|curve|surface|volume) (?P<tag>\d+)")
+_DONE = re.compile(r"^Done meshing (?P<dim>\d)D \(Wall (?P<wall>[\d.eE+-]+)s")
+_STATISTICS = re.compile(r"^(?P<nodes>\d+) nodes (?P<elements>\d+) elements")
+
+
+@dataclass(frozen=True, slots=True)
+class GmshEvent:
+    """Event parsed from a gmsh log message.
+
+    Attributes
+    ----------
+    level : str
+        "info", "warning", "error" or "debug".
+    kind : str
+        "start" (meshing of a dimension starts), "entity" (meshing of an
+        entity), "done" (meshing of a dimension is done), "statistics" (final
+        number of nodes and elements), "warning", "error" or "message".
+    message : str
+        Message without the level and progress prefixes.
+    dim : int | None
+        Dimension being meshed.
+    entity : int | None
+        Tag of the entity being meshed.
+    index : int | None
+        The entity is the `index`-th out of `total` entities of dimension `dim`.
+    total : int | None
+        Number of entities of dimension `dim`.
+    progress : int | None
+        Progress percentage reported by gmsh.
+    wall_time : float | None
+        Wall time of the meshing of dimension `dim`.
+    nb_nodes : int | None
+    nb_elements : int | None
+    throughput : float | None
+        Number of elements generated per second of 2D meshing.
+    """
+
+    level: str
+    kind: str
+    message: str
+    dim: int | None = None
+    entity: int | None = None
+    index: int | None = None
+    total: int | None = None
+    progress: int | None = None
+    wall_time: float | None = None
+    nb_nodes: int | None = None
+    nb_elements: int | None = None
+    throughput: float | None = None
+
+    def __str__(self: Self) -> str:
+        if self.kind == "entity" and self.index is not None:
+            return f"{self.message} [{self.index}/{self.total}]"
+        return self.message
+
+
+@dataclass(slots=True)
+class GmshEventParser:
+    """Turn the messages of the gmsh logger into events.
+
+    The messages are dispatched by `flush`, between two gmsh calls: the gmsh
+    API is not thread-safe, so the logger is not polled while a call such as
+    the generation of a dimension runs, and its events come when it returns.
+
+    Attributes
+    ----------
+    handler : Callable[[GmshEvent], None]
+        Function called with each event.
+    """
+
+    handler: Callable[[GmshEvent], None]
+    _dim: int | None = field(default=None, repr=False)
+    _index: int = field(default=0, repr=False)
+    _total: int | None = field(default=None, repr=False)
+    _wall_times: dict[int, float] = field(default_factory=dict, repr=False)
+
+    def start(self: Self) -> None:
+        """Start capturing the gmsh log."""
+        gmsh.logger.start()
+        return None
+
+    def flush(self: Self) -> None:
+        """Dispatch the messages logged since the last flush."""
+        for line in gmsh.logger.get():
+            self.handler(self.parse(line))
+        return None
+
+    def stop(self: Self) -> None:
+        """Dispatch the remaining messages and stop capturing the gmsh log."""
+        self.flush()
+        gmsh.logger.stop()
+        return None
+
+    def parse(self: Self, line: str) -> GmshEvent:
+        """Parse a message of the gmsh logger.
+
+        Parameters
+        ----------
+        line : str
+            Message such as ``"Info: [ 40%] Meshing surface 3 (Plane, Delaunay)"``.
+
+        Returns
+        -------
+        GmshEvent
+        """
+        level, text = "info", line.strip()
+        if (match := _MESSAGE.match(text)) is not None:
+            level, text = match["level"].lower(), match["text"].strip()
+
+        progress: int | None = None
+        if (match := _PROGRESS.match(text)) is not None:
+            progress, text = int(match["percent"]), match["text"].strip()
+
+        if level in ("warning", "error"):
+            return GmshEvent(level, level, text, progress=progress)
+
+        if (match := _START.match(text)) is not None:
+            self._dim, self._index = int(match["dim"]), 0
+            self._total = len(gmsh.model.get_entities(self._dim))
+            return GmshEvent(level, "start", text, dim=self._dim, total=self._total)
+
+        if (match := _ENTITY.match(text)) is not None:
+            dim = ENTITY_DIM[match["kind"]]
+            if dim == self._dim:
+                self._index += 1
+            return GmshEvent(
+                level,
+                "entity",
+                text,
+                dim=dim,
+                entity=int(match["tag"]),
+                index=self._index if dim == self._dim else None,
+                total=self._total if dim == self._dim else None,
+                progress=progress,
+            )
+
+        if (match := _DONE.match(text)) is not None:
+            dim, wall_time = int(match["dim"]), float(match["wall"])
+            self._wall_times[dim] = wall_time
+            return GmshEvent(level, "done", text, dim=dim, wall_time=wall_time)
+
+        if (match := _STATISTICS.match(text)) is not None:
+            nb_elements = int(match["elements"])
+            wall_time_2d = self._wall_times.get(2)
+            return GmshEvent(
+                level,
+                "statistics",
+                text,
+                nb_nodes=int(match["nodes"]),
+                nb_elements=nb_elements,
+                throughput=nb_elements / wall_time_2d if wall_time_2d else None,
+            )
+
+        return GmshEvent(level, "message", text, progress=progress)
+
+
+def log_event(event: GmshEvent) -> None:
+    """Forward a gmsh event to the ``"lostinmsh.gmsh"`` logger of the `logging`
+    module, use it as `GmshOptions` event handler.
+
+    Parameters
+    ----------
+    event : GmshEvent
+    """
+    match event.level:
+        case "error":
+            LOGGER.error("%s", event)
+        case "warning":
+            LOGGER.warning("%s", event)
+        case "debug":
+            LOGGER.debug("%s", event)
+        case _:
+            LOGGER.info("%s", event)
+
+    return None
@@ -0,0 +1,93 @@
+"""Corner radius, corner mesh size and edge subdivision of the locally
+structured mesh."""
+
+from collections.abc import Sequence
+
+from numpy import exp, log, pi, sin, sqrt, vstack
+from scipy.spatial import ConvexHull, KDTree
+
+from ..geometry import Corner, Geometry
+from ..geometry.points import merge_points
+from ..type_alias import MatNx2
+
+
+def corner_radius(geometry: Geometry, mesh_size: float) -> float:
+    """Corner radius."""
+    return corner_radii(geometry, [mesh_size])[0]
+
+
+def corner_radii(geometry: Geometry, mesh_sizes: list[float]) -> list[float]:
+    """Corner radius for each mesh size."""
+    max_radius = max_corner_radius(geometry) * 0.5
+    return [min(1.5 * mesh_size, max_radius) for mesh_size in mesh_sizes]
+
+
+def max_corner_radius(geometry: Geometry) -> float:
+    """Maximum corner radius, the vertices shared by polygons count once."""
+    points, _ = merge_points(
+        vstack([polygon.vertices for polygon in geometry.polygons])
+    )
+
+    ch = ConvexHull(points)
+    ch_pts = points[ch.vertices]
+
+    return min(
+        min_vertex_distance(points) / 2,
+        geometry.boundary.dist_to_inner_boundary(ch_pts),
+    )
+
+
+def min_vertex_distance(points: MatNx2) -> float:
+    """Smallest distance between two distinct vertices, see `merge_points`."""
+    points, _ = merge_points(points)
+    distances, _ = KDTree(points).query(points, k=2)
+    return float(distances[:, 1].min())
+
+
+def corner_mesh_size(corner: Corner, radius: float, subdivision: int = 2) -> float:
+    """Angular mesh size of a corner whose outer ring has `subdivision` * (p, q)
+    segments."""
+    xp = 2 * sin(corner.angle / (2 * subdivision * corner.p))
+    xq = 2 * sin((2 * pi - corner.angle) / (2 * subdivision * corner.q))
+    return float(radius * sqrt(xp * xq))
+
+
+def junction_mesh_size(
+    angles: Sequence[float], subdivisions: Sequence[int], radius: float, factor: int
+) -> float:
+    """Angular mesh size of a vertex shared by polygons whose outer ring has
+    `factor` * `subdivisions` segments in the sectors of `angles`, the geometric
+    mean of the segments as `corner_mesh_size`."""
+    chords = [
+        2 * sin(angle / (2 * factor * n)) for angle, n in zip(angles, subdivisions)
+    ]
+    return float(radius * exp(log(chords).mean()))
+
+
+def edge_subdivision(
+    length: float, r0: float, rp: float, h0: float, hp: float, mesh_size: float
+) -> int:
+    """Number of points on an edge between two corners of radius r0, rp and
+    angular mesh size h0, hp."""
+    h = sqrt(mesh_size * sqrt(h0 * hp))
+    return max(2, round(1 + (length - r0 - rp) / h))
+
+
+def graded_edge_subdivision(
+    length: float, r0: float, rp: float, h0: float, hp: float, mesh_size: float
+) -> tuple[int, float]:
+    """Number of points and bump coefficient on an edge between two corners of
+    radius r0, rp and angular mesh size h0, hp, graded from the mesh size of the
+    uniform edge at both ends to `mesh_size` at mid-edge.
+
+    The bump coefficient is the ratio between the mesh size at the ends and in
+    the middle (gmsh ≥ 4.11), 1 means uniform.
+    """
+    h_end = float(sqrt(mesh_size * sqrt(h0 * hp)))
+    if h_end >= mesh_size:
+        return (edge_subdivision(length, r0, rp, h0, hp, mesh_size), 1.0)
+
+    # The density of points of a bump is quadratic, its mean is 2/3 of the
+    # density in the middle plus 1/3 of the density at the ends.
+    density = (2 / mesh_size + 1 / h_end) / 3
+    return (max(2, round(1 + (length - r0 - rp) * density)), h_end / mesh_size)
@@ -1,16 +1,96 @@
-from typing import Final
+from dataclasses import dataclass
+from typing import Callable, Final
 
 import gmsh
+from numpy import (
+    arange,
+    arccos,
+    argmin,
+    asarray,
+    ceil,
+    clip,
+    concatenate,
+    cos,
+    cumsum,
+    full_like,
+    inf,
+    interp,
+    linspace,
+    pi,
+    sin,
+    sqrt,
+)
 
 from ..circular_iterable import circular_pairwise
 from ..geometry import CircularBoundary, ExteriorBoundary, RectangularBoundary
-from ..type_alias import DimName, Tag, Vec2
+from ..type_alias import DimName, Tag, Vec2, VecN
 
 GEO: Final = gmsh.model.geo
 
+# Number of samples of the background width used to place the cuts.
+NB_SAMPLES: Final = 1024
+
+BoundaryPoint = tuple[float, tuple[float, float]]  # parameter and coordinates
+
+
+@dataclass(frozen=True, slots=True)
+class ExteriorOptions:
+    """Options of the exterior mesh.
+
+    Attributes
+    ----------
+    partition : int, default 1
+        Maximum number of vertical strips the background is cut into. The cuts
+        are placed in the gaps between the polygons, as close as possible to
+        the cuts giving strips of equal area. The strips share their interface
+        curves so the mesh stays conforming, and gmsh meshes them in parallel
+        if ``GmshOptions(nb_threads=...)`` is set.
+    thickness_layers : int | None, default None
+        If given, the thickness is meshed with this number of structured layers:
+        polar patches for a circular boundary, side and corner blocks for a
+        rectangular boundary. The node rows are then aligned with the normal
+        of the inner boundary. If None, the thickness is meshed unstructured.
+    growth_rate : float | None, default None
+        If given, the background is graded: at distance d of the polygons, the
+        mesh size is ``min(max_size, h + (growth_rate - 1) * d)`` where h is the
+        mesh size near the polygons, that is `mesh_size` or the corner mesh
+        size of the locally structured bands. Must be > 1.
+    max_size : float | None, default None
+        Far field mesh size of the graded background, also used on the
+        exterior boundary and in the thickness.
+    """
+
+    partition: int = 1
+    thickness_layers: int | None = None
+    growth_rate: float | None = None
+    max_size: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.partition < 1:
+            raise ValueError("Partition must be an integer >= 1.")
+        if self.thickness_layers is not None and self.thickness_layers < 1:
+            raise ValueError("Thickness layers must be an integer >= 1.")
+        if (self.growth_rate is None) != (self.max_size is None):
+            raise ValueError("Growth rate and max size must be given together.")
+        if self.growth_rate is not None and self.growth_rate <= 1:
+            raise ValueError("Growth rate must be > 1.")
+        if self.max_size is not None and self.max_size <= 0:
+            raise ValueError("Max size must be > 0.")
+        return None
+
+    def boundary_size(self, mesh_size: float) -> float:
+        """Mesh size on the exterior boundary."""
+        return mesh_size if self.max_size is None else self.max_size
+
 
 def mesh_exterior(
-    boundary: ExteriorBoundary, mesh_size: float, inner_loop_tags: list[Tag]
+    boundary: ExteriorBoundary,
+    mesh_size: float,
+    inner_loop_tags: list[Tag],
+    *,
+    inner_extents: list[tuple[float, float]] | None = None,
+    thickness_size: float | None = None,
+    options: ExteriorOptions = ExteriorOptions(),
 ) -> dict[DimName, list[Tag]]:
     """Mesh the exterior.
 
@@ -19,6 +99,11 @@ def mesh_exterior(
     boundary : ExteriorBoundary
     mesh_size : float
     inner_loop_tags : list[Tag]
+    inner_extents : list[tuple[float, float]] | None, optional, default None
+        Range in x of each inner loop, required to partition the background.
+    thickness_size : float | None, optional, default None
+        Mesh size of the thickness, if None same as the exterior boundary.
+    options : ExteriorOptions, optional
 
     Returns
     -------
@@ -28,34 +113,92 @@ def mesh_exterior(
     ------
     ValueError
     """
+    if options.partition > 1 and inner_extents is None:
+        raise ValueError("The extents of the inner loops are required to partition.")
+
     if isinstance(boundary, CircularBoundary):
-        return _mesh_circular(boundary, mesh_size, inner_loop_tags)
+        return _mesh_circular(
+            boundary, mesh_size, inner_loop_tags, inner_extents, thickness_size, options
+        )
 
     if isinstance(boundary, RectangularBoundary):
-        return _mesh_rectangular(boundary, mesh_size, inner_loop_tags)
+        return _mesh_rectangular(
+            boundary, mesh_size, inner_loop_tags, inner_extents, thickness_size, options
+        )
 
     raise ValueError("Unknown boundary shape.")
 
 
 def _mesh_circular(
-    circ: CircularBoundary, mesh_size: float, inner_loop_tags: list[Tag]
+    circ: CircularBoundary,
+    mesh_size: float,
+    inner_loop_tags: list[Tag],
+    inner_extents: list[tuple[float, float]] | None,
+    thickness_size: float | None,
+    options: ExteriorOptions,
 ) -> dict[DimName, list[Tag]]:
     """Mesh circular mesh."""
-    ct = GEO.add_point(circ.center[0], circ.center[1], 0, mesh_size)
+    size = options.boundary_size(mesh_size)
+    if thickness_size is None:
+        thickness_size = size
+    (cx, cy), radius = circ.center, circ.radius
+    ct = GEO.add_point(cx, cy, 0, size)
+
+    def height(x: VecN) -> VecN:
+        return 2 * sqrt(clip(radius**2 - (x - cx) ** 2, 0, None))
 
-    line_tags = _loop_circle(ct, circ.center, circ.radius, mesh_size)
+    # The quarter points keep every arc shorter than pi.
+    points: list[BoundaryPoint] = [
+        (0.0, (cx + radius, cy)),
+        (pi / 2, (cx, cy + radius)),
+        (pi, (cx - radius, cy)),
+        (3 * pi / 2, (cx, cy - radius)),
+    ]
+    cuts: list[tuple[BoundaryPoint, BoundaryPoint]] = []
+    for x in _cut_positions(
+        (cx - radius, cx + radius),
+        height,
+        inner_extents,
+        options.partition,
+        mesh_size,
+    ):
+        y = float(sqrt(radius**2 - (x - cx) ** 2))
+        angle = float(arccos((x - cx) / radius))
+        cuts.append(((2 * pi - angle, (x, cy - y)), (angle, (x, cy + y))))
+
+    points = _merge_points(points, cuts, 2 * pi)
+    point_tags = [GEO.add_point(x, y, 0, size) for _, (x, y) in points]
+    line_tags = [GEO.add_circle_arc(a, ct, b) for a, b in circular_pairwise(point_tags)]
     loop_tag_inn = GEO.add_curve_loop(line_tags)
 
     domain_tags = {
-        (2, circ.background_name): [
-            GEO.add_plane_surface([loop_tag_inn, *inner_loop_tags])
-        ],
+        (2, circ.background_name): _add_strips(
+            points,
+            point_tags,
+            line_tags,
+            loop_tag_inn,
+            cuts,
+            inner_loop_tags,
+            inner_extents,
+        ),
         (1, f"{circ.background_name}_boundary"): line_tags,
     }
 
-    if circ.thickness is not None:
+    if circ.thickness is not None and options.thickness_layers is not None:
+        domain_tags.update(
+            _circular_layers(
+                ct,
+                circ,
+                points,
+                point_tags,
+                line_tags,
+                thickness_size,
+                options.thickness_layers,
+            )
+        )
+    elif circ.thickness is not None:
         line_tags = _loop_circle(
-            ct, circ.center, circ.radius + circ.thickness, mesh_size
+            ct, circ.center, circ.radius + circ.thickness, thickness_size
         )
 
         domain_tags.update(
@@ -87,25 +230,122 @@ def _loop_circle(
     return line_tags
 
 
+def _circular_layers(
+    center_tag: Tag,
+    circ: CircularBoundary,
+    points: list[BoundaryPoint],
+    point_tags: list[Tag],
+    line_tags: list[Tag],
+    mesh_size: float,
+    nb_layers: int,
+) -> dict[DimName, list[Tag]]:
+    """Polar structured mesh of the thickness, one patch per inner arc."""
+    assert circ.thickness is not None
+
+    (cx, cy), radius = circ.center, circ.radius + circ.thickness
+    outer_tags = [
+        GEO.add_point(cx + radius * cos(t), cy + radius * sin(t), 0, mesh_size)
+        for t, _ in points
+    ]
+    spoke_tags = [GEO.add_line(a, b) for a, b in zip(point_tags, outer_tags)]
+    arc_tags = [
+        GEO.add_circle_arc(a, center_tag, b) for a, b in circular_pairwise(outer_tags)
+    ]
+
+    for t in spoke_tags:
+        GEO.mesh.set_transfinite_curve(t, nb_layers + 1)
+
+    surface_tags: list[Tag] = []
+    for i, ((t0, _), (t1, _)) in enumerate(circular_pairwise(points)):
+        n = _nb_nodes(circ.radius * ((t1 - t0) % (2 * pi)), mesh_size)
+        GEO.mesh.set_transfinite_curve(line_tags[i], n)
+        GEO.mesh.set_transfinite_curve(arc_tags[i], n)
+
+        j = (i + 1) % len(points)
+        surface_tags.append(
+            GEO.add_plane_surface(
+                [
+                    GEO.add_curve_loop(
+                        [-line_tags[i], spoke_tags[i], arc_tags[i], -spoke_tags[j]]
+                    )
+                ]
+            )
+        )
+        GEO.mesh.set_transfinite_surface(surface_tags[-1])
+
+    return {
+        (2, circ.thickness_name): surface_tags,
+        (1, f"{circ.thickness_name}_boundary"): arc_tags,
+    }
+
+
 def _mesh_rectangular(
-    rect: RectangularBoundary, mesh_size: float, inner_loop_tags: list[Tag]
+    rect: RectangularBoundary,
+    mesh_size: float,
+    inner_loop_tags: list[Tag],
+    inner_extents: list[tuple[float, float]] | None,
+    thickness_size: float | None,
+    options: ExteriorOptions,
 ) -> dict[DimName, list[Tag]]:
     """Mesh rectangular mesh."""
-    line_tags = _loop_rectangle(rect.corner_low, rect.corner_high, mesh_size)
+    size = options.boundary_size(mesh_size)
+    if thickness_size is None:
+        thickness_size = size
+    (xl, yl), (xh, yh) = rect.corner_low, rect.corner_high
+    width, height = xh - xl, yh - yl
+
+    # The parameter is the arc length from the lower left corner.
+    points: list[BoundaryPoint] = [
+        (0.0, (xl, yl)),
+        (width, (xh, yl)),
+        (width + height, (xh, yh)),
+        (2 * width + height, (xl, yh)),
+    ]
+    cuts: list[tuple[BoundaryPoint, BoundaryPoint]] = [
+        ((x - xl, (x, yl)), (width + height + xh - x, (x, yh)))
+        for x in _cut_positions(
+            (xl, xh),
+            lambda x: full_like(x, height),
+            inner_extents,
+            options.partition,
+            mesh_size,
+        )
+    ]
+
+    points = _merge_points(points, cuts, 2 * (width + height))
+    point_tags = [GEO.add_point(x, y, 0, size) for _, (x, y) in points]
+    line_tags = [GEO.add_line(a, b) for a, b in circular_pairwise(point_tags)]
     loop_tag_inn = GEO.add_curve_loop(line_tags)
 
     domain_tags = {
-        (2, rect.background_name): [
-            GEO.add_plane_surface([loop_tag_inn, *inner_loop_tags])
-        ],
+        (2, rect.background_name): _add_strips(
+            points,
+            point_tags,
+            line_tags,
+            loop_tag_inn,
+            cuts,
+            inner_loop_tags,
+            inner_extents,
+        ),
         (1, f"{rect.background_name}_boundary"): line_tags,
     }
 
-    if rect.thickness is not None:
+    if rect.thickness is not None and options.thickness_layers is not None:
+        domain_tags.update(
+            _rectangular_layers(
+                rect,
+                points,
+                point_tags,
+                line_tags,
+                thickness_size,
+                options.thickness_layers,
+            )
+        )
+    elif rect.thickness is not None:
         line_tags = _loop_rectangle(
             rect.corner_low - rect.thickness,
             rect.corner_high + rect.thickness,
-            mesh_size,
+            thickness_size,
         )
         loop_tag_out = GEO.add_curve_loop(line_tags)
         domain_tags.update(
@@ -120,6 +360,103 @@ def _mesh_rectangular(
     return domain_tags
 
 
+def _rectangular_layers(
+    rect: RectangularBoundary,
+    points: list[BoundaryPoint],
+    point_tags: list[Tag],
+    line_tags: list[Tag],
+    mesh_size: float,
+    nb_layers: int,
+) -> dict[DimName, list[Tag]]:
+    """Structured mesh of the thickness, one block per inner side and one square
+    block per corner."""
+    assert rect.thickness is not None
+
+    thickness = rect.thickness
+    width, height = rect.corner_high - rect.corner_low
+    corners = [0.0, width, width + height, 2 * width + height]
+    normals = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+
+    def offset(point: tuple[float, float], *sides: int) -> Tag:
+        x = point[0] + thickness * sum(normals[k][0] for k in sides)
+        y = point[1] + thickness * sum(normals[k][1] for k in sides)
+        return GEO.add_point(x, y, 0, mesh_size)
+
+    # Outer points and spokes before and after each inner point.
+    spokes: list[tuple[Tag, Tag]] = []
+    outer_points: list[tuple[Tag, Tag]] = []
+    surface_tags: list[Tag] = []
+    boundary_tags: list[list[Tag]] = []
+    for (t, point), tag in zip(points, point_tags):
+        side = max(k for k, corner in enumerate(corners) if corner <= t)
+        if t != corners[side]:
+            outer = offset(point, side)
+            spoke = GEO.add_line(tag, outer)
+            GEO.mesh.set_transfinite_curve(spoke, nb_layers + 1)
+            spokes.append((spoke, spoke))
+            outer_points.append((outer, outer))
+            boundary_tags.append([])
+            continue
+
+        before, diagonal, after = (
+            offset(point, side - 1),
+            offset(point, side - 1, side),
+            offset(point, side),
+        )
+        corner_tags = [
+            GEO.add_line(tag, before),
+            GEO.add_line(before, diagonal),
+            GEO.add_line(diagonal, after),
+            GEO.add_line(tag, after),
+        ]
+        for c in corner_tags:
+            GEO.mesh.set_transfinite_curve(c, nb_layers + 1)
+
+        surface_tags.append(
+            GEO.add_plane_surface(
+                [GEO.add_curve_loop([*corner_tags[:3], -corner_tags[3]])]
+            )
+        )
+        GEO.mesh.set_transfinite_surface(surface_tags[-1])
+
+        spokes.append((corner_tags[0], corner_tags[3]))
+        outer_points.append((before, after))
+        boundary_tags.append(corner_tags[1:3])
+
+    period = 2 * (width + height)
+    for i, ((t0, _), (t1, _)) in enumerate(circular_pairwise(points)):
+        j = (i + 1) % len(points)
+        side_tag = GEO.add_line(outer_points[i][1], outer_points[j][0])
+        boundary_tags[i].append(side_tag)
+
+        n = _nb_nodes((t1 - t0) % period, mesh_size)
+        GEO.mesh.set_transfinite_curve(line_tags[i], n)
+        GEO.mesh.set_transfinite_curve(side_tag, n)
+
+        surface_tags.append(
+            GEO.add_plane_surface(
+                [
+                    GEO.add_curve_loop(
+                        [-line_tags[i], spokes[i][1], side_tag, -spokes[j][0]]
+                    )
+                ]
+            )
+        )
+        GEO.mesh.set_transfinite_surface(surface_tags[-1])
+
+    return {
+        (2, rect.thickness_name): surface_tags,
+        (1, f"{rect.thickness_name}_boundary"): [
+            tag for tags in boundary_tags for tag in tags
+        ],
+    }
+
+
+def _nb_nodes(length: float, mesh_size: float) -> int:
+    """Number of nodes of a transfinite curve of length `length`."""
+    return max(2, int(ceil(length / mesh_size)) + 1)
+
+
 def _loop_rectangle(corner_low: Vec2, corner_high: Vec2, mesh_size: float) -> list[Tag]:
     """Return loop corresponding to a rectangle."""
     point_tags = [
@@ -135,3 +472,118 @@ def _loop_rectangle(corner_low: Vec2, corner_high: Vec2, mesh_size: float) -> li
     line_tags = [GEO.add_line(a, b) for a, b in circular_pairwise(point_tags)]
 
     return line_tags
+
+
+def _cut_positions(
+    x_range: tuple[float, float],
+    height: Callable[[VecN], VecN],
+    inner_extents: list[tuple[float, float]] | None,
+    partition: int,
+    margin: float,
+) -> list[float]:
+    """Abscissas of the vertical cuts of the background.
+
+    The cuts giving strips of equal area are moved in the closest gap between
+    the inner loops, at a distance `margin` from them and from each other.
+    """
+    if partition == 1 or inner_extents is None:
+        return []
+
+    x_min, x_max = x_range
+    x = linspace(x_min, x_max, NB_SAMPLES)
+    y = height(x)
+    area = concatenate(([0.0], cumsum(y[1:] + y[:-1])))
+    targets = interp(arange(1, partition) / partition, area / area[-1], x)
+
+    gaps: list[tuple[float, float]] = []
+    start = x_min + margin
+    for lower, upper in sorted(inner_extents):
+        if lower - margin > start:
+            gaps.append((start, lower - margin))
+        start = max(start, upper + margin)
+    if start < x_max - margin:
+        gaps.append((start, x_max - margin))
+
+    cuts: list[float] = []
+    for target in targets:
+        candidates = [min(max(float(target), lo), hi) for lo, hi in gaps]
+        if not candidates:
+            break
+        best = min(candidates, key=lambda c: abs(c - target))
+        if all(abs(best - c) >= margin for c in cuts):
+            cuts.append(best)
+
+    return sorted(cuts)
+
+
+def _merge_points(
+    points: list[BoundaryPoint],
+    cuts: list[tuple[BoundaryPoint, BoundaryPoint]],
+    period: float,
+) -> list[BoundaryPoint]:
+    """Sort the boundary points by parameter, the ends of the cuts that coincide
+    with a corner are merged with it."""
+    merged = list(points)
+    for point in (point for cut in cuts for point in cut):
+        if all(abs(point[0] - t) > 1e-12 * period for t, _ in merged):
+            merged.append(point)
+
+    return sorted(merged)
+
+
+def _add_strips(
+    points: list[BoundaryPoint],
+    point_tags: list[Tag],
+    line_tags: list[Tag],
+    loop_tag: Tag,
+    cuts: list[tuple[BoundaryPoint, BoundaryPoint]],
+    inner_loop_tags: list[Tag],
+    inner_extents: list[tuple[float, float]] | None,
+) -> list[Tag]:
+    """Add the strips of the background between the cuts, sorted by abscissa.
+
+    The boundary curves go counterclockwise from `points[i]` to `points[i+1]`.
+    """
+    if not cuts:
+        return [GEO.add_plane_surface([loop_tag, *inner_loop_tags])]
+
+    assert inner_extents is not None
+
+    params = asarray([t for t, _ in points])
+    n = len(line_tags)
+
+    def index(point: BoundaryPoint) -> int:
+        return int(argmin(abs(params - point[0])))
+
+    def chain(start: int, end: int) -> list[Tag]:
+        return [line_tags[(start + k) % n] for k in range((end - start) % n or n)]
+
+    ends = [(index(bottom), index(top)) for bottom, top in cuts]
+    cut_tags = [GEO.add_line(point_tags[b], point_tags[t]) for b, t in ends]
+    xs = [bottom[1][0] for bottom, _ in cuts]
+
+    bounds = [-inf, *xs, inf]
+    surface_tags: list[Tag] = []
+    for k in range(len(cuts) + 1):
+        # Counterclockwise: right cut upward, top side, left cut downward and
+        # bottom side.
+        if k == 0:
+            curves = [cut_tags[k], *chain(ends[k][1], ends[k][0])]
+        elif k == len(cuts):
+            curves = [-cut_tags[k - 1], *chain(ends[k - 1][0], ends[k - 1][1])]
+        else:
+            curves = [
+                cut_tags[k],
+                *chain(ends[k][1], ends[k - 1][1]),
+                -cut_tags[k - 1],
+                *chain(ends[k - 1][0], ends[k][0]),
+            ]
+
+        holes = [
+            tag
+            for tag, (lower, upper) in zip(inner_loop_tags, inner_extents)
+            if bounds[k] < (lower + upper) / 2 < bounds[k + 1]
+        ]
+        surface_tags.append(GEO.add_plane_surface([GEO.add_curve_loop(curves), *holes]))
+
+    return surface_tags
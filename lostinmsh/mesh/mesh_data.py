@@ -0,0 +1,226 @@
+"""Triangle mesh in memory."""
+
+from dataclasses import dataclass, field
+from pathlib import PurePath
+from typing import Any, Self
+
+import gmsh
+from numpy import (
+    arange,
+    argsort,
+    column_stack,
+    concatenate,
+    empty,
+    full,
+    int64,
+    maximum,
+    minimum,
+    sqrt,
+    stack,
+    unique,
+    zeros,
+)
+from numpy.typing import NDArray
+
+from ..type_alias import IntArray, MatNx2, VecN
+
+
+@dataclass(frozen=True, slots=True)
+class MeshData:
+    """Triangle mesh of order k.
+
+    Attributes
+    ----------
+    nodes : MatNx2
+        Coordinates of the nodes.
+    triangles : IntArray
+        Indices in `nodes` of the nodes of each triangle in the gmsh ordering,
+        the 3 vertices first, shape (M, (k + 1)(k + 2)/2).
+    element_tags : IntArray
+        Tag of each triangle in the mesh file, shape (M,).
+    physical_tags : IntArray | None, default None
+        Tag of the physical group of each triangle, 0 if none, shape (M,).
+    physical_names : dict[int, str], default {}
+        Name of the physical groups by tag.
+    """
+
+    nodes: MatNx2
+    triangles: IntArray
+    element_tags: IntArray
+    physical_tags: IntArray | None = None
+    physical_names: dict[int, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_msh(cls, filename: PurePath | str) -> Self:
+        """Read the triangles of a mesh file, sorted by element tag.
+
+        The triangles of higher order are reduced to their vertices.
+
+        Parameters
+        ----------
+        filename : PurePath | str
+
+        Returns
+        -------
+        MeshData
+
+        Raises
+        ------
+        ValueError
+            If the mesh has 2D elements other than triangles.
+        """
+        gmsh.initialize()
+        try:
+            gmsh.option.set_number("General.Terminal", 0)
+            gmsh.open(str(filename))
+
+            node_tags, coord, _ = gmsh.model.mesh.get_nodes()
+            element_tags: list[IntArray] = []
+            vertex_tags: list[IntArray] = []
+            physical_tags: list[IntArray] = []
+            for _, entity in gmsh.model.get_entities(2):
+                physical = gmsh.model.get_physical_groups_for_entity(2, entity)
+                for element_type, tags, nodes in zip(
+                    *gmsh.model.mesh.get_elements(2, entity)
+                ):
+                    name, _, _, nb_nodes, _, _ = gmsh.model.mesh.get_element_properties(
+                        element_type
+                    )
+                    if not name.startswith("Triangle"):
+                        raise ValueError(f"{name} elements are not supported.")
+
+                    element_tags.append(tags)
+                    vertex_tags.append(nodes.reshape(-1, nb_nodes)[:, :3])
+                    physical_tags.append(
+                        full(tags.size, physical[0] if len(physical) else 0)
+                    )
+
+            physical_names = {
+                tag: gmsh.model.get_physical_name(2, tag)
+                for _, tag in gmsh.model.get_physical_groups(2)
+            }
+        finally:
+            gmsh.finalize()
+
+        tags = concatenate(element_tags)
+        order = argsort(tags)
+
+        index = empty(int(node_tags.max()) + 1, dtype=int)
+        index[node_tags] = arange(node_tags.size)
+        used, triangles = unique(concatenate(vertex_tags)[order], return_inverse=True)
+
+        return cls(
+            coord.reshape(-1, 3)[index[used], :2],
+            triangles.reshape(-1, 3),
+            tags[order],
+            concatenate(physical_tags)[order],
+            physical_names,
+        )
+
+    def write(self: Self, filename: PurePath | str) -> None:
+        """Write the mesh and its physical groups to a mesh file.
+
+        The triangles of each physical group are a discrete surface, the
+        triangles without physical group are not saved if there are groups.
+
+        Parameters
+        ----------
+        filename : PurePath | str
+        """
+        nb_nodes, nb_triangles = self.nodes.shape[0], self.triangles.shape[0]
+        physical_tags = (
+            self.physical_tags
+            if self.physical_tags is not None
+            else zeros(nb_triangles, dtype=int)
+        )
+
+        gmsh.initialize()
+        try:
+            gmsh.option.set_number("General.Terminal", 0)
+            gmsh.model.add(PurePath(filename).stem)
+            element_type = gmsh.model.mesh.get_element_type("Triangle", self.order())
+
+            for k, tag in enumerate(unique(physical_tags).tolist()):
+                entity = gmsh.model.add_discrete_entity(2)
+                if k == 0:
+                    gmsh.model.mesh.add_nodes(
+                        2,
+                        entity,
+                        arange(1, nb_nodes + 1),
+                        column_stack((self.nodes, zeros(nb_nodes))).ravel(),
+                    )
+
+                mask = physical_tags == tag
+                gmsh.model.mesh.add_elements_by_type(
+                    entity,
+                    element_type,
+                    self.element_tags[mask],
+                    (self.triangles[mask] + 1).ravel(),
+                )
+                if tag != 0:
+                    gmsh.model.add_physical_group(
+                        2, [entity], tag, name=self.physical_names.get(tag, "")
+                    )
+
+            gmsh.write(str(filename))
+        finally:
+            gmsh.finalize()
+
+        return None
+
+    def select(self: Self, mask: NDArray[Any]) -> Self:
+        """Mesh of the triangles where `mask` is True, with the same nodes."""
+        return type(self)(
+            self.nodes,
+            self.triangles[mask],
+            self.element_tags[mask],
+            None if self.physical_tags is None else self.physical_tags[mask],
+            self.physical_names,
+        )
+
+    def order(self: Self) -> int:
+        """Order k of the triangles."""
+        return int(round((sqrt(8 * self.triangles.shape[1] + 1) - 3) / 2))
+
+    def vertices(self: Self) -> IntArray:
+        """Indices in `nodes` of the vertices of each triangle, shape (M, 3)."""
+        return self.triangles[:, :3]
+
+    def edges(self: Self) -> tuple[IntArray, IntArray]:
+        """Edges of the triangles.
+
+        Returns
+        -------
+        tuple[IntArray, IntArray]
+            The vertices of each edge, the smallest index first, shape (E, 2),
+            and the index of the edges (ab, bc, ca) of each triangle (abc),
+            shape (M, 3).
+        """
+        nb_nodes = self.nodes.shape[0]
+        a, b, c = self.vertices().astype(int64).T
+
+        first = concatenate((a, b, c))
+        second = concatenate((b, c, a))
+        keys = minimum(first, second) * nb_nodes + maximum(first, second)
+        edges, inverse = unique(keys, return_inverse=True)
+
+        return (
+            stack((edges // nb_nodes, edges % nb_nodes), axis=1),
+            inverse.reshape(3, -1).T,
+        )
+
+    def centroids(self: Self) -> MatNx2:
+        """Centroid of each triangle."""
+        return self.nodes[self.vertices()].mean(axis=1)
+
+    def areas(self: Self) -> VecN:
+        """Area of each triangle."""
+        a, b, c = (self.nodes[self.triangles[:, k]] for k in range(3))
+        u, v = b - a, c - a
+        return abs(u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]) / 2
+
+    def sizes(self: Self) -> VecN:
+        """Mesh size of each triangle, the mean length of its edges."""
+        points = self.nodes[self.vertices()]
+        edges = points - points[:, [1, 2, 0]]
+        return sqrt((edges**2).sum(axis=2)).mean(axis=1)
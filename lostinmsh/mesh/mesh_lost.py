@@ -1,24 +1,37 @@
 """T-conform mesh a polygon."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import partial
 from itertools import chain
 from pathlib import PurePath
 from typing import Final, Self
 
 import gmsh
-from numpy import concatenate, cos, linspace, pi, sin, sqrt, vstack
-from scipy.spatial import ConvexHull
-from scipy.spatial.distance import pdist
+from numpy import pi
 
-from ..circular_iterable import circular, circular_pairwise
-from ..compatibility import batched
+from ..circular_iterable import circular_pairwise
 from ..geometry import Corner, Geometry, Polygon
 from ..type_alias import Tag, Vec2
+from .algorithm import set_exterior_algorithms
+from .budget import MeshBudget, mesh_within_budget
 from .context_manager import GmshContextManager, GmshOptions
-from .mesh_boundary import mesh_exterior
+from .corner_patch import CornerOptions, corner_template, patch_points
+from .lost_parameters import (
+    corner_mesh_size,
+    corner_radii,
+    edge_subdivision,
+    graded_edge_subdivision,
+)
+from .mesh_boundary import ExteriorOptions, mesh_exterior
+from .mesh_size import MeshSize, MeshSizes
+from .shared_edges import build_shared, check_shared_topology, has_shared_vertices
+from .size_field import SizeMap, SizeSource, graded_fields, set_background_field
 
 GEO: Final = gmsh.model.geo
 
+RECOMBINE: Final = (None, "structured", "all")
+
 
 @dataclass(frozen=True, slots=True)
 class CornerTag:
@@ -47,60 +60,221 @@ class CornerTag:
 
 
 def mesh_locally_structured(
-    geometry: Geometry, mesh_size: float, gmsh_options: GmshOptions = GmshOptions()
+    geometry: Geometry,
+    mesh_size: MeshSize,
+    gmsh_options: GmshOptions = GmshOptions(),
+    *,
+    target_elements: int | None = None,
+    target_dofs: int | None = None,
+    exterior_options: ExteriorOptions = ExteriorOptions(),
+    graded_edges: bool = False,
+    corner_options: CornerOptions = CornerOptions(),
+    recombine: str | None = None,
 ) -> PurePath | None:
     """T-conform mesh a polygon.
 
+    The polygons may share vertices and whole edges, as in a tiling of several
+    materials: each shared vertex is meshed once by a patch with a sector for
+    each polygon around it, and each shared edge by a strip on each side.
+
     Parameters
     ----------
     geometry : Geometry
-    mesh_size : float
+    mesh_size : float | Mapping[str, float]
+        Mesh size, or size of the coarse calibration mesh if a target is given.
+        A mapping gives the mesh size of each region by name: polygons,
+        background and thickness, the background is required and is the
+        default of the other regions. The corner radius, the corner mesh size
+        and the edge subdivision of a polygon follow its mesh size.
     gmsh_options: GmshOptions, optional
+    target_elements : int | None, optional, default None
+        If given, use the smallest mesh size such that the mesh has at most
+        `target_elements` triangles.
+    target_dofs : int | None, optional, default None
+        If given, use the smallest mesh size such that the mesh of order
+        `element_order` has at most `target_dofs` nodes.
+    exterior_options : ExteriorOptions, optional
+        Options of the exterior mesh, such as the partition of the background.
+    graded_edges : bool, optional, default False
+        If True, the mesh size along the edges grows from the size of the
+        uniform edge next to the corners to the mesh size at mid-edge with a
+        bump distribution, so long edges have fewer points for the same
+        corner accuracy.
+    corner_options : CornerOptions, optional
+        Number of rings, radial ratio and angular refinement of the corners.
+    recombine : str | None, optional, default None
+        If "structured", the structured bands along the edges, and the rings
+        of the corners without angular refinement, are recombined into
+        quadrangles, the other elements stay triangles. If "all", the
+        unstructured surfaces are also recombined into a quad-dominant mesh.
+
+    Raises
+    ------
+    ValueError
+        If a target is given with a mapping of mesh sizes, if the mapping is
+        not valid for `MeshSizes`, if `recombine` is not None, "structured" or
+        "all", or if polygons sharing vertices overlap or have a vertex inside
+        an edge of another.
     """
+    if recombine not in RECOMBINE:
+        raise ValueError('Recombine must be None, "structured" or "all".')
+    if has_shared_vertices(geometry):
+        # Check the topology before gmsh is initialized.
+        check_shared_topology(geometry)
+
+    if target_elements is not None or target_dofs is not None:
+        if isinstance(mesh_size, Mapping):
+            raise ValueError("A target requires a scalar mesh size.")
+        budget = MeshBudget(
+            target_elements, target_dofs, gmsh_options.key_val["Mesh.ElementOrder"]
+        )
+        mesh_within_budget(
+            partial(
+                _build_lost,
+                exterior_options=exterior_options,
+                graded_edges=graded_edges,
+                corner_options=corner_options,
+                recombine=recombine,
+            ),
+            "locally_structured",
+            geometry,
+            mesh_size,
+            gmsh_options,
+            budget,
+            graded_edges=graded_edges,
+            corner_options=corner_options,
+        )
+        return gmsh_options.filename
+
+    # Check the mesh sizes before gmsh is initialized.
+    MeshSizes.from_mesh_size(geometry, mesh_size)
     with GmshContextManager(gmsh_options) as ctx:
-        corner_radius = min(1.5 * mesh_size, _max_corner_radius(geometry) * 0.5)
+        _build_lost(
+            ctx,
+            geometry,
+            mesh_size,
+            exterior_options,
+            graded_edges,
+            corner_options,
+            recombine,
+        )
 
-        loop_tags: list[Tag] = []
-        surface_tags_out: list[Tag] = []
-        for polygon in geometry.polygons:
-            loop_tag, st_inn, st_out, poly_lt_bdy = _mesh_lost_polygon(
-                polygon, corner_radius, mesh_size
-            )
-            loop_tags.append(loop_tag)
-            surface_tags_out.extend(st_out)
-
-            ctx.update_domain_tags(
-                {
-                    (2, polygon.name): st_inn,
-                    (1, f"{polygon.name}_boundary"): poly_lt_bdy,
-                }
-            )
+    return gmsh_options.filename
 
-        ctx.update_domain_tags(
-            {(2, geometry.boundary.background_name): surface_tags_out}
-        )
 
-        dom_tags = mesh_exterior(geometry.boundary, mesh_size, loop_tags)
-        ctx.update_domain_tags(dom_tags)
+def _build_lost(
+    ctx: GmshContextManager,
+    geometry: Geometry,
+    mesh_size: MeshSize,
+    exterior_options: ExteriorOptions = ExteriorOptions(),
+    graded_edges: bool = False,
+    corner_options: CornerOptions = CornerOptions(),
+    recombine: str | None = None,
+    size_map: SizeMap | None = None,
+) -> None:
+    """Build the CAD model of the locally structured mesh."""
+    if has_shared_vertices(geometry):
+        build_shared(
+            ctx,
+            geometry,
+            mesh_size,
+            exterior_options,
+            graded_edges,
+            corner_options,
+            recombine,
+            size_map,
+        )
+        return None
 
-    return gmsh_options.filename
+    sizes = MeshSizes.from_mesh_size(geometry, mesh_size)
+    radii = corner_radii(geometry, [sizes[p.name] for p in geometry.polygons])
 
+    loop_tags: list[Tag] = []
+    surface_tags_out: list[Tag] = []
+    unstructured_tags: list[Tag] = []
+    sources: dict[float, SizeSource] = {}
+    corner_sources: dict[float, SizeSource] = {}
+    for polygon, radius in zip(geometry.polygons, radii):
+        h = sizes[polygon.name]
+        loop_tag, st_inn, st_out, poly_lt_bdy, corner_tags = _mesh_lost_polygon(
+            polygon, radius, h, graded_edges, corner_options, recombine is not None
+        )
+        loop_tags.append(loop_tag)
+        # The last inner surface is the unstructured interior of the polygon.
+        unstructured_tags.append(st_inn[-1])
+        surface_tags_out.extend(st_out)
 
-def _max_corner_radius(geometry: Geometry) -> float:
-    """Maximum corner radius."""
-    points = vstack([polygon.vertices for polygon in geometry.polygons])
+        sources.setdefault(h, SizeSource(h)).curve_tags.extend(poly_lt_bdy)
+        for ct in corner_tags:
+            # Corners with the same mesh size share a distance field.
+            source = corner_sources.setdefault(float(f"{ct.h:.6g}"), SizeSource(ct.h))
+            source.point_tags.extend(ct.pt)
 
-    ch = ConvexHull(points)
-    ch_pts = points[ch.vertices]
+        ctx.update_domain_tags(
+            {
+                (2, polygon.name): st_inn,
+                (1, f"{polygon.name}_boundary"): poly_lt_bdy,
+            }
+        )
 
-    return min(
-        pdist(points).min() / 2, geometry.boundary.dist_to_inner_boundary(ch_pts)
+    ctx.update_domain_tags({(2, geometry.boundary.background_name): surface_tags_out})
+
+    # The outer loop of a polygon is at distance radius of its vertices.
+    dom_tags = mesh_exterior(
+        geometry.boundary,
+        sizes.default,
+        loop_tags,
+        inner_extents=[
+            (
+                float(polygon.vertices[:, 0].min()) - radius,
+                float(polygon.vertices[:, 0].max()) + radius,
+            )
+            for polygon, radius in zip(geometry.polygons, radii)
+        ],
+        thickness_size=sizes.get(geometry.boundary.thickness_name),
+        options=exterior_options,
     )
+    ctx.update_domain_tags(dom_tags)
+
+    field_tags = [] if size_map is None else [size_map.add_field()]
+    if exterior_options.growth_rate is not None:
+        assert exterior_options.max_size is not None
+        field_tags.extend(
+            graded_fields(
+                [*sources.values(), *corner_sources.values()],
+                exterior_options.growth_rate,
+                exterior_options.max_size,
+            )
+        )
+    if field_tags:
+        set_background_field(field_tags)
+
+    if ctx.options.mesh_algorithm == "auto":
+        inner_mesh_size = min(
+            corner_mesh_size(corner, radius, corner_options.subdivisions()[-1])
+            for polygon, radius in zip(geometry.polygons, radii)
+            for corner in polygon.corners
+        )
+        set_exterior_algorithms(geometry, sizes.default, inner_mesh_size, dom_tags)
+
+    if recombine == "all":
+        unstructured_tags.extend(
+            chain.from_iterable(tags for (dim, _), tags in dom_tags.items() if dim == 2)
+        )
+        for t in unstructured_tags:
+            GEO.mesh.set_recombine(2, t)
+
+    return None
 
 
 def _mesh_lost_polygon(
-    polygon: Polygon, corner_radius: float, mesh_size: float
-) -> tuple[Tag, list[Tag], list[Tag], list[Tag]]:
+    polygon: Polygon,
+    corner_radius: float,
+    mesh_size: float,
+    graded_edges: bool,
+    corner_options: CornerOptions,
+    recombine: bool,
+) -> tuple[Tag, list[Tag], list[Tag], list[Tag], list[CornerTag]]:
     """T-conform mesh of a polygon."""
     surface_tags_inn: list[Tag] = []
     surface_tags_out: list[Tag] = []
@@ -109,7 +283,7 @@ def _mesh_lost_polygon(
     corner_tags: list[CornerTag] = []
     for vertex, corner in zip(polygon.vertices, polygon.corners):
         corner_tag, st_inn, st_out, poly_lts_bdy = _mesh_lost_corner(
-            vertex, corner, corner_radius
+            vertex, corner, corner_radius, corner_options, recombine
         )
         corner_tags.append(corner_tag)
         surface_tags_inn.extend(st_inn)
@@ -122,7 +296,9 @@ def _mesh_lost_polygon(
         lt_inn.extend(ct0.get_lt_inn()[::-1])
         lt_out.extend(ct0.get_lt_out())
 
-        lti, lto, sti, sto, poly_lt_bdy = _mesh_lost_edge(ct0, ctp, length, mesh_size)
+        lti, lto, sti, sto, poly_lt_bdy = _mesh_lost_edge(
+            ct0, ctp, length, mesh_size, graded_edges, recombine
+        )
         lt_inn.append(lti)
         lt_out.append(lto)
         surface_tags_inn.append(sti)
@@ -132,99 +308,83 @@ def _mesh_lost_polygon(
     surface_tags_inn.append(GEO.add_plane_surface([GEO.add_curve_loop(lt_inn)]))
 
     loop_tag_out: Tag = GEO.add_curve_loop(lt_out)
-    return (loop_tag_out, surface_tags_inn, surface_tags_out, poly_line_tags)
+    return (
+        loop_tag_out,
+        surface_tags_inn,
+        surface_tags_out,
+        poly_line_tags,
+        corner_tags,
+    )
 
 
 def _mesh_lost_corner(
-    center: Vec2, corner: Corner, radius: float
+    center: Vec2,
+    corner: Corner,
+    radius: float,
+    options: CornerOptions,
+    recombine: bool,
 ) -> tuple[CornerTag, list[Tag], list[Tag], list[Tag]]:
-    """T-conform mesh of a corner."""
-    xp = 2 * sin(corner.angle / (4 * corner.p))
-    xq = 2 * sin((2 * pi - corner.angle) / (4 * corner.q))
-    h_corner = radius * sqrt(xp * xq)
-
-    c_tag: Tag = GEO.add_point(center[0], center[1], 0)
-
-    # corner.angle = angles_inn[corner.p] = angles_out[2*corner.p]
-    angles0 = concatenate(
-        (
-            linspace(0, corner.angle, num=corner.p + 1)[0:-1],
-            linspace(corner.angle, 2 * pi, num=corner.q + 1)[0:-1],
-        ),
-    )
-    angles1 = concatenate(
-        (
-            linspace(0, corner.angle, num=2 * corner.p + 1)[0:-1],
-            linspace(corner.angle, 2 * pi, num=2 * corner.q + 1)[0:-1],
-        ),
+    """T-conform mesh of a corner, from the template of its angle and (p, q)
+    rotated by `corner.axis`, scaled by the radius and moved to the vertex."""
+    template = corner_template(corner, options)
+    h_corner = corner_mesh_size(corner, radius, options.subdivisions()[-1])
+
+    points = patch_points(
+        center,
+        corner.axis,
+        radius,
+        (corner.angle, 2 * pi - corner.angle),
+        (corner.p, corner.q),
+        options,
     )
+    pt: list[Tag] = [GEO.add_point(center[0], center[1], 0)]
+    pt.extend(GEO.add_point(x, y, 0, h_corner) for x, y in points[1:])
 
-    points0 = center.reshape(2, 1) + (radius / 3) * (
-        corner.axis @ vstack((cos(angles0), sin(angles0)))
-    )
-    points1 = center.reshape(2, 1) + radius * (
-        corner.axis @ vstack((cos(angles1), sin(angles1)))
-    )
+    lt: list[Tag] = []
+
+    def add_lines(nb_lines: int) -> None:
+        for a, b in template.lines[len(lt) : nb_lines]:
+            lt.append(GEO.add_line(pt[a], pt[b]))
+            GEO.mesh.set_transfinite_curve(lt[-1], 2)
+        return None
 
-    pt0: list[Tag] = [
-        GEO.add_point(points0[0, j], points0[1, j], 0, h_corner)
-        for j in range(points0.shape[1])
-    ]
-    pt1: list[Tag] = [
-        GEO.add_point(points1[0, j], points1[1, j], 0, h_corner)
-        for j in range(points1.shape[1])
-    ]
-
-    lt_rad: list[list[Tag]] = [
-        [GEO.add_line(c_tag, t) for t in pt0],
-        [GEO.add_line(a, b) for a, b in zip(pt0, pt1[::2])],
-        [GEO.add_line(a, b) for a, b in zip(pt0, pt1[1::2])],
-        [GEO.add_line(a, b) for a, b in zip(circular(pt0, start=1), pt1[1::2])],
-    ]
-    lt_ang: list[list[Tag]] = [
-        [GEO.add_line(a, b) for a, b in circular_pairwise(pt0)],
-        [GEO.add_line(a, b) for a, b in circular_pairwise(pt1)],
-    ]
-
-    for t in chain(chain.from_iterable(lt_rad), chain.from_iterable(lt_ang)):
-        GEO.mesh.set_transfinite_curve(t, 2)
+    def signed(line: int) -> Tag:
+        return lt[line - 1] if line > 0 else -lt[-line - 1]
 
     st_inn: list[Tag] = []
     st_out: list[Tag] = []
-    for i, ((lr00, lr01), (lr10, lr11), lr2, lr3, la0, (la1, la2)) in enumerate(
-        zip(
-            circular_pairwise(lt_rad[0]),
-            circular_pairwise(lt_rad[1]),
-            lt_rad[2],
-            lt_rad[3],
-            lt_ang[0],
-            batched(lt_ang[1], 2),
-        )
+    for (loop, sector, quadrangle), nb_lines in zip(
+        template.surfaces, template.nb_lines
     ):
-        st: list[Tag] = [
-            GEO.add_plane_surface([GEO.add_curve_loop([lr00, la0, -lr01])]),
-            GEO.add_plane_surface([GEO.add_curve_loop([lr10, la1, -lr2])]),
-            GEO.add_plane_surface([GEO.add_curve_loop([lr2, -lr3, -la0])]),
-            GEO.add_plane_surface([GEO.add_curve_loop([lr3, la2, -lr11])]),
-        ]
-        if i < corner.p:
-            st_inn.extend(st)
-        else:
-            st_out.extend(st)
-
-    for t in chain(st_inn, st_out):
-        GEO.mesh.set_transfinite_surface(t)
+        add_lines(nb_lines)
+        st = GEO.add_plane_surface([GEO.add_curve_loop([signed(t) for t in loop])])
+        GEO.mesh.set_transfinite_surface(st)
+        if recombine and quadrangle:
+            GEO.mesh.set_recombine(2, st)
+        (st_inn if sector == 0 else st_out).append(st)
+    add_lines(len(template.lines))
 
     return (
-        CornerTag(radius, h_corner, 2 * corner.p, pt1, lt_ang[1]),
+        CornerTag(
+            radius,
+            h_corner,
+            template.sides[1],
+            [pt[i] for i in template.outer_points],
+            [signed(t) for t in template.outer_lines],
+        ),
         st_inn,
         st_out,
-        [lt_rad[0][0], lt_rad[1][0], lt_rad[0][corner.p], lt_rad[1][corner.p]],
+        [signed(t) for t in chain.from_iterable(zip(*template.boundary))],
     )
 
 
 def _mesh_lost_edge(
-    ct0: CornerTag, ctp: CornerTag, length: float, mesh_size: float
+    ct0: CornerTag,
+    ctp: CornerTag,
+    length: float,
+    mesh_size: float,
+    graded: bool,
+    recombine: bool,
 ) -> tuple[Tag, Tag, Tag, Tag, Tag]:
     """T-conform mesh of a edge."""
     pt0, lt0 = ct0.get_edge_0()
@@ -232,10 +392,17 @@ def _mesh_lost_edge(
 
     lt_edge = [GEO.add_line(a, b) for a, b in zip(pt0, ptp)]
 
-    h = sqrt(mesh_size * sqrt(ct0.h * ctp.h))
-    n = max(2, round(1 + (length - ct0.r - ctp.r) / h))
+    if graded:
+        n, coef = graded_edge_subdivision(length, ct0.r, ctp.r, ct0.h, ctp.h, mesh_size)
+    else:
+        n, coef = edge_subdivision(length, ct0.r, ctp.r, ct0.h, ctp.h, mesh_size), 1.0
+
+    # The three lines share the distribution, so the strips stay structured.
     for t in lt_edge:
-        GEO.mesh.set_transfinite_curve(t, n)
+        if coef < 1:
+            GEO.mesh.set_transfinite_curve(t, n, "Bump", coef)
+        else:
+            GEO.mesh.set_transfinite_curve(t, n)
 
     st_inn = GEO.add_plane_surface(
         [GEO.add_curve_loop([-lt0[0], lt_edge[1], -ltp[0], -lt_edge[0]])]
@@ -247,4 +414,8 @@ def _mesh_lost_edge(
     )
     GEO.mesh.set_transfinite_surface(st_out, arrangement="Right")
 
+    if recombine:
+        GEO.mesh.set_recombine(2, st_inn)
+        GEO.mesh.set_recombine(2, st_out)
+
     return (-lt_edge[0], lt_edge[2], st_inn, st_out, lt_edge[1])
@@ -0,0 +1,74 @@
+"""Mesh size of each region of a geometry."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Self
+
+from ..geometry import Geometry
+
+MeshSize = float | Mapping[str, float]
+
+
+@dataclass(frozen=True, slots=True)
+class MeshSizes:
+    """Mesh size of each region of a geometry.
+
+    Attributes
+    ----------
+    default : float
+        Mesh size of the background, and of the regions not in `sizes`.
+    sizes : dict[str, float], default {}
+        Mesh size of the regions by name: polygons and thickness.
+    """
+
+    default: float
+    sizes: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_mesh_size(cls, geometry: Geometry, mesh_size: MeshSize) -> Self:
+        """Mesh sizes from a scalar or from a mapping of the region names.
+
+        Parameters
+        ----------
+        geometry : Geometry
+        mesh_size : float | Mapping[str, float]
+            A mapping must give the mesh size of the background, the other
+            regions default to it.
+
+        Returns
+        -------
+        MeshSizes
+
+        Raises
+        ------
+        ValueError
+            If a name is not a region of the geometry, if the background is
+            missing or if a mesh size is not positive.
+        """
+        if not isinstance(mesh_size, Mapping):
+            mesh_size = {geometry.boundary.background_name: mesh_size}
+
+        boundary = geometry.boundary
+        names = {polygon.name for polygon in geometry.polygons}
+        if boundary.thickness is not None:
+            names.add(boundary.thickness_name)
+
+        unknown = set(mesh_size) - names - {boundary.background_name}
+        if unknown:
+            raise ValueError(f"Unknown regions {sorted(unknown)}.")
+        if boundary.background_name not in mesh_size:
+            raise ValueError("The mesh size of the background is required.")
+        if min(mesh_size.values()) <= 0:
+            raise ValueError("Mesh sizes must be > 0.")
+
+        return cls(
+            float(mesh_size[boundary.background_name]),
+            {name: float(val) for name, val in mesh_size.items() if name in names},
+        )
+
+    def __getitem__(self: Self, name: str) -> float:
+        return self.sizes.get(name, self.default)
+
+    def get(self: Self, name: str) -> float | None:
+        """Mesh size of a region if given explicitly, None otherwise."""
+        return self.sizes.get(name)
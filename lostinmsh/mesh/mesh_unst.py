@@ -1,51 +1,181 @@
 """Mesh a polygon."""
 
+from collections.abc import Mapping
+from functools import partial
 from pathlib import PurePath
 from typing import Final
 
 import gmsh
+from numpy import isclose, vstack
 
 from ..circular_iterable import circular_pairwise
 from ..geometry import Geometry, Polygon
 from ..type_alias import DimName, Tag
+from .algorithm import set_exterior_algorithms
+from .budget import MeshBudget, mesh_within_budget
 from .context_manager import GmshContextManager, GmshOptions
-from .mesh_boundary import mesh_exterior
+from .lost_parameters import min_vertex_distance
+from .mesh_boundary import ExteriorOptions, mesh_exterior
+from .mesh_size import MeshSize, MeshSizes
+from .size_field import (
+    CornerSource,
+    SizeMap,
+    SizeSource,
+    corner_fields,
+    graded_fields,
+    set_background_field,
+    singular_exponent,
+)
 
 GEO: Final = gmsh.model.geo
 
 
 def mesh_unstructured(
-    geometry: Geometry, mesh_size: float, gmsh_options: GmshOptions = GmshOptions()
+    geometry: Geometry,
+    mesh_size: MeshSize,
+    gmsh_options: GmshOptions = GmshOptions(),
+    *,
+    target_elements: int | None = None,
+    target_dofs: int | None = None,
+    exterior_options: ExteriorOptions = ExteriorOptions(),
+    graded_corners: bool = False,
 ) -> PurePath | None:
     """Unstructured mesh of a geometry.
 
     Parameters
     ----------
     geometry : Geometry
-    mesh_size : float
+    mesh_size : float | Mapping[str, float]
+        Mesh size, or size of the coarse calibration mesh if a target is given.
+        A mapping gives the mesh size of each region by name: polygons,
+        background and thickness, the background is required and is the
+        default of the other regions.
     gmsh_options : GmshOptions | None, optional, default None
+    target_elements : int | None, optional, default None
+        If given, use the smallest mesh size such that the mesh has at most
+        `target_elements` triangles.
+    target_dofs : int | None, optional, default None
+        If given, use the smallest mesh size such that the mesh of order
+        `element_order` has at most `target_dofs` nodes.
+    exterior_options : ExteriorOptions, optional
+        Options of the exterior mesh, such as the partition of the background.
+    graded_corners : bool, optional, default False
+        If True, the mesh size is graded towards the vertices of the polygons
+        as ``h * (r / R)^(1 - λ)`` at distance r < R of a vertex, where h is
+        the mesh size of the polygon, λ = π / max(angle, 2π - angle) is the
+        exponent of the corner singularity and R is half the smallest distance
+        between two vertices. The flat vertices are not graded.
 
     Returns
     -------
     PurePath | None
         Filename of the output mesh file or None if not saved.
+
+    Raises
+    ------
+    ValueError
+        If a target is given with a mapping of mesh sizes, or if the mapping
+        is not valid for `MeshSizes`.
     """
+    if target_elements is not None or target_dofs is not None:
+        if isinstance(mesh_size, Mapping):
+            raise ValueError("A target requires a scalar mesh size.")
+        budget = MeshBudget(
+            target_elements, target_dofs, gmsh_options.key_val["Mesh.ElementOrder"]
+        )
+        mesh_within_budget(
+            partial(
+                _build_unst,
+                exterior_options=exterior_options,
+                graded_corners=graded_corners,
+            ),
+            "unstructured",
+            geometry,
+            mesh_size,
+            gmsh_options,
+            budget,
+        )
+        return gmsh_options.filename
+
+    # Check the mesh sizes before gmsh is initialized.
+    MeshSizes.from_mesh_size(geometry, mesh_size)
     with GmshContextManager(gmsh_options) as ctx:
-        poly_loop_tags: list[Tag] = []
+        _build_unst(ctx, geometry, mesh_size, exterior_options, graded_corners)
 
-        for polygon in geometry.polygons:
-            poly_loop_tag, dom_tags = mesh_unst_poly(polygon, mesh_size)
-            poly_loop_tags.append(poly_loop_tag)
+    return gmsh_options.filename
 
-            ctx.update_domain_tags(dom_tags)
 
-        dom_tags = mesh_exterior(geometry.boundary, mesh_size, poly_loop_tags)
-        ctx.update_domain_tags(dom_tags)
-
-    return gmsh_options.filename
+def _build_unst(
+    ctx: GmshContextManager,
+    geometry: Geometry,
+    mesh_size: MeshSize,
+    exterior_options: ExteriorOptions = ExteriorOptions(),
+    graded_corners: bool = False,
+    size_map: SizeMap | None = None,
+) -> None:
+    """Build the CAD model of the unstructured mesh."""
+    sizes = MeshSizes.from_mesh_size(geometry, mesh_size)
+    radius = min_vertex_distance(vstack([p.vertices for p in geometry.polygons])) / 2
+
+    poly_loop_tags: list[Tag] = []
+    sources: dict[float, SizeSource] = {}
+    corner_sources: list[CornerSource] = []
+
+    for polygon in geometry.polygons:
+        h = sizes[polygon.name]
+        poly_loop_tag, dom_tags, point_tags = mesh_unst_poly(polygon, h)
+        poly_loop_tags.append(poly_loop_tag)
+        sources.setdefault(h, SizeSource(h)).curve_tags.extend(
+            dom_tags[(1, f"{polygon.name}_boundary")]
+        )
+
+        if graded_corners and radius > h:
+            for point_tag, corner in zip(point_tags, polygon.corners):
+                exponent = singular_exponent(corner)
+                if not isclose(exponent, 1):
+                    corner_sources.append(CornerSource(point_tag, h, radius, exponent))
 
+        ctx.update_domain_tags(dom_tags)
 
-def mesh_unst_poly(polygon: Polygon, h: float) -> tuple[Tag, dict[DimName, list[Tag]]]:
+    dom_tags = mesh_exterior(
+        geometry.boundary,
+        sizes.default,
+        poly_loop_tags,
+        inner_extents=[
+            (float(polygon.vertices[:, 0].min()), float(polygon.vertices[:, 0].max()))
+            for polygon in geometry.polygons
+        ],
+        thickness_size=sizes.get(geometry.boundary.thickness_name),
+        options=exterior_options,
+    )
+    ctx.update_domain_tags(dom_tags)
+
+    field_tags = corner_fields(corner_sources)
+    if size_map is not None:
+        field_tags.append(size_map.add_field())
+    if exterior_options.growth_rate is not None:
+        assert exterior_options.max_size is not None
+        field_tags.extend(
+            graded_fields(
+                list(sources.values()),
+                exterior_options.growth_rate,
+                exterior_options.max_size,
+            )
+        )
+    if field_tags:
+        set_background_field(field_tags)
+
+    if ctx.options.mesh_algorithm == "auto":
+        set_exterior_algorithms(
+            geometry, sizes.default, min(sources, default=sizes.default), dom_tags
+        )
+
+    return None
+
+
+def mesh_unst_poly(
+    polygon: Polygon, h: float
+) -> tuple[Tag, dict[DimName, list[Tag]], list[Tag]]:
     """Mesh the polygon.
 
     Parameters
@@ -57,8 +187,9 @@ def mesh_unst_poly(polygon: Polygon, h: float) -> tuple[Tag, dict[DimName, list[
 
     Returns
     -------
-    tuple[Tag, dict[DimName, list[Tag]]]
-        return the loop tag and the domain and its associated tags
+    tuple[Tag, dict[DimName, list[Tag]], list[Tag]]
+        return the loop tag, the domain and its associated tags, and the tags of
+        the vertices
     """
     point_tags: list[Tag] = [
         GEO.add_point(vertex[0], vertex[1], 0, h) for vertex in polygon.vertices
@@ -71,4 +202,5 @@ def mesh_unst_poly(polygon: Polygon, h: float) -> tuple[Tag, dict[DimName, list[
     return (
         loop_tag,
         {(2, polygon.name): [surface_tag], (1, f"{polygon.name}_boundary"): line_tags},
+        point_tags,
     )
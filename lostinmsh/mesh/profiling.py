@@ -0,0 +1,217 @@
+"""Opt-in profiling of the meshing phases."""
+
+import re
+import sys
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+from typing import Any, Self
+
+import gmsh
+
+try:
+    from resource import RUSAGE_SELF, getrusage
+
+    ENABLE_RESOURCE = True
+except ImportError:  # not available on Windows
+    ENABLE_RESOURCE = False
+
+# gmsh API namespaces whose calls are counted.
+COUNTED_API: dict[str, type] = {
+    "geo": gmsh.model.geo,
+    "geo.mesh": gmsh.model.geo.mesh,
+    "mesh.field": gmsh.model.mesh.field,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseReport:
+    """Report of a meshing phase.
+
+    Attributes
+    ----------
+    name : str
+        Name of the phase.
+    wall_time : float
+        Duration of the phase measured by the profiler timer.
+    peak_rss : int | None
+        Peak resident set size of the process in bytes at the end of the phase,
+        None if it is not available on the platform.
+    """
+
+    name: str
+    wall_time: float
+    peak_rss: int | None
+
+
+@dataclass(slots=True)
+class MeshProfile:
+    """Structured report of a mesh run.
+
+    Attributes
+    ----------
+    phases : list[PhaseReport]
+        Phases in chronological order.
+    api_calls : dict[str, int]
+        Number of calls per gmsh API function, e.g. ``"geo.add_point"``.
+    nb_nodes : int
+        Final number of nodes.
+    nb_elements : dict[str, int]
+        Final number of elements per gmsh element type, e.g. ``"Triangle 3"``.
+    """
+
+    phases: list[PhaseReport] = field(default_factory=list)
+    api_calls: dict[str, int] = field(default_factory=dict)
+    nb_nodes: int = 0
+    nb_elements: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def wall_time(self: Self) -> float:
+        """Total duration of the phases."""
+        return sum(phase.wall_time for phase in self.phases)
+
+    def __str__(self: Self) -> str:
+        data: list[tuple[str, Any]] = [("Phases", "")]
+        data.extend(
+            (
+                f"  {phase.name}",
+                f"{phase.wall_time:.4f}s"
+                + (
+                    f", peak RSS {phase.peak_rss / 2**20:.1f} MiB"
+                    if phase.peak_rss is not None
+                    else ""
+                ),
+            )
+            for phase in self.phases
+        )
+        data.append(("  total", f"{self.wall_time:.4f}s"))
+        data.append(("gmsh API calls", ""))
+        data.extend((f"  {key}", val) for key, val in sorted(self.api_calls.items()))
+        data.append(("Nodes", self.nb_nodes))
+        data.append(("Elements", ""))
+        data.extend((f"  {key}", val) for key, val in self.nb_elements.items())
+
+        n = max(len(key) for key, _ in data) + 1
+        return "".join(
+            f"{key} {'.' * (n - len(key)) if val != '' else ''} {val}\n"
+            for key, val in data
+        )
+
+
+class Profiler:
+    """Profiler of mesh runs, pass it to `GmshOptions` to enable it.
+
+    Parameters
+    ----------
+    timer : Callable[[], float], optional, default `time.perf_counter`
+        Clock used to measure the phases.
+    span : Callable[[str], AbstractContextManager[Any]] | None, optional
+        Tracing backend, called with the phase name and entered for the duration
+        of the phase, e.g. ``tracer.start_as_current_span`` of OpenTelemetry.
+
+    Attributes
+    ----------
+    reports : list[MeshProfile]
+        Reports of all the profiled runs.
+    """
+
+    def __init__(
+        self: Self,
+        *,
+        timer: Callable[[], float] = perf_counter,
+        span: Callable[[str], AbstractContextManager[Any]] | None = None,
+    ) -> None:
+        self.timer = timer
+        self.span = span
+        self.reports: list[MeshProfile] = []
+
+        self._calls: Counter[str] = Counter()
+        self._originals: list[tuple[type, str, Any]] = []
+
+        return None
+
+    @property
+    def report(self: Self) -> MeshProfile:
+        """Report of the last profiled run."""
+        if not self.reports:
+            raise ValueError("No mesh run has been profiled yet.")
+        return self.reports[-1]
+
+    def start_run(self: Self) -> None:
+        """Start profiling a run and count the gmsh API calls."""
+        self.reports.append(MeshProfile())
+
+        self._calls.clear()
+        for prefix, namespace in COUNTED_API.items():
+            for name, attr in list(vars(namespace).items()):
+                if name.startswith("_") or not isinstance(attr, staticmethod):
+                    continue
+                self._originals.append((namespace, name, attr))
+                setattr(namespace, name, staticmethod(self._counted(prefix, attr)))
+
+        return None
+
+    def end_run(self: Self) -> None:
+        """Stop counting the gmsh API calls and collect the mesh statistics."""
+        for namespace, name, attr in self._originals:
+            setattr(namespace, name, attr)
+        self._originals.clear()
+
+        report = self.report
+        report.api_calls = dict(self._calls)
+
+        node_tags, _, _ = gmsh.model.mesh.get_nodes()
+        report.nb_nodes = len(node_tags)
+
+        element_types, element_tags, _ = gmsh.model.mesh.get_elements()
+        report.nb_elements = {
+            gmsh.model.mesh.get_element_properties(element_type)[0]: len(tags)
+            for element_type, tags in zip(element_types, element_tags)
+        }
+
+        return None
+
+    @contextmanager
+    def phase(self: Self, name: str) -> Iterator[None]:
+        """Measure a phase of the current run.
+
+        Parameters
+        ----------
+        name : str
+        """
+        with ExitStack() as stack:
+            if self.span is not None:
+                stack.enter_context(self.span(name))
+
+            start = self.timer()
+            try:
+                yield None
+            finally:
+                self.report.phases.append(
+                    PhaseReport(name, self.timer() - start, _peak_rss())
+                )
+
+    def _counted(self: Self, prefix: str, attr: staticmethod) -> Callable[..., Any]:
+        """Wrap a gmsh API function to count its calls."""
+        func = attr.__func__
+        key = f"{prefix}.{re.sub(r'(?<!^)(?=[A-Z])', '_', func.__name__).lower()}"
+        calls = self._calls
+
+        @wraps(func)
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            calls[key] += 1
+            return func(*args, **kwargs)
+
+        return counted
+
+
+def _peak_rss() -> int | None:
+    """Peak resident set size of the process in bytes."""
+    if not ENABLE_RESOURCE:
+        return None
+
+    peak = getrusage(RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else 1024 * peak
@@ -0,0 +1,114 @@
+"""Nested meshes by uniform refinement."""
+
+from pathlib import PurePath
+
+from numpy import arange, concatenate, full, repeat, stack
+from scipy.sparse import coo_array, csr_array
+
+from .mesh_data import MeshData
+
+
+def refine_uniformly(mesh: MeshData) -> tuple[MeshData, csr_array]:
+    """Red refinement of a triangle mesh.
+
+    Each triangle is split into 4 similar triangles by its edge midpoints, so
+    the structured corner patches and edges stay structured. The children of
+    the triangle i are the triangles 4i, ..., 4i+3 of the fine mesh, with the
+    physical tag of their parent. The midpoints of the edges on curved
+    boundaries stay on the chords, so the meshes are nested.
+
+    Parameters
+    ----------
+    mesh : MeshData
+
+    Returns
+    -------
+    tuple[MeshData, csr_array]
+        The fine mesh and the prolongation of the P1 functions of the coarse
+        mesh to the fine mesh, of shape (fine nodes, coarse nodes).
+
+    Raises
+    ------
+    ValueError
+        If the mesh is not of order 1.
+    """
+    if mesh.order() != 1:
+        raise ValueError("Only meshes of order 1 can be refined.")
+
+    nb_nodes = mesh.nodes.shape[0]
+    a, b, c = mesh.triangles.T
+
+    # The midpoints of the edges are numbered after the nodes.
+    edges, triangle_edges = mesh.edges()
+    mab, mbc, mca = nb_nodes + triangle_edges.T
+
+    lo, hi = edges.T
+    nodes = concatenate((mesh.nodes, (mesh.nodes[lo] + mesh.nodes[hi]) / 2))
+    triangles = stack(
+        (
+            stack((a, mab, mca), axis=1),
+            stack((mab, b, mbc), axis=1),
+            stack((mca, mbc, c), axis=1),
+            stack((mab, mbc, mca), axis=1),
+        ),
+        axis=1,
+    ).reshape(-1, 3)
+
+    nb_edges = edges.shape[0]
+    midpoints = arange(nb_nodes, nb_nodes + nb_edges)
+    prolongation = coo_array(
+        (
+            concatenate((full(nb_nodes, 1.0), full(2 * nb_edges, 0.5))),
+            (
+                concatenate((arange(nb_nodes), midpoints, midpoints)),
+                concatenate((arange(nb_nodes), lo, hi)),
+            ),
+        ),
+        shape=(nb_nodes + nb_edges, nb_nodes),
+    ).tocsr()
+
+    fine = MeshData(
+        nodes,
+        triangles,
+        arange(1, triangles.shape[0] + 1),
+        None if mesh.physical_tags is None else repeat(mesh.physical_tags, 4),
+        mesh.physical_names,
+    )
+    return (fine, prolongation)
+
+
+def mesh_hierarchy(
+    mesh: MeshData | PurePath | str, nb_levels: int
+) -> tuple[list[MeshData], list[csr_array]]:
+    """Nested meshes by successive uniform refinements of a coarse mesh.
+
+    Parameters
+    ----------
+    mesh : MeshData | PurePath | str
+        Coarse mesh, or its mesh file, for instance from
+        `mesh_locally_structured`.
+    nb_levels : int
+        Number of refinements.
+
+    Returns
+    -------
+    tuple[list[MeshData], list[csr_array]]
+        The `nb_levels` + 1 meshes from the coarsest, and the prolongation from
+        each mesh to the next one.
+
+    Raises
+    ------
+    ValueError
+        If the number of levels is negative.
+    """
+    if nb_levels < 0:
+        raise ValueError("Number of levels must be an integer >= 0.")
+
+    meshes = [mesh if isinstance(mesh, MeshData) else MeshData.from_msh(mesh)]
+    prolongations: list[csr_array] = []
+    for _ in range(nb_levels):
+        fine, prolongation = refine_uniformly(meshes[-1])
+        meshes.append(fine)
+        prolongations.append(prolongation)
+
+    return (meshes, prolongations)
@@ -0,0 +1,557 @@
+"""Locally structured mesh of polygons sharing edges and vertices."""
+
+from dataclasses import dataclass
+from itertools import chain
+from typing import Final, Self
+
+import gmsh
+from numpy import (
+    arctan2,
+    asarray,
+    cumsum,
+    inf,
+    log,
+    maximum,
+    pi,
+    rint,
+    vstack,
+)
+from numpy.linalg import norm
+from scipy.spatial import KDTree
+
+from ..circular_iterable import circular_pairwise
+from ..geometry import Corner, Geometry
+from ..geometry.points import RTOL, contains, merge_points, signed_area
+from ..type_alias import Mat2x2, MatNx2, Tag, Vec2
+from .algorithm import set_exterior_algorithms
+from .context_manager import GmshContextManager
+from .corner_patch import (
+    CornerOptions,
+    corner_template,
+    junction_template,
+    patch_points,
+)
+from .lost_parameters import (
+    corner_radii,
+    edge_subdivision,
+    graded_edge_subdivision,
+    junction_mesh_size,
+)
+from .mesh_boundary import ExteriorOptions, mesh_exterior
+from .mesh_size import MeshSize, MeshSizes
+from .size_field import SizeMap, SizeSource, graded_fields, set_background_field
+
+GEO: Final = gmsh.model.geo
+
+# Region of the sectors and strips outside the polygons.
+BACKGROUND: Final = -1
+
+# Maximum number of angular subdivisions of a vertex shared by polygons.
+MAX_SUBDIV: Final = 16
+
+
+@dataclass(frozen=True, slots=True)
+class Junction:
+    """Vertex of the polygons with the sectors between its edges.
+
+    Attributes
+    ----------
+    vertex : Vec2
+    axis : Mat2x2
+        Rotation from the x axis to the first edge.
+    neighbors : list[int]
+        Index of the other vertex of each edge, counterclockwise.
+    angles : list[float]
+        Angle of the sector k, between the edges k and k + 1.
+    regions : list[int]
+        Index of the polygon of each sector, `BACKGROUND` outside.
+    corner : Corner | None
+        Corner of the polygon of the sector 0 if the vertex has two edges.
+    """
+
+    vertex: Vec2
+    axis: Mat2x2
+    neighbors: list[int]
+    angles: list[float]
+    regions: list[int]
+    corner: Corner | None
+
+    def side(self: Self, neighbor: int) -> int:
+        """Index of the edge to a neighbor."""
+        return self.neighbors.index(neighbor)
+
+
+@dataclass(frozen=True, slots=True)
+class JunctionTag:
+    """Tags of a junction."""
+
+    r: float  # radius
+    h: float  # angular mesh size
+    sides: list[int]  # side k tag = pt[sides[k]]
+    pt: list[Tag]  # point tags of the outer ring
+    lt: list[Tag]  # line tags of the outer ring, lt[i] from pt[i] to pt[i + 1]
+    lt_sides: list[list[Tag]]  # line tags on each side
+
+    def ring(self: Self, start: int, end: int) -> list[Tag]:
+        """Lines of the outer ring clockwise from the point `start - 1` to the
+        point `end + 1` of the sector between the sides `end` and `start`."""
+        n = len(self.pt)
+        s, e = self.sides[start], self.sides[end]
+        return [-self.lt[(s - 2 - k) % n] for k in range((s - e) % n - 2)]
+
+
+def has_shared_vertices(geometry: Geometry) -> bool:
+    """Whether polygons of the geometry share vertices, see `merge_points`."""
+    points = vstack([polygon.vertices for polygon in geometry.polygons])
+    vertices, _ = merge_points(points)
+    return vertices.shape[0] < points.shape[0]
+
+
+def check_shared_topology(geometry: Geometry) -> None:
+    """Check that the polygons sharing vertices form a valid partition.
+
+    Raises
+    ------
+    ValueError
+        If the polygons overlap, or if a vertex is inside an edge.
+    """
+    _junctions(geometry)
+    return None
+
+
+def build_shared(
+    ctx: GmshContextManager,
+    geometry: Geometry,
+    mesh_size: MeshSize,
+    exterior_options: ExteriorOptions = ExteriorOptions(),
+    graded_edges: bool = False,
+    corner_options: CornerOptions = CornerOptions(),
+    recombine: str | None = None,
+    size_map: SizeMap | None = None,
+) -> None:
+    """Build the CAD model of the locally structured mesh of polygons sharing
+    edges.
+
+    Each vertex is meshed once by a patch whose sectors belong to the polygons
+    around it, and each edge once by two strips, one on each side.
+    """
+    sizes = MeshSizes.from_mesh_size(geometry, mesh_size)
+    polygons = geometry.polygons
+    vertices, cycles, junctions = _junctions(geometry)
+
+    def region_size(region: int) -> float:
+        return inf if region == BACKGROUND else sizes[polygons[region].name]
+
+    radii = corner_radii(
+        geometry,
+        [min(map(region_size, junction.regions)) for junction in junctions],
+    )
+
+    structured: dict[int, list[Tag]] = {
+        k: [] for k in (BACKGROUND, *range(len(polygons)))
+    }
+    boundaries: dict[int, list[Tag]] = {k: [] for k in range(len(polygons))}
+    corner_sources: dict[float, SizeSource] = {}
+    tags: list[JunctionTag] = []
+    for junction, radius in zip(junctions, radii):
+        tag = _mesh_junction(
+            junction, radius, corner_options, recombine is not None, structured
+        )
+        tags.append(tag)
+        for k, lines in enumerate(tag.lt_sides):
+            for region in {junction.regions[k], junction.regions[k - 1]}:
+                if region != BACKGROUND:
+                    boundaries[region].extend(lines)
+
+        source = corner_sources.setdefault(float(f"{tag.h:.6g}"), SizeSource(tag.h))
+        source.point_tags.extend(tag.pt)
+
+    # Line parallel to each edge, on its left and oriented as the edge.
+    offsets: dict[tuple[int, int], Tag] = {}
+    sources: dict[float, SizeSource] = {}
+    for a, b in _edges(junctions):
+        left, right = (
+            junctions[b].regions[junctions[b].side(a) - 1],
+            junctions[a].regions[junctions[a].side(b) - 1],
+        )
+        h = min(region_size(left), region_size(right))
+        lt_left, lt_edge, lt_right = _mesh_shared_edge(
+            tags[a],
+            tags[b],
+            junctions[a].side(b),
+            junctions[b].side(a),
+            float(norm(vertices[b] - vertices[a])),
+            h,
+            graded_edges,
+            recombine is not None,
+            (structured[left], structured[right]),
+        )
+        offsets[(a, b)], offsets[(b, a)] = lt_left, -lt_right
+        sources.setdefault(h, SizeSource(h)).curve_tags.append(lt_edge)
+        for region in {left, right} - {BACKGROUND}:
+            boundaries[region].append(lt_edge)
+
+    def loop(cycle: list[int], reverse: bool = False) -> Tag:
+        """Curve loop of a face on the left of the cycle of vertices."""
+        curves: list[Tag] = []
+        for a, b, c in zip(cycle, [*cycle[1:], *cycle[:1]], [*cycle[2:], *cycle[:2]]):
+            curves.append(offsets[(a, b)])
+            curves.extend(tags[b].ring(junctions[b].side(a), junctions[b].side(c)))
+        return GEO.add_curve_loop([-t for t in curves[::-1]] if reverse else curves)
+
+    unstructured_tags: list[Tag] = []
+    for k, (polygon, cycle) in enumerate(zip(polygons, cycles)):
+        unstructured_tags.append(GEO.add_plane_surface([loop(cycle)]))
+        ctx.update_domain_tags(
+            {
+                (2, polygon.name): [*structured[k], unstructured_tags[-1]],
+                (1, f"{polygon.name}_boundary"): boundaries[k],
+            }
+        )
+
+    # The outlines of the groups of polygons are holes in the bounded faces of
+    # the background enclosed by polygons, or in the exterior.
+    faces: list[list[int]] = []
+    outlines: list[list[int]] = []
+    for cycle in _background_cycles(junctions):
+        (faces if signed_area(vertices[cycle]) > 0 else outlines).append(cycle)
+
+    areas = [signed_area(vertices[face]) for face in faces]
+    holes: list[list[Tag]] = [[] for _ in faces]
+    exterior_loops: list[Tag] = []
+    inner_extents: list[tuple[float, float]] = []
+    for outline in outlines:
+        # Reversed, counterclockwise around the polygons.
+        loop_tag = loop(outline, reverse=True)
+        inside = [
+            k
+            for k, face in enumerate(faces)
+            if _outline_in_face(vertices, outline, face)
+        ]
+        if inside:
+            holes[min(inside, key=lambda k: areas[k])].append(loop_tag)
+            continue
+
+        radius = max(radii[v] for v in outline)
+        exterior_loops.append(loop_tag)
+        inner_extents.append(
+            (
+                float(vertices[outline, 0].min()) - radius,
+                float(vertices[outline, 0].max()) + radius,
+            )
+        )
+
+    enclosed = [
+        GEO.add_plane_surface([loop(face), *hole]) for face, hole in zip(faces, holes)
+    ]
+    unstructured_tags.extend(enclosed)
+    ctx.update_domain_tags(
+        {(2, geometry.boundary.background_name): [*structured[BACKGROUND], *enclosed]}
+    )
+
+    dom_tags = mesh_exterior(
+        geometry.boundary,
+        sizes.default,
+        exterior_loops,
+        inner_extents=inner_extents,
+        thickness_size=sizes.get(geometry.boundary.thickness_name),
+        options=exterior_options,
+    )
+    ctx.update_domain_tags(dom_tags)
+
+    field_tags = [] if size_map is None else [size_map.add_field()]
+    if exterior_options.growth_rate is not None:
+        assert exterior_options.max_size is not None
+        field_tags.extend(
+            graded_fields(
+                [*sources.values(), *corner_sources.values()],
+                exterior_options.growth_rate,
+                exterior_options.max_size,
+            )
+        )
+    if field_tags:
+        set_background_field(field_tags)
+
+    if ctx.options.mesh_algorithm == "auto":
+        set_exterior_algorithms(
+            geometry, sizes.default, min(tag.h for tag in tags), dom_tags
+        )
+
+    if recombine == "all":
+        unstructured_tags.extend(
+            chain.from_iterable(st for (dim, _), st in dom_tags.items() if dim == 2)
+        )
+        for t in unstructured_tags:
+            GEO.mesh.set_recombine(2, t)
+
+    return None
+
+
+def _junctions(geometry: Geometry) -> tuple[MatNx2, list[list[int]], list[Junction]]:
+    """Distinct vertices of the polygons, the indices of the vertices of each
+    polygon in them, and the junction of each vertex.
+
+    Raises
+    ------
+    ValueError
+        If the polygons overlap, or if a vertex is inside an edge.
+    """
+    polygons = geometry.polygons
+    points = vstack([polygon.vertices for polygon in polygons])
+    vertices, index = merge_points(points)
+    splits = cumsum([0, *(len(polygon.vertices) for polygon in polygons)])
+    cycles = [index[i:j].tolist() for i, j in zip(splits[:-1], splits[1:])]
+
+    # Polygon on the left of each edge, the polygons are counterclockwise.
+    left: dict[tuple[int, int], int] = {}
+    corners: dict[tuple[int, int], Corner] = {}
+    for k, (polygon, cycle) in enumerate(zip(polygons, cycles)):
+        for (a, b), corner in zip(circular_pairwise(cycle), polygon.corners):
+            if a == b or (a, b) in left:
+                raise ValueError("The polygons overlap.")
+            left[(a, b)] = k
+            corners[(k, a)] = corner
+
+    _check_t_junctions(vertices, list(left))
+
+    neighbors: list[set[int]] = [set() for _ in range(vertices.shape[0])]
+    for a, b in left:
+        neighbors[a].add(b)
+        neighbors[b].add(a)
+
+    junctions: list[Junction] = []
+    for v, (vertex, others) in enumerate(zip(vertices, neighbors)):
+        nbrs = sorted(others, key=lambda n: _polar(vertices[n] - vertex))
+        regions = [left.get((v, n), BACKGROUND) for n in nbrs]
+
+        # A vertex with two edges starts with its polygon, as a corner.
+        shift = regions.index(max(regions)) if len(nbrs) == 2 else 0
+        nbrs, regions = nbrs[shift:] + nbrs[:shift], regions[shift:] + regions[:shift]
+        angles = [
+            (_polar(vertices[n1] - vertex) - _polar(vertices[n0] - vertex)) % (2 * pi)
+            for n0, n1 in circular_pairwise(nbrs)
+        ]
+
+        # The sector before each edge is on the right of the edge.
+        if any(
+            left.get((n, v), BACKGROUND) != regions[k - 1] for k, n in enumerate(nbrs)
+        ):
+            raise ValueError("The polygons overlap.")
+
+        u = (vertices[nbrs[0]] - vertex) / norm(vertices[nbrs[0]] - vertex)
+        junctions.append(
+            Junction(
+                vertex,
+                asarray([[u[0], -u[1]], [u[1], u[0]]]),
+                nbrs,
+                angles,
+                regions,
+                corners.get((regions[0], v)) if len(nbrs) == 2 else None,
+            )
+        )
+
+    return (vertices, cycles, junctions)
+
+
+def _check_t_junctions(vertices: MatNx2, edges: list[tuple[int, int]]) -> None:
+    """Raise a ValueError if a vertex is inside an edge."""
+    tree = KDTree(vertices)
+    tol = RTOL * float(norm(vertices.max(axis=0) - vertices.min(axis=0)))
+    for a, b in edges:
+        u = vertices[b] - vertices[a]
+        length = float(norm(u))
+        for c in tree.query_ball_point((vertices[a] + vertices[b]) / 2, length / 2):
+            w = vertices[c] - vertices[a]
+            if c not in (a, b) and abs(u[0] * w[1] - u[1] * w[0]) < tol * length:
+                raise ValueError("A vertex is inside an edge of another polygon.")
+    return None
+
+
+def _polar(vector: Vec2) -> float:
+    """Polar angle of a vector in [0, 2π)."""
+    return float(arctan2(vector[1], vector[0])) % (2 * pi)
+
+
+def _edges(junctions: list[Junction]) -> list[tuple[int, int]]:
+    """Edges between the junctions, each once."""
+    return [
+        (a, b)
+        for a, junction in enumerate(junctions)
+        for b in junction.neighbors
+        if a < b
+    ]
+
+
+def _subdivisions(angles: list[float]) -> list[int]:
+    """Angular subdivisions of the sectors, with the most uniform angular steps
+    for at most `MAX_SUBDIV` subdivisions in total."""
+    alpha = asarray(angles)
+    best, error = [1] * len(angles), inf
+    for total in range(len(angles), max(MAX_SUBDIV, len(angles)) + 1):
+        n = maximum(1, rint(alpha * total / (2 * pi)))
+        steps = alpha / n
+        e = float(log(steps.max() / steps.min()))
+        if e < error:
+            best, error = n.astype(int).tolist(), e
+        if error < 1e-12:
+            break
+    return best
+
+
+def _mesh_junction(
+    junction: Junction,
+    radius: float,
+    options: CornerOptions,
+    recombine: bool,
+    structured: dict[int, list[Tag]],
+) -> JunctionTag:
+    """T-conform mesh of a junction, from the template of its sectors rotated
+    by `junction.axis`, scaled by the radius and moved to the vertex. The
+    surfaces are added to the structured surfaces of their region."""
+    if junction.corner is not None:
+        corner = junction.corner
+        template = corner_template(corner, options)
+        subdivisions = [corner.p, corner.q]
+    else:
+        subdivisions = _subdivisions(junction.angles)
+        template = junction_template(junction.angles, subdivisions, options)
+    h = junction_mesh_size(
+        junction.angles, subdivisions, radius, options.subdivisions()[-1]
+    )
+
+    center = junction.vertex
+    points = patch_points(
+        center, junction.axis, radius, junction.angles, subdivisions, options
+    )
+    pt: list[Tag] = [GEO.add_point(center[0], center[1], 0)]
+    pt.extend(GEO.add_point(x, y, 0, h) for x, y in points[1:])
+
+    lt: list[Tag] = []
+
+    def add_lines(nb_lines: int) -> None:
+        for a, b in template.lines[len(lt) : nb_lines]:
+            lt.append(GEO.add_line(pt[a], pt[b]))
+            GEO.mesh.set_transfinite_curve(lt[-1], 2)
+        return None
+
+    def signed(line: int) -> Tag:
+        return lt[line - 1] if line > 0 else -lt[-line - 1]
+
+    for (loop, sector, quadrangle), nb_lines in zip(
+        template.surfaces, template.nb_lines
+    ):
+        add_lines(nb_lines)
+        st = GEO.add_plane_surface([GEO.add_curve_loop([signed(t) for t in loop])])
+        GEO.mesh.set_transfinite_surface(st)
+        if recombine and quadrangle:
+            GEO.mesh.set_recombine(2, st)
+        structured[junction.regions[sector]].append(st)
+    add_lines(len(template.lines))
+
+    return JunctionTag(
+        radius,
+        h,
+        template.sides,
+        [pt[i] for i in template.outer_points],
+        [signed(t) for t in template.outer_lines],
+        [[signed(t) for t in lines] for lines in template.boundary],
+    )
+
+
+def _mesh_shared_edge(
+    jt0: JunctionTag,
+    jtp: JunctionTag,
+    side0: int,
+    sidep: int,
+    length: float,
+    mesh_size: float,
+    graded: bool,
+    recombine: bool,
+    surfaces: tuple[list[Tag], list[Tag]],
+) -> tuple[Tag, Tag, Tag]:
+    """T-conform mesh of an edge from the side `side0` of a junction to the
+    side `sidep` of another, by a strip on each side added to `surfaces`.
+    Return the lines on the left, on the edge and on the right, oriented as
+    the edge."""
+    n0, np_ = len(jt0.pt), len(jtp.pt)
+    s0, sp = jt0.sides[side0], jtp.sides[sidep]
+
+    lt_edge = [
+        GEO.add_line(jt0.pt[(s0 + 1) % n0], jtp.pt[(sp - 1) % np_]),
+        GEO.add_line(jt0.pt[s0], jtp.pt[sp]),
+        GEO.add_line(jt0.pt[(s0 - 1) % n0], jtp.pt[(sp + 1) % np_]),
+    ]
+
+    if graded:
+        n, coef = graded_edge_subdivision(length, jt0.r, jtp.r, jt0.h, jtp.h, mesh_size)
+    else:
+        n, coef = edge_subdivision(length, jt0.r, jtp.r, jt0.h, jtp.h, mesh_size), 1.0
+
+    # The three lines share the distribution, so the strips stay structured.
+    for t in lt_edge:
+        if coef < 1:
+            GEO.mesh.set_transfinite_curve(t, n, "Bump", coef)
+        else:
+            GEO.mesh.set_transfinite_curve(t, n)
+
+    st_left = GEO.add_plane_surface(
+        [
+            GEO.add_curve_loop(
+                [-jt0.lt[s0], lt_edge[1], -jtp.lt[(sp - 1) % np_], -lt_edge[0]]
+            )
+        ]
+    )
+    GEO.mesh.set_transfinite_surface(st_left, arrangement="Left")
+
+    st_right = GEO.add_plane_surface(
+        [
+            GEO.add_curve_loop(
+                [-jt0.lt[(s0 - 1) % n0], lt_edge[2], -jtp.lt[sp], -lt_edge[1]]
+            )
+        ]
+    )
+    GEO.mesh.set_transfinite_surface(st_right, arrangement="Right")
+
+    if recombine:
+        GEO.mesh.set_recombine(2, st_left)
+        GEO.mesh.set_recombine(2, st_right)
+
+    surfaces[0].append(st_left)
+    surfaces[1].append(st_right)
+
+    return (lt_edge[0], lt_edge[1], lt_edge[2])
+
+
+def _background_cycles(junctions: list[Junction]) -> list[list[int]]:
+    """Vertices of the boundary of each face of the background, with the face
+    on the left."""
+
+    # At the end of an edge, the face on its left continues along the edge
+    # clockwise next.
+    def after(a: int, b: int) -> tuple[int, int]:
+        junction = junctions[b]
+        return (b, junction.neighbors[junction.side(a) - 1])
+
+    cycles: list[list[int]] = []
+    visited: set[tuple[int, int]] = set()
+    for a, junction in enumerate(junctions):
+        for k, b in enumerate(junction.neighbors):
+            if junction.regions[k] != BACKGROUND or (a, b) in visited:
+                continue
+            cycle, edge = [], (a, b)
+            while edge not in visited:
+                visited.add(edge)
+                cycle.append(edge[0])
+                edge = after(*edge)
+            cycles.append(cycle)
+
+    return cycles
+
+
+def _outline_in_face(vertices: MatNx2, outline: list[int], face: list[int]) -> bool:
+    """Whether the outline of a group of polygons is inside a face of the
+    background, from one of its vertices not on the face."""
+    others = set(outline) - set(face)
+    if not others:
+        return False
+    return contains(vertices[face], vertices[min(others)])
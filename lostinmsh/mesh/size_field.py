@@ -0,0 +1,170 @@
+"""Graded mesh size fields."""
+
+from dataclasses import dataclass, field
+from typing import Final, Self
+
+import gmsh
+from numpy import broadcast_to, full, hstack, inf, minimum, pi, zeros_like
+
+from ..geometry import Corner
+from ..type_alias import Tag, VecN
+from .mesh_data import MeshData
+
+FIELD: Final = gmsh.model.mesh.field
+
+
+@dataclass(frozen=True, slots=True)
+class SizeSource:
+    """Entities from which the mesh size grows.
+
+    Attributes
+    ----------
+    size : float
+        Mesh size on the entities.
+    point_tags : list[Tag], default []
+    curve_tags : list[Tag], default []
+    """
+
+    size: float
+    point_tags: list[Tag] = field(default_factory=list)
+    curve_tags: list[Tag] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class CornerSource:
+    """Vertex around which the mesh size is algebraically graded.
+
+    Attributes
+    ----------
+    point_tag : Tag
+    size : float
+        Mesh size at distance `radius` of the vertex.
+    radius : float
+        Radius of the graded region, must be > `size`.
+    exponent : float
+        Singular exponent of the corner, in (0, 1).
+    """
+
+    point_tag: Tag
+    size: float
+    radius: float
+    exponent: float
+
+    def min_size(self: Self) -> float:
+        """Mesh size at the vertex, such that the first element is graded."""
+        return self.radius * (self.size / self.radius) ** (1 / self.exponent)
+
+
+@dataclass(frozen=True, slots=True)
+class SizeMap:
+    """Mesh size on the triangles of a mesh.
+
+    Attributes
+    ----------
+    mesh : MeshData
+    sizes : VecN
+        Mesh size on each triangle.
+    """
+
+    mesh: MeshData
+    sizes: VecN
+
+    def add_field(self: Self) -> Tag:
+        """Add a field interpolating the mesh size on the triangles.
+
+        The size at a vertex is the smallest size of the triangles around it.
+        Outside of the triangles, the field does not bound the mesh size.
+
+        Returns
+        -------
+        Tag
+            Tag of the field.
+        """
+        vertices = self.mesh.vertices()
+        node_sizes = full(self.mesh.nodes.shape[0], inf)
+        minimum.at(
+            node_sizes, vertices, broadcast_to(self.sizes[:, None], vertices.shape)
+        )
+
+        # Scalar triangles: coordinates x, y, z of the 3 vertices, then values.
+        points = self.mesh.nodes[vertices]
+        data = (
+            points[:, :, 0],
+            points[:, :, 1],
+            zeros_like(points[:, :, 0]),
+            node_sizes[vertices],
+        )
+        view = gmsh.view.add("size map")
+        gmsh.view.add_list_data(view, "ST", vertices.shape[0], hstack(data).ravel())
+
+        field_tag = FIELD.add("PostView")
+        FIELD.set_number(field_tag, "ViewTag", view)
+        return field_tag
+
+
+def singular_exponent(corner: Corner) -> float:
+    """Exponent of the leading singularity r^λ at a corner, λ = π / ω where ω is
+    the largest of the angles on both sides."""
+    return float(pi / max(corner.angle, 2 * pi - corner.angle))
+
+
+def graded_fields(
+    sources: list[SizeSource], growth_rate: float, max_size: float
+) -> list[Tag]:
+    """Add a field of mesh size ``min(max_size, size + (growth_rate - 1) * d)``
+    at distance d of each source."""
+    threshold_tags: list[Tag] = []
+    for source in sources:
+        distance = FIELD.add("Distance")
+        if source.point_tags:
+            FIELD.set_numbers(distance, "PointsList", source.point_tags)
+        if source.curve_tags:
+            FIELD.set_numbers(
+                distance, "CurvesList", [abs(t) for t in source.curve_tags]
+            )
+
+        size_max = max(max_size, source.size)
+        threshold = FIELD.add("Threshold")
+        FIELD.set_number(threshold, "InField", distance)
+        FIELD.set_number(threshold, "SizeMin", source.size)
+        FIELD.set_number(threshold, "SizeMax", size_max)
+        FIELD.set_number(threshold, "DistMin", 0)
+        FIELD.set_number(
+            threshold, "DistMax", (size_max - source.size) / (growth_rate - 1)
+        )
+        threshold_tags.append(threshold)
+
+    return threshold_tags
+
+
+def corner_fields(sources: list[CornerSource]) -> list[Tag]:
+    """Add a field of mesh size ``min_size + size * (d / radius)^(1 - exponent)``
+    at distance d of each corner.
+
+    The size is not bounded, it is the minimum with the sizes of the points and
+    of the other fields that limits it away from the corner.
+    """
+    field_tags: list[Tag] = []
+    for source in sources:
+        distance = FIELD.add("Distance")
+        FIELD.set_numbers(distance, "PointsList", [source.point_tag])
+
+        math_eval = FIELD.add("MathEval")
+        FIELD.set_string(
+            math_eval,
+            "F",
+            f"{source.min_size():.12g} + {source.size:.12g}"
+            f" * (F{distance} / {source.radius:.12g})^{1 - source.exponent:.12g}",
+        )
+        field_tags.append(math_eval)
+
+    return field_tags
+
+
+def set_background_field(field_tags: list[Tag]) -> Tag:
+    """Set the minimum of the fields as background mesh size field."""
+    field_tag = FIELD.add("Min")
+    FIELD.set_numbers(field_tag, "FieldsList", field_tags)
+    FIELD.set_as_background_mesh(field_tag)
+
+    return field_tag
@@ -0,0 +1,476 @@
+"""Meshes of symmetric geometries from a fundamental sector."""
+
+from copy import copy
+from functools import partial
+from pathlib import PurePath
+from tempfile import TemporaryDirectory
+from typing import Final
+
+import gmsh
+from numpy import (
+    arange,
+    arctan2,
+    array,
+    ceil,
+    concatenate,
+    cos,
+    flatnonzero,
+    inf,
+    linspace,
+    pi,
+    sin,
+    sqrt,
+    tile,
+)
+from numpy.linalg import det, norm
+
+from ..circular_iterable import circular_pairwise
+from ..geometry import (
+    CircularBoundary,
+    ExteriorBoundary,
+    Geometry,
+    RectangularBoundary,
+    Symmetry,
+    find_symmetry,
+)
+from ..geometry.points import RTOL, contains, merge_points, signed_area
+from ..type_alias import MatNx2, Tag, Vec2
+from .context_manager import GmshContextManager, GmshOptions
+from .elevate import elevate_order
+from .mesh_data import MeshData
+from .mesh_size import MeshSize, MeshSizes
+
+GEO: Final = gmsh.model.geo
+
+Point = tuple[float, float]
+Edge = tuple[Point, Point, bool]  # start, end and True for an arc about the center
+
+
+def mesh_symmetric(
+    geometry: Geometry,
+    mesh_size: MeshSize,
+    gmsh_options: GmshOptions = GmshOptions(),
+) -> MeshData:
+    """Unstructured mesh of a symmetric geometry from a fundamental sector.
+
+    The largest group of symmetries of the geometry is found by
+    `find_symmetry`. Only a fundamental sector is meshed by gmsh, with the
+    nodes of its sides matching by rotation, and its rotated and reflected
+    copies make the mesh of the geometry, symmetric by construction. The nodes
+    of the sides of the copies are merged, and the mesh is elevated to the
+    element order of `gmsh_options` after the merge.
+
+    Parameters
+    ----------
+    geometry : Geometry
+    mesh_size : float | Mapping[str, float]
+        Mesh size, see `mesh_unstructured`.
+    gmsh_options : GmshOptions, optional
+        Options of the mesh of the sector. If `filename` is given, the mesh is
+        written to it with its 2D physical groups.
+
+    Returns
+    -------
+    MeshData
+
+    Raises
+    ------
+    ValueError
+        If the geometry has no symmetry, or if a side of the sector crosses
+        the boundary of a polygon more than twice.
+    """
+    symmetry = find_symmetry(geometry)
+    if symmetry.size() == 1:
+        raise ValueError("The geometry has no symmetry.")
+    sizes = MeshSizes.from_mesh_size(geometry, mesh_size)
+    tol = RTOL * _outer_radius(geometry)
+
+    with TemporaryDirectory() as directory:
+        sector_options = copy(gmsh_options)
+        sector_options.filename = PurePath(directory) / "sector.msh"
+        sector_options.key_val = {**gmsh_options.key_val, "Mesh.ElementOrder": 1}
+
+        sides: list[list[Tag]] = []
+        with GmshContextManager(
+            sector_options, generate=partial(_generate_sector, symmetry, sides)
+        ) as ctx:
+            sides.extend(_build_sector(ctx, geometry, sizes, symmetry, tol))
+
+        sector = MeshData.from_msh(sector_options.filename)
+
+    mesh = elevate_order(
+        _unfold(sector, symmetry, tol), gmsh_options.key_val["Mesh.ElementOrder"]
+    )
+
+    if gmsh_options.filename is not None:
+        mesh.write(gmsh_options.filename)
+
+    return mesh
+
+
+def _build_sector(
+    ctx: GmshContextManager,
+    geometry: Geometry,
+    sizes: MeshSizes,
+    symmetry: Symmetry,
+    tol: float,
+) -> tuple[list[Tag], list[Tag]]:
+    """Build the CAD model of the fundamental sector, and return the curves of
+    its first and second sides from the center."""
+    regions = _sector_regions(geometry, symmetry, tol)
+
+    point_sizes: dict[Point, float] = {}
+    for name, edges in regions:
+        for p, q, _ in edges:
+            for point in (p, q):
+                point_sizes[point] = min(point_sizes.get(point, inf), sizes[name])
+
+    point_tags: dict[Point, Tag] = {}
+
+    def point_tag(point: Point) -> Tag:
+        if point not in point_tags:
+            size = point_sizes.get(point, sizes.default)
+            point_tags[point] = GEO.add_point(point[0], point[1], 0, size)
+        return point_tags[point]
+
+    center = (float(symmetry.center[0]), float(symmetry.center[1]))
+    curve_tags: dict[Edge, Tag] = {}
+
+    def curve_tag(edge: Edge) -> Tag:
+        p, q, arc = edge
+        if (q, p, arc) in curve_tags:
+            return -curve_tags[(q, p, arc)]
+        if edge not in curve_tags:
+            curve_tags[edge] = (
+                GEO.add_circle_arc(point_tag(p), point_tag(center), point_tag(q))
+                if arc
+                else GEO.add_line(point_tag(p), point_tag(q))
+            )
+        return curve_tags[edge]
+
+    for name, edges in regions:
+        surface_tags: list[Tag] = []
+        for outer, holes in _loops(edges, symmetry.center):
+            loop_tags = [
+                GEO.add_curve_loop([curve_tag(edge) for edge in loop])
+                for loop in (outer, *holes)
+            ]
+            surface_tags.append(GEO.add_plane_surface(loop_tags))
+        ctx.update_domain_tags({(2, name): surface_tags})
+
+    def side(k: int) -> list[Tag]:
+        on_side = [
+            (min(_distance(p, center), _distance(q, center)), tag)
+            for (p, q, arc), tag in curve_tags.items()
+            if not arc
+            and _on_side(p, k, symmetry, tol)
+            and _on_side(q, k, symmetry, tol)
+        ]
+        return [tag for _, tag in sorted(on_side)]
+
+    return (side(0), side(1))
+
+
+def _generate_sector(symmetry: Symmetry, sides: list[list[Tag]]) -> None:
+    """Mesh the sector, with the nodes of the second side the rotation of those
+    of the first side if there are no reflections."""
+    if not symmetry.reflections:
+        (cx, cy), angle = symmetry.center, symmetry.opening()
+        c, s = float(cos(angle)), float(sin(angle))
+        tx, ty = cx - (c * cx - s * cy), cy - (s * cx + c * cy)
+        gmsh.model.mesh.set_periodic(
+            1,
+            sides[1],
+            sides[0],
+            [c, -s, 0, tx, s, c, 0, ty, 0, 0, 1, 0, 0, 0, 0, 1],
+        )
+
+    gmsh.model.mesh.generate(2)
+
+    return None
+
+
+def _sector_regions(
+    geometry: Geometry, symmetry: Symmetry, tol: float
+) -> list[tuple[str, list[Edge]]]:
+    """Oriented boundary edges of each region in the fundamental sector.
+
+    The pieces of the polygons and of the exterior boundary in the sector are
+    cut at the points of the sides, so a region is the edges of its piece and
+    the reversed edges of its holes, without the edges in both.
+    """
+    boundary = geometry.boundary
+    pieces: list[tuple[str, list[Edge]]] = []
+    for polygon in geometry.polygons:
+        points = _clip(polygon.vertices, symmetry, tol)
+        if points:
+            pieces.append((polygon.name, _lines(points)))
+    inner = _boundary_edges(boundary, 0.0, symmetry, tol)
+    outer = (
+        _boundary_edges(boundary, boundary.thickness, symmetry, tol)
+        if boundary.thickness is not None
+        else []
+    )
+
+    # The center is kept to cut the sides at the same points after a rotation.
+    center = (float(symmetry.center[0]), float(symmetry.center[1]))
+    on_sides = {
+        point
+        for _, edges in [*pieces, ("", inner), ("", outer)]
+        for p, q, _ in edges
+        for point in (p, q)
+        if _on_side(point, 0, symmetry, tol) or _on_side(point, 1, symmetry, tol)
+    }
+    cuts = array(sorted(on_sides | {center}))
+
+    def cut(edges: list[Edge]) -> list[Edge]:
+        return [piece for edge in edges for piece in _cut(edge, cuts, tol)]
+
+    pieces = [(name, cut(edges)) for name, edges in pieces]
+    inner, outer = cut(inner), cut(outer)
+
+    regions = [
+        *pieces,
+        (
+            boundary.background_name,
+            _cancel(inner + [_reverse(e) for _, edges in pieces for e in edges]),
+        ),
+    ]
+    if outer:
+        regions.append(
+            (boundary.thickness_name, _cancel(outer + [_reverse(e) for e in inner]))
+        )
+
+    return regions
+
+
+def _clip(vertices: MatNx2, symmetry: Symmetry, tol: float) -> list[Point]:
+    """Vertices of the intersection of a polygon with the sector, empty if it is
+    outside. The sector is convex since its angle is at most π."""
+    center = symmetry.center
+    first, second = (
+        _direction(symmetry.angle),
+        _direction(symmetry.angle + symmetry.opening()),
+    )
+    points = vertices
+    for normal in (array([-first[1], first[0]]), array([second[1], -second[0]])):
+        values = (points - center) @ normal
+        clipped: list[Vec2] = []
+        for (p, a), (q, b) in circular_pairwise(list(zip(points, values))):
+            if a >= -tol:
+                clipped.append(p)
+            if (a > tol and b < -tol) or (a < -tol and b > tol):
+                clipped.append(p + a / (a - b) * (q - p))
+        if len(clipped) < 3:
+            return []
+        points = array(clipped)
+
+    result: list[Point] = []
+    for p in points:
+        point = (
+            (float(center[0]), float(center[1]))
+            if norm(p - center) <= tol
+            else (float(p[0]), float(p[1]))
+        )
+        if not result or _distance(point, result[-1]) > tol:
+            result.append(point)
+    if _distance(result[0], result[-1]) <= tol:
+        result.pop()
+
+    return result if len(result) >= 3 else []
+
+
+def _boundary_edges(
+    boundary: ExteriorBoundary,
+    offset: float,
+    symmetry: Symmetry,
+    tol: float,
+) -> list[Edge]:
+    """Edges of the exterior boundary, offset outwards, in the sector."""
+    if isinstance(boundary, RectangularBoundary):
+        (xl, yl), (xh, yh) = boundary.corner_low - offset, boundary.corner_high + offset
+        corners = array([[xl, yl], [xh, yl], [xh, yh], [xl, yh]])
+        return _lines(_clip(corners, symmetry, tol))
+    if not isinstance(boundary, CircularBoundary):
+        raise ValueError("Unknown boundary shape.")
+
+    # The arcs are shorter than π for gmsh.
+    center = (float(symmetry.center[0]), float(symmetry.center[1]))
+    radius = boundary.radius + offset
+    opening = symmetry.opening()
+    angles = linspace(
+        symmetry.angle, symmetry.angle + opening, int(ceil(2 * opening / pi)) + 1
+    )
+    points = [
+        (
+            float(center[0] + radius * cos(angle)),
+            float(center[1] + radius * sin(angle)),
+        )
+        for angle in angles
+    ]
+    return [
+        (center, points[0], False),
+        *((p, q, True) for p, q in zip(points[:-1], points[1:])),
+        (points[-1], center, False),
+    ]
+
+
+def _lines(points: list[Point]) -> list[Edge]:
+    """Closed polyline."""
+    return [(p, q, False) for p, q in circular_pairwise(points)]
+
+
+def _cut(edge: Edge, cuts: MatNx2, tol: float) -> list[Edge]:
+    """Cut a line at the points strictly inside it."""
+    p, q, arc = edge
+    if arc:
+        return [edge]
+
+    a, u = array(p), array(q) - array(p)
+    length = float(norm(u))
+    t = (cuts - a) @ u / length**2
+    distance = abs((cuts[:, 0] - a[0]) * u[1] - (cuts[:, 1] - a[1]) * u[0]) / length
+    inside = flatnonzero(
+        (distance <= tol) & (t * length > tol) & ((1 - t) * length > tol)
+    )
+    points = [
+        p,
+        *((float(cuts[i, 0]), float(cuts[i, 1])) for i in inside[t[inside].argsort()]),
+        q,
+    ]
+
+    return [(a, b, False) for a, b in zip(points[:-1], points[1:])]
+
+
+def _cancel(edges: list[Edge]) -> list[Edge]:
+    """Remove the pairs of opposite edges."""
+    keys = set(edges)
+    return [edge for edge in edges if _reverse(edge) not in keys]
+
+
+def _reverse(edge: Edge) -> Edge:
+    """Edge in the opposite direction."""
+    return (edge[1], edge[0], edge[2])
+
+
+def _loops(
+    edges: list[Edge], center: Vec2
+) -> list[tuple[list[Edge], list[list[Edge]]]]:
+    """Chain the edges into counterclockwise outer loops with their clockwise
+    holes."""
+    following: dict[Point, Edge] = {}
+    for edge in edges:
+        if edge[0] in following:
+            raise ValueError("A side of the sector crosses a polygon more than twice.")
+        following[edge[0]] = edge
+
+    loops: list[list[Edge]] = []
+    while following:
+        loop = [following.pop(next(iter(following)))]
+        while loop[-1][1] != loop[0][0]:
+            if loop[-1][1] not in following:
+                raise ValueError("The regions of the sector are not closed.")
+            loop.append(following.pop(loop[-1][1]))
+        loops.append(loop)
+
+    outlines = [_outline(loop, center) for loop in loops]
+    areas = [signed_area(outline) for outline in outlines]
+    outers = [k for k, area in enumerate(areas) if area > 0]
+    holes: dict[int, list[list[Edge]]] = {k: [] for k in outers}
+    for k, area in enumerate(areas):
+        if area > 0:
+            continue
+        (px, py), (qx, qy), _ = loops[k][0]
+        point = ((px + qx) / 2, (py + qy) / 2)
+        around = [j for j in outers if contains(outlines[j], point)]
+        if not around:
+            raise ValueError("The regions of the sector are not closed.")
+        holes[min(around, key=lambda j: areas[j])].append(loops[k])
+
+    return [(loops[k], holes[k]) for k in outers]
+
+
+def _outline(loop: list[Edge], center: Vec2) -> MatNx2:
+    """Polyline of a loop, with sampled arcs."""
+    points: list[Point] = []
+    for p, q, arc in loop:
+        points.append(p)
+        if arc:
+            (r, a), (_, b) = _polar(p, center), _polar(q, center)
+            b = a + (b - a + pi) % (2 * pi) - pi
+            points.extend(
+                (center[0] + r * cos(t), center[1] + r * sin(t))
+                for t in linspace(a, b, 9)[1:-1]
+            )
+    return array(points)
+
+
+def _unfold(sector: MeshData, symmetry: Symmetry, tol: float) -> MeshData:
+    """Mesh of the geometry from the copies of the mesh of the sector."""
+    center, transforms = symmetry.center, symmetry.transforms()
+    nb_nodes = sector.nodes.shape[0]
+
+    # The reflections reverse the orientation of the triangles.
+    nodes = concatenate([center + (sector.nodes - center) @ m.T for m in transforms])
+    triangles = concatenate(
+        [
+            sector.triangles[:, [0, 1, 2] if det(m) > 0 else [0, 2, 1]] + k * nb_nodes
+            for k, m in enumerate(transforms)
+        ]
+    )
+
+    on_sides = array(
+        [
+            _on_side(point, 0, symmetry, tol) or _on_side(point, 1, symmetry, tol)
+            for point in sector.nodes
+        ],
+        dtype=bool,
+    )
+    nodes, index = merge_points(
+        nodes, tol, flatnonzero(tile(on_sides, len(transforms)))
+    )
+    triangles = index[triangles]
+
+    return MeshData(
+        nodes,
+        triangles,
+        arange(1, triangles.shape[0] + 1),
+        None
+        if sector.physical_tags is None
+        else tile(sector.physical_tags, len(transforms)),
+        sector.physical_names,
+    )
+
+
+def _on_side(point: Point | Vec2, k: int, symmetry: Symmetry, tol: float) -> bool:
+    """Whether a point is on the first (k = 0) or second (k = 1) side."""
+    u = _direction(symmetry.angle + k * symmetry.opening())
+    x, y = point[0] - symmetry.center[0], point[1] - symmetry.center[1]
+    return bool(abs(u[0] * y - u[1] * x) <= tol and u[0] * x + u[1] * y >= -tol)
+
+
+def _polar(point: Point, center: Vec2) -> tuple[float, float]:
+    """Distance to a center and polar angle."""
+    x, y = point[0] - center[0], point[1] - center[1]
+    return (float(sqrt(x**2 + y**2)), float(arctan2(y, x)))
+
+
+def _direction(angle: float) -> Vec2:
+    """Unit vector at an angle."""
+    return array([cos(angle), sin(angle)])
+
+
+def _distance(p: Point, q: Point) -> float:
+    """Distance between two points."""
+    return float(sqrt((p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2))
+
+
+def _outer_radius(geometry: Geometry) -> float:
+    """Radius of a disk around the exterior boundary."""
+    boundary = geometry.boundary
+    thickness = boundary.thickness if boundary.thickness is not None else 0.0
+    if isinstance(boundary, CircularBoundary):
+        return boundary.radius + thickness
+    if isinstance(boundary, RectangularBoundary):
+        return float(norm(boundary.corner_high - boundary.corner_low)) + 2 * thickness
+    raise ValueError("Unknown boundary shape.")
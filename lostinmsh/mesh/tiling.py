@@ -0,0 +1,191 @@
+"""Periodic tilings of a unit cell."""
+
+from collections.abc import Callable
+from copy import copy
+from pathlib import PurePath
+from tempfile import TemporaryDirectory
+
+import gmsh
+from numpy import arange, flatnonzero, meshgrid, stack, tile
+from numpy.linalg import norm
+
+from ..geometry import Geometry, RectangularBoundary
+from ..geometry.points import RTOL, merge_points
+from ..type_alias import Tag
+from .context_manager import GmshContextManager, GmshOptions
+from .elevate import elevate_order
+from .mesh_data import MeshData
+from .mesh_lost import _build_lost
+from .mesh_size import MeshSize
+from .mesh_unst import _build_unst
+
+
+def mesh_tiling(
+    geometry: Geometry,
+    mesh_size: MeshSize,
+    repeats: tuple[int, int],
+    gmsh_options: GmshOptions = GmshOptions(),
+    *,
+    method: str = "locally_structured",
+) -> MeshData:
+    """Mesh a unit cell with periodic sides once, and tile it.
+
+    The unit cell is a geometry with a rectangular boundary without thickness.
+    It is meshed by gmsh with the nodes of the opposite sides matching, the
+    copies are then translated and the nodes of the shared sides merged by
+    `tile_mesh`. The tiling is elevated to the element order of `gmsh_options`
+    after the merge.
+
+    Parameters
+    ----------
+    geometry : Geometry
+        Unit cell.
+    mesh_size : float | Mapping[str, float]
+        Mesh size of the unit cell, see `mesh_locally_structured`.
+    repeats : tuple[int, int]
+        Number of cells along x and y.
+    gmsh_options : GmshOptions, optional
+        Options of the mesh of the unit cell. If `filename` is given, the tiling
+        is written to it.
+    method : str, optional, default "locally_structured"
+        Either "unstructured" or "locally_structured".
+
+    Returns
+    -------
+    MeshData
+
+    Raises
+    ------
+    ValueError
+        If the boundary is not a rectangle without thickness, if the number of
+        cells is less than 1, or if the method is unknown.
+    """
+    boundary = geometry.boundary
+    if not isinstance(boundary, RectangularBoundary) or boundary.thickness is not None:
+        raise ValueError("The unit cell must be a rectangle without thickness.")
+    if min(repeats) < 1:
+        raise ValueError("Number of cells must be integers >= 1.")
+    builders: dict[str, Callable[[GmshContextManager, Geometry, MeshSize], None]] = {
+        "unstructured": _build_unst,
+        "locally_structured": _build_lost,
+    }
+    if method not in builders:
+        raise ValueError(f"Unknown meshing method {method!r}.")
+
+    with TemporaryDirectory() as directory:
+        cell_options = copy(gmsh_options)
+        cell_options.filename = PurePath(directory) / "cell.msh"
+        cell_options.key_val = {**gmsh_options.key_val, "Mesh.ElementOrder": 1}
+
+        with GmshContextManager(
+            cell_options, generate=lambda: _generate_periodic(boundary)
+        ) as ctx:
+            builders[method](ctx, geometry, mesh_size)
+
+        cell = MeshData.from_msh(cell_options.filename)
+
+    periods = boundary.corner_high - boundary.corner_low
+    mesh = elevate_order(
+        tile_mesh(cell, (float(periods[0]), float(periods[1])), repeats),
+        gmsh_options.key_val["Mesh.ElementOrder"],
+    )
+
+    if gmsh_options.filename is not None:
+        mesh.write(gmsh_options.filename)
+
+    return mesh
+
+
+def tile_mesh(
+    cell: MeshData, periods: tuple[float, float], repeats: tuple[int, int]
+) -> MeshData:
+    """Tile the mesh of a unit cell by translation.
+
+    The nodes on the sides of the cell at distance less than `RTOL` times the
+    diagonal of the cell of a node of another copy are merged. The copies are
+    ordered along x first, their triangles keep the physical groups of the cell.
+
+    Parameters
+    ----------
+    cell : MeshData
+    periods : tuple[float, float]
+        Size of the cell along x and y.
+    repeats : tuple[int, int]
+        Number of cells along x and y.
+
+    Returns
+    -------
+    MeshData
+    """
+    nb_nodes = cell.nodes.shape[0]
+    shift_y, shift_x = meshgrid(
+        arange(repeats[1]) * periods[1], arange(repeats[0]) * periods[0], indexing="ij"
+    )
+    shifts = stack((shift_x.ravel(), shift_y.ravel()), axis=1)
+    nb_cells = shifts.shape[0]
+
+    nodes = (cell.nodes + shifts[:, None]).reshape(-1, 2)
+    triangles = (cell.triangles + (arange(nb_cells) * nb_nodes)[:, None, None]).reshape(
+        -1, cell.triangles.shape[1]
+    )
+
+    # Only the nodes on the sides of the cell may be merged.
+    low, high = cell.nodes.min(axis=0), cell.nodes.max(axis=0)
+    tol = RTOL * float(norm(high - low))
+    on_sides = ((cell.nodes - low < tol) | (high - cell.nodes < tol)).any(axis=1)
+
+    # A node shared by several copies is merged in its first copy.
+    nodes, index = merge_points(nodes, tol, flatnonzero(tile(on_sides, nb_cells)))
+
+    return MeshData(
+        nodes,
+        index[triangles],
+        arange(1, triangles.shape[0] + 1),
+        None if cell.physical_tags is None else tile(cell.physical_tags, nb_cells),
+        cell.physical_names,
+    )
+
+
+def _generate_periodic(boundary: RectangularBoundary) -> None:
+    """Mesh the model with the opposite sides of the rectangle periodic."""
+    low, high = boundary.corner_low, boundary.corner_high
+    tol = RTOL * float(norm(high - low))
+
+    # Curves of the sides at low and high coordinate along each axis, with
+    # their extent along the side.
+    sides: dict[tuple[int, bool], list[tuple[float, float, Tag]]] = {
+        (axis, at_high): [] for axis in (0, 1) for at_high in (False, True)
+    }
+    for _, tag in gmsh.model.get_entities(1):
+        x_min, y_min, _, x_max, y_max, _ = gmsh.model.get_bounding_box(1, tag)
+        box_min, box_max = (x_min, y_min), (x_max, y_max)
+        for axis in (0, 1):
+            if box_max[axis] - box_min[axis] > tol:
+                continue
+            for at_high, value in ((False, low[axis]), (True, high[axis])):
+                if abs(box_min[axis] - value) < tol:
+                    sides[(axis, at_high)].append(
+                        (box_min[1 - axis], box_max[1 - axis], tag)
+                    )
+
+    for axis in (0, 1):
+        masters = sorted(sides[(axis, False)])
+        slaves = sorted(sides[(axis, True)])
+        if len(masters) != len(slaves) or any(
+            abs(m[0] - s[0]) > tol or abs(m[1] - s[1]) > tol
+            for m, s in zip(masters, slaves)
+        ):
+            raise ValueError("The opposite sides of the unit cell do not match.")
+
+        translation = [0.0, 0.0]
+        translation[axis] = float(high[axis] - low[axis])
+        gmsh.model.mesh.set_periodic(
+            1,
+            [s[2] for s in slaves],
+            [m[2] for m in masters],
+            [1, 0, 0, translation[0], 0, 1, 0, translation[1], 0, 0, 1, 0, 0, 0, 0, 1],
+        )
+
+    gmsh.model.mesh.generate(2)
+
+    return None
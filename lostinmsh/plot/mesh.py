@@ -7,6 +7,7 @@ ENABLE_MESHIO = True
 try:
     import matplotlib.pyplot as plt
     import meshio
+    from matplotlib.collections import PolyCollection
 except ImportError:
     ENABLE_MATPLOTLIB = False
     ENABLE_MESHIO = False
@@ -38,34 +39,50 @@ def _plot_mesh(filename: PurePath | str, ax) -> None:
     mesh = meshio.read(filename)
     pts = mesh.points[:, :2]
 
-    # Handle triangular elements of any order (triangle, triangle6, triangle10, etc.)
-    cell_type = None
-    triangles = None
-
-    for key in mesh.cells_dict.keys():
-        if key.startswith("triangle"):
-            cell_type = key
-            triangles = mesh.cells_dict[key][:, :3]
-            break
-
-    if cell_type is None or triangles is None:
-        raise ValueError("No triangle elements found in mesh")
-
-    triangle_tags = mesh.cell_data_dict["gmsh:physical"][cell_type]
+    # Handle elements of any order (triangle, triangle6, quad, quad9, etc.)
+    triangles = _first_cells(mesh, "triangle")
+    quads = _first_cells(mesh, "quad")
+
+    if triangles is None and quads is None:
+        raise ValueError("No triangle or quadrangle elements found in mesh")
+
+    groups = [(name, tag) for name, (tag, dim) in mesh.field_data.items() if dim == 2]
+    for k, (name, tag) in enumerate(groups):
+        label = name
+
+        if triangles is not None and (triangles[1] == tag).any():
+            ax.triplot(
+                pts[:, 0],
+                pts[:, 1],
+                triangles[0][triangles[1] == tag, :3],
+                color=f"C{k}",
+                linewidth=0.5,
+                label=label,
+            )
+            label = None
+
+        if quads is not None and (quads[1] == tag).any():
+            ax.add_collection(
+                PolyCollection(
+                    pts[quads[0][quads[1] == tag, :4]],
+                    facecolors="none",
+                    edgecolors=f"C{k}",
+                    linewidths=0.5,
+                    label=label,
+                )
+            )
+
+    ax.autoscale_view()
+    ax.set_aspect("equal")
+    ax.legend()
 
-    for name, (tag, dim) in mesh.field_data.items():
-        if dim != 2:
-            continue
+    return None
 
-        ax.triplot(
-            pts[:, 0],
-            pts[:, 1],
-            triangles[triangle_tags == tag],
-            linewidth=0.5,
-            label=name,
-        )
 
-    ax.set_aspect("equal")
-    ax.legend()
+def _first_cells(mesh, prefix: str):
+    """Cells of the first type starting with `prefix`, and their physical tags."""
+    for key, cells in mesh.cells_dict.items():
+        if key.startswith(prefix):
+            return cells, mesh.cell_data_dict["gmsh:physical"][key]
 
     return None
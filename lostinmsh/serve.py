@@ -0,0 +1,416 @@
+"""Local meshing server.
+
+Start it with ``python -m lostinmsh.serve --socket /tmp/lostinmsh.sock`` (or
+``--port 8765`` to listen on localhost). Clients send one JSON request per line
+and receive one JSON response per line:
+
+- ``{"command": "mesh", "job": {...}, "inline": false}`` where ``job`` is
+  created by `MeshJob.to_dict`, answers with the path of the cached mesh;
+- ``{"command": "stats"}`` answers with the queue depth and latency metrics;
+- ``{"command": "ping"}``.
+
+Jobs are run on a bounded pool of worker processes, identical in-flight jobs are
+meshed once and the meshes are stored in a cache directory shared by all the
+clients.
+"""
+
+import json
+import os
+import socket
+from argparse import ArgumentParser
+from base64 import b64encode
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+from pathlib import Path, PurePath
+from socketserver import (
+    BaseServer,
+    StreamRequestHandler,
+    ThreadingTCPServer,
+    ThreadingUnixStreamServer,
+)
+from threading import Lock
+from time import perf_counter
+from typing import Any, Self
+
+from numpy import asarray, percentile
+
+from .jobs import MeshJob, run_job
+
+Address = str | tuple[str, int]
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the server queue is full."""
+
+
+class MeshService:
+    """Queue, worker pool and cache of the meshing server.
+
+    Parameters
+    ----------
+    cache_dir : PurePath | str
+        Directory where the meshes are stored.
+    workers : int | None, optional, default None
+        Number of worker processes, if None the number of CPUs.
+    max_queue : int, optional, default 64
+        Maximum number of jobs waiting for a worker.
+    """
+
+    def __init__(
+        self: Self,
+        cache_dir: PurePath | str,
+        *,
+        workers: int | None = None,
+        max_queue: int = 64,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        if self.workers < 1:
+            raise ValueError("The number of workers must be at least one.")
+        self.max_queue = max_queue
+
+        # gmsh keeps a global state, jobs are run in fresh processes.
+        self._executor = ProcessPoolExecutor(
+            self.workers, mp_context=get_context("spawn")
+        )
+        self._lock = Lock()
+        self._in_flight: dict[str, Future[float]] = {}
+        self._counters = {
+            "requests": 0,
+            "cache_hits": 0,
+            "deduplicated": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+        }
+        self._latencies: deque[float] = deque(maxlen=1024)
+        self._mesh_times: deque[float] = deque(maxlen=1024)
+
+        return None
+
+    def cache_path(self: Self, key: str) -> Path:
+        """Path of the cached mesh of a job key."""
+        return self.cache_dir / f"{key}.msh"
+
+    def mesh(self: Self, job: MeshJob) -> tuple[Path, str]:
+        """Mesh a job, or get it from the cache, and wait for the result.
+
+        Parameters
+        ----------
+        job : MeshJob
+
+        Returns
+        -------
+        tuple[Path, str]
+            Path to the mesh file and how it was obtained: "cached",
+            "deduplicated" or "meshed".
+
+        Raises
+        ------
+        QueueFullError
+            If too many jobs are already waiting.
+        """
+        start = perf_counter()
+        key = job.key()
+        path = self.cache_path(key)
+
+        future: Future[float] | None = None
+        with self._lock:
+            self._counters["requests"] += 1
+
+            if path.exists():
+                self._counters["cache_hits"] += 1
+                status = "cached"
+
+            elif key in self._in_flight:
+                self._counters["deduplicated"] += 1
+                future = self._in_flight[key]
+                status = "deduplicated"
+
+            elif len(self._in_flight) >= self.workers + self.max_queue:
+                self._counters["rejected"] += 1
+                raise QueueFullError("The meshing queue is full.")
+
+            else:
+                future = self._executor.submit(run_job, job, path)
+                self._in_flight[key] = future
+                status = "meshed"
+
+        # A finished future runs the callback at once, it takes the lock.
+        if status == "meshed":
+            assert future is not None
+            future.add_done_callback(partial(self._job_done, key))
+
+        if future is not None:
+            future.result()
+
+        with self._lock:
+            self._latencies.append(perf_counter() - start)
+
+        return (path, status)
+
+    def _job_done(self: Self, key: str, future: Future[float]) -> None:
+        """Update the metrics when a job is done."""
+        with self._lock:
+            del self._in_flight[key]
+
+            if future.exception() is not None:
+                self._counters["failed"] += 1
+            else:
+                self._counters["completed"] += 1
+                self._mesh_times.append(future.result())
+
+        return None
+
+    def stats(self: Self) -> dict[str, Any]:
+        """Return the queue depth and latency metrics."""
+        with self._lock:
+            in_flight = len(self._in_flight)
+            return {
+                "workers": self.workers,
+                "in_flight": in_flight,
+                "queue_depth": max(0, in_flight - self.workers),
+                "max_queue": self.max_queue,
+                **self._counters,
+                "latency": _summary(self._latencies),
+                "mesh_time": _summary(self._mesh_times),
+            }
+
+    def handle(self: Self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer a request of the protocol.
+
+        Parameters
+        ----------
+        request : dict[str, Any]
+
+        Returns
+        -------
+        dict[str, Any]
+        """
+        match request.get("command"):
+            case "mesh":
+                job = MeshJob.from_dict(request["job"])
+                path, status = self.mesh(job)
+                response: dict[str, Any] = {
+                    "status": status,
+                    "key": job.key(),
+                    "path": str(path),
+                }
+                if request.get("inline", False):
+                    response["mesh_base64"] = b64encode(path.read_bytes()).decode()
+                return response
+
+            case "stats":
+                return {"status": "ok", "stats": self.stats()}
+
+            case "ping":
+                return {"status": "ok"}
+
+            case command:
+                raise ValueError(f"Unknown command {command!r}.")
+
+    def shutdown(self: Self) -> None:
+        """Wait for the running jobs and stop the workers."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        return None
+
+
+def _summary(values: deque[float]) -> dict[str, float | int]:
+    """Summary statistics of durations in seconds."""
+    if not values:
+        return {"count": 0}
+
+    v = asarray(values)
+    p50, p95 = percentile(v, [50, 95])
+    return {
+        "count": len(v),
+        "mean": float(v.mean()),
+        "p50": float(p50),
+        "p95": float(p95),
+        "max": float(v.max()),
+    }
+
+
+class _MeshServer:
+    """Server of a meshing service."""
+
+    service: MeshService
+
+
+class _UnixServer(_MeshServer, ThreadingUnixStreamServer):
+    """Meshing server listening on a Unix socket."""
+
+    daemon_threads = True
+
+    def __init__(self: Self, address: str, service: MeshService) -> None:
+        self.service = service
+        super().__init__(address, _RequestHandler)
+
+
+class _TCPServer(_MeshServer, ThreadingTCPServer):
+    """Meshing server listening on a TCP address."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self: Self, address: tuple[str, int], service: MeshService) -> None:
+        self.service = service
+        super().__init__(address, _RequestHandler)
+
+
+class _RequestHandler(StreamRequestHandler):
+    """Newline delimited JSON requests handler."""
+
+    def handle(self: Self) -> None:
+        assert isinstance(self.server, _MeshServer)
+        service = self.server.service
+
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                response = service.handle(json.loads(line))
+            except Exception as error:
+                response = {
+                    "status": "error",
+                    "error": f"{type(error).__name__}: {error}",
+                }
+
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+        return None
+
+
+def make_server(address: Address, service: MeshService) -> BaseServer:
+    """Create the server listening on a Unix socket or on a TCP address.
+
+    Parameters
+    ----------
+    address : Address
+        Path to a Unix socket or (host, port).
+    service : MeshService
+
+    Returns
+    -------
+    BaseServer
+    """
+    if isinstance(address, str):
+        if os.path.exists(address):
+            os.unlink(address)
+        return _UnixServer(address, service)
+
+    return _TCPServer(address, service)
+
+
+def send_request(
+    address: Address, request: dict[str, Any], *, timeout: float | None = None
+) -> dict[str, Any]:
+    """Send a request to a meshing server and return the response.
+
+    Parameters
+    ----------
+    address : Address
+        Path to a Unix socket or (host, port).
+    request : dict[str, Any]
+    timeout : float | None, optional, default None
+
+    Returns
+    -------
+    dict[str, Any]
+
+    Raises
+    ------
+    RuntimeError
+        If the server answers with an error.
+    """
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(address)
+    else:
+        sock = socket.create_connection(address, timeout=timeout)
+
+    with sock, sock.makefile("rwb") as file:
+        file.write(json.dumps(request).encode() + b"\n")
+        file.flush()
+        response = json.loads(file.readline())
+
+    if response["status"] == "error":
+        raise RuntimeError(response["error"])
+
+    return response
+
+
+def request_mesh(
+    address: Address,
+    job: MeshJob,
+    *,
+    inline: bool = False,
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    """Ask a meshing server for the mesh of a job.
+
+    Parameters
+    ----------
+    address : Address
+        Path to a Unix socket or (host, port).
+    job : MeshJob
+    inline : bool, optional, default False
+        If True, the response contains the mesh file encoded in base64.
+    timeout : float | None, optional, default None
+
+    Returns
+    -------
+    dict[str, Any]
+    """
+    return send_request(
+        address,
+        {"command": "mesh", "job": job.to_dict(), "inline": inline},
+        timeout=timeout,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the meshing server."""
+    parser = ArgumentParser(
+        prog="python -m lostinmsh.serve", description="Local meshing server."
+    )
+    listen = parser.add_mutually_exclusive_group(required=True)
+    listen.add_argument("--socket", help="path to the Unix socket")
+    listen.add_argument("--port", type=int, help="TCP port on localhost")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument(
+        "--cache-dir", default=str(Path.home() / ".cache" / "lostinmsh")
+    )
+    args = parser.parse_args(argv)
+
+    address: Address = args.socket if args.socket else (args.host, args.port)
+    service = MeshService(
+        args.cache_dir, workers=args.workers, max_queue=args.max_queue
+    )
+    server = make_server(address, service)
+
+    print(f"lostinmsh server listening on {address}, cache in {args.cache_dir}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+        if isinstance(address, str) and os.path.exists(address):
+            os.unlink(address)
+
+    return None
+
+
+if __name__ == "__main__":
+    main()
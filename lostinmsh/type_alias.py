@@ -11,5 +11,7 @@ Mat2x2 = NDArray[Float]  # shape (2, 2)
 VecN = NDArray[Float]  # shape (N,) with N ≥ 1
 MatNx2 = NDArray[Float]  # shape (N, 2) with N ≥ 1
 
+IntArray = NDArray[Any]  # integer array
+
 Tag = int
 DimName = tuple[int, str]
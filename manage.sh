@@ -17,6 +17,14 @@ remove_file() {
 }
 
 case "$1" in
+-b | --bench)
+    # Results are stored as JSON in .asv/results for the current commit.
+    python -m asv run --python=same --set-commit-hash "$(git rev-parse HEAD)" ${2:+--bench "$2"}
+    ;;
+--bench-compare)
+    # Flag the benchmarks at least 10% slower on HEAD than on the given commit.
+    python -m asv continuous --factor 1.1 --split "${2:-main}" HEAD
+    ;;
 -c | --clean)
     remove_directory "__pycache__"
     remove_directory ".ipynb_checkpoints"
@@ -28,6 +36,8 @@ case "$1" in
     remove_directory "htmlcov"
     remove_file ".coverage"
 
+    remove_directory ".asv"
+
     remove_directory "_build"
     remove_directory "dist"
 
@@ -60,6 +70,8 @@ case "$1" in
     ;;
 *)
     echo "The choice are:"
+    echo "  > [-b | --bench] [regex] run the benchmarks on the current environment;"
+    echo "  > [--bench-compare] [commit] compare the benchmarks of HEAD and commit (default main);"
     echo "  > [-c | --clean] for cleaning the temporary python file;"
     echo "  > [-d | --docs] generate the documentation;"
     echo "  > [-f | --format] for formatting the code;"
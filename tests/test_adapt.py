@@ -0,0 +1,72 @@
+"""Tests for the adaptive remeshing."""
+
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+from lostinmsh.mesh import sizes_from_indicator
+
+
+def main(mesh_size: float) -> None:
+    square = lsm.MeshData(
+        np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]),
+        np.array([[0, 1, 2], [0, 2, 3]]),
+        np.array([1, 2]),
+    )
+    assert np.allclose(square.areas(), [0.5, 0.5])
+    assert np.allclose(square.sizes(), (2 + np.sqrt(2)) / 3)
+    assert np.allclose(square.centroids(), [[2 / 3, 1 / 3], [1 / 3, 2 / 3]])
+    assert square.select(np.array([False, True])).element_tags.tolist() == [2]
+
+    # Only the triangles above the mean indicator are refined.
+    sizes = sizes_from_indicator(square, [1.0, 0.0])
+    assert np.allclose(sizes, [square.sizes()[0] / np.sqrt(2), square.sizes()[1]])
+    with pytest.raises(ValueError):
+        sizes_from_indicator(square, [1.0, -1.0])
+
+    polygon = lsm.Polygon.from_vertices(
+        np.array([[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]]), "L"
+    )
+    boundary = lsm.rectangular_boundary([polygon], 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygon(polygon, boundary)
+
+    for method, mesh in (
+        ("unstructured", lsm.mesh_unstructured),
+        ("locally_structured", lsm.mesh_locally_structured),
+    ):
+        filename = mesh(
+            geometry, mesh_size, lsm.GmshOptions(filename=f"tests/adapt_{method}.msh")
+        )
+        assert filename is not None
+        previous = lsm.MeshData.from_msh(filename)
+
+        with pytest.raises(ValueError):
+            lsm.remesh_adaptive(geometry, previous, mesh_size, method=method)
+        with pytest.raises(ValueError):
+            lsm.remesh_adaptive(
+                geometry, previous, mesh_size, target_sizes=[mesh_size], method=method
+            )
+
+        # Error concentrated at the reentrant corner.
+        distances = np.linalg.norm(previous.centroids() - np.array([1, 1]), axis=1)
+        filename = lsm.remesh_adaptive(
+            geometry,
+            filename,
+            mesh_size,
+            lsm.GmshOptions(filename=f"tests/adapt_{method}_refined.msh"),
+            indicator=np.exp(-distances / mesh_size),
+            method=method,
+        )
+        assert filename is not None
+        refined = lsm.MeshData.from_msh(filename)
+        assert refined.triangles.shape[0] > previous.triangles.shape[0]
+
+    return None
+
+
+def test_adapt() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_adapt()
@@ -0,0 +1,64 @@
+"""Tests for the automatic choice of the meshing algorithm."""
+
+import logging
+
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+from lostinmsh.mesh.algorithm import (
+    SurfaceStatistics,
+    choose_algorithm,
+    is_measured,
+    load_algorithm_table,
+)
+
+
+def main(mesh_size: float) -> None:
+    assert choose_algorithm(SurfaceStatistics(2, 1.0, 1e3)) == 6
+    assert choose_algorithm(SurfaceStatistics(2, 10.0, 1e3)) == 5
+    assert choose_algorithm(SurfaceStatistics(100, 1.0, 1e6)) == 5
+    assert not is_measured(load_algorithm_table())
+
+    with pytest.raises(ValueError):
+        lsm.GmshOptions(mesh_algorithm="fastest")
+
+    a = 3 * np.pi / 4
+    c, s = np.cos(a / 2), np.sin(a / 2)
+    vertices = np.array([[0.0, 0.0], [c, s], [c, -s]])
+
+    polygons = [
+        lsm.Polygon.from_vertices(np.array([0.1, 0.0]) + vertices, "right"),
+        lsm.Polygon.from_vertices(np.array([-0.1, 0.0]) - vertices, "left"),
+    ]
+    boundary = lsm.rectangular_boundary(polygons, 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygons(polygons, boundary)
+
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append  # type: ignore[method-assign]
+    logger = logging.getLogger("lostinmsh.mesh")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        for mesh in (lsm.mesh_unstructured, lsm.mesh_locally_structured):
+            with pytest.warns(UserWarning, match="not measured"):
+                mesh(geometry, mesh_size, lsm.GmshOptions(mesh_algorithm="auto"))
+    finally:
+        logger.removeHandler(handler)
+
+    messages = [record.getMessage() for record in records]
+    assert len(messages) == 4
+    assert messages[0].startswith("background: 2 inner loops, size ratio 1,")
+    assert messages[1].startswith("PML: 1 inner loops")
+    assert "Mesh.Algorithm 5 (Delaunay)" in messages[2]
+
+    return None
+
+
+def test_algorithm() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_algorithm()
@@ -0,0 +1,82 @@
+"""Tests for the meshing within a budget."""
+
+import logging
+
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+from lostinmsh.mesh.budget import MeshBudget, SizeSearch
+
+
+def main(mesh_size: float) -> None:
+    cocotte = np.array([[2, 0], [3, 1], [3, 2], [1, 2], [1, 3], [0, 2], [1, 1], [2, 1]])
+    fleche = np.array([[2, 0], [2, 1], [3, 1], [2, 2], [1, 2], [1, 3], [0, 3], [0, 2]])
+
+    polygons = [
+        lsm.Polygon.from_vertices(cocotte - np.array([3.2, 0]), "cocotte"),
+        lsm.Polygon.from_vertices(fleche + np.array([0.2, 0]), "fleche"),
+    ]
+    boundary = lsm.rectangular_boundary(polygons, 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygons(polygons, boundary)
+
+    with pytest.raises(ValueError):
+        MeshBudget()
+
+    # The search returns the smallest mesh size predicted to fit.
+    for method in ("unstructured", "locally_structured"):
+        budget = MeshBudget(target_dofs=20_000, element_order=2)
+        search = SizeSearch(geometry, method, budget, calibration=(1.1, 1.1))
+        h = search.next_size(mesh_size)
+        assert search.usage(h) <= 1 < search.usage(0.99 * h)
+
+    # The estimates follow the options of the locally structured mesh.
+    options = lsm.CornerOptions(nb_rings=3, angular_refinement=1)
+    search = SizeSearch(geometry, "locally_structured", budget, corner_options=options)
+    estimate = lsm.estimate_mesh(geometry, mesh_size, corner_options=options)
+    assert search.estimate(mesh_size) == estimate
+
+    for mesh in (lsm.mesh_unstructured, lsm.mesh_locally_structured):
+        profiler = lsm.Profiler()
+        mesh(
+            geometry,
+            mesh_size,
+            lsm.GmshOptions(element_order=2, profiler=profiler),
+            target_elements=5_000,
+            target_dofs=8_000,
+        )
+        report = profiler.report
+        nb_triangles = sum(
+            val for key, val in report.nb_elements.items() if key.startswith("Triangle")
+        )
+        assert nb_triangles <= 5_000
+        assert report.nb_nodes <= 8_000
+
+    # The calibration mesh uses the same exterior algorithms as the final one.
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append  # type: ignore[method-assign]
+    logger = logging.getLogger("lostinmsh.mesh")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        lsm.mesh_locally_structured(
+            geometry,
+            mesh_size,
+            lsm.GmshOptions(mesh_algorithm="auto"),
+            target_elements=5_000,
+        )
+    finally:
+        logger.removeHandler(handler)
+    messages = [record.getMessage() for record in records]
+    assert sum(message.startswith("background:") for message in messages) >= 2
+
+    return None
+
+
+def test_budget() -> None:
+    main(0.5)
+
+
+if __name__ == "__main__":
+    test_budget()
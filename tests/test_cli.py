@@ -0,0 +1,76 @@
+"""Tests for the batch command line interface."""
+
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+from lostinmsh.cli import main as cli
+
+
+def main(mesh_size: float) -> None:
+    cocotte = np.array([[2, 0], [3, 1], [3, 2], [1, 2], [1, 3], [0, 2], [1, 1], [2, 1]])
+    fleche = np.array([[2, 0], [2, 1], [3, 1], [2, 2], [1, 2], [1, 3], [0, 3], [0, 2]])
+
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for name, vertices in [("cocotte", cocotte), ("fleche", fleche)]:
+            polygon = lsm.Polygon.from_vertices(vertices, name)
+            boundary = lsm.circular_boundary([polygon], 0.25, "background")
+            lsm.save_geometry(
+                lsm.Geometry.from_polygon(polygon, boundary), root / f"{name}.json"
+            )
+
+        # A malformed geometry file fails alone.
+        (root / "broken.json").write_text("{", encoding="utf-8")
+        files = [str(root / name) for name in ("cocotte.json", "fleche.json")]
+        options = ["--mode", "both", "-j", "2", "-o", tmp]
+        assert cli([*files, str(root / "broken.json"), "-s", "1", *options]) == 1
+        keys = {path.name: path.read_text() for path in root.glob("*.key")}
+        assert len(keys) == 4
+
+        # A new mesh size makes the meshes out of date.
+        argv = [*files, "-s", str(mesh_size), *options]
+        assert cli(argv) == 0
+        assert all(path.read_text() != keys[path.name] for path in root.glob("*.key"))
+
+        outputs = sorted(path.name for path in root.glob("*.msh"))
+        assert outputs == [
+            "cocotte_lost.msh",
+            "cocotte_unst.msh",
+            "fleche_lost.msh",
+            "fleche_unst.msh",
+        ]
+
+        mtimes = [path.stat().st_mtime for path in sorted(root.glob("*.msh"))]
+        assert cli(argv) == 0
+        assert mtimes == [path.stat().st_mtime for path in sorted(root.glob("*.msh"))]
+
+        # A malformed manifest exits, a job with bad options fails alone.
+        manifest = root / "manifest.json"
+        for jobs in (
+            [{"geometry": "cocotte.json", "method": "unknown"}],
+            [{"mesh_size": 1}],
+        ):
+            manifest.write_text(json.dumps(jobs), encoding="utf-8")
+            with pytest.raises(SystemExit):
+                cli(["-m", str(manifest), "-s", "1", "-o", tmp])
+        jobs = [
+            {"geometry": "cocotte.json", "options": {"mesh_algorithm": 5}},
+            {"geometry": "fleche.json", "mesh_size": -1},
+        ]
+        manifest.write_text(json.dumps(jobs), encoding="utf-8")
+        assert cli(["-m", str(manifest), "-s", "1", "-o", tmp]) == 1
+
+    return None
+
+
+def test_cli() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_cli()
@@ -0,0 +1,47 @@
+"""Tests for the gmsh context manager."""
+
+from pathlib import Path
+
+import gmsh
+import pytest
+
+import lostinmsh as lsm
+from lostinmsh.mesh.context_manager import GmshContextManager
+
+
+def main(mesh_size: float) -> None:
+    filename = Path("tests/context_manager.msh")
+    filename.unlink(missing_ok=True)
+
+    # An error while building the model propagates, gmsh is finalized and no
+    # mesh is written.
+    with pytest.raises(ValueError, match="Bad model"):
+        with GmshContextManager(lsm.GmshOptions(filename=filename)):
+            gmsh.model.geo.add_point(0, 0, 0, mesh_size)
+            raise ValueError("Bad model")
+    assert not gmsh.is_initialized()
+    assert not filename.exists()
+
+    with GmshContextManager(lsm.GmshOptions(filename=filename)):
+        points = [
+            gmsh.model.geo.add_point(x, y, 0, mesh_size)
+            for x, y in ((0, 0), (1, 0), (1, 1), (0, 1))
+        ]
+        lines = [
+            gmsh.model.geo.add_line(p, q)
+            for p, q in zip(points, points[1:] + points[:1])
+        ]
+        gmsh.model.geo.add_plane_surface([gmsh.model.geo.add_curve_loop(lines)])
+    assert not gmsh.is_initialized()
+    assert filename.exists()
+    filename.unlink()
+
+    return None
+
+
+def test_context_manager() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_context_manager()
@@ -0,0 +1,50 @@
+"""Tests for the multi-ring corners of the locally structured mesh."""
+
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+
+
+def main(mesh_size: float) -> None:
+    options = lsm.CornerOptions()
+    assert options.subdivisions() == [1, 2]
+    assert np.allclose(options.radii(0.3), [0.1, 0.3])
+
+    options = lsm.CornerOptions(nb_rings=4, radial_ratio=0.5, angular_refinement=1)
+    assert options.subdivisions() == [1, 1, 1, 2]
+    assert np.allclose(options.radii(0.8), [0.1, 0.2, 0.4, 0.8])
+    assert lsm.CornerOptions(nb_rings=1).subdivisions() == [2]
+    options = lsm.CornerOptions(nb_rings=3, angular_refinement=3)
+    assert options.subdivisions() == [1, 3, 6]
+
+    for kwargs in ({"nb_rings": 0}, {"radial_ratio": 1.0}, {"angular_refinement": 0}):
+        with pytest.raises(ValueError):
+            lsm.CornerOptions(**kwargs)
+
+    a = 3 * np.pi / 4
+    c, s = np.cos(a / 2), np.sin(a / 2)
+    vertices = np.array([[0.0, 0.0], [c, s], [c, -s]])
+    polygons = [
+        lsm.Polygon.from_vertices(np.array([0.1, 0.0]) + vertices, "right"),
+        lsm.Polygon.from_vertices(np.array([-0.1, 0.0]) - vertices, "left"),
+    ]
+    boundary = lsm.rectangular_boundary(polygons, 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygons(polygons, boundary)
+
+    for options in (
+        lsm.CornerOptions(nb_rings=1),
+        lsm.CornerOptions(nb_rings=4, radial_ratio=0.5, angular_refinement=1),
+        lsm.CornerOptions(nb_rings=3, angular_refinement=2),
+    ):
+        lsm.mesh_locally_structured(geometry, mesh_size, corner_options=options)
+
+    return None
+
+
+def test_corner_options() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_corner_options()
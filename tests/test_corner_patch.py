@@ -0,0 +1,68 @@
+"""Tests for the templates of the corner patches."""
+
+import numpy as np
+
+import lostinmsh as lsm
+from lostinmsh.mesh.corner_patch import _corner_template, corner_template
+
+
+def main(mesh_size: float) -> None:
+    t = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    polygon = lsm.Polygon.from_vertices(np.vstack((np.cos(t), np.sin(t))).T, "cavity")
+    options = lsm.CornerOptions(nb_rings=3, radial_ratio=0.5, angular_refinement=1)
+
+    # The corners of a regular polygon share their template.
+    template = corner_template(polygon.corners[0], options)
+    assert all(corner_template(c, options) is template for c in polygon.corners)
+
+    # The rings are on the circles of the radii, the outer point k is on the
+    # second edge.
+    radii = np.linalg.norm(template.points[1:], axis=1)
+    corner = polygon.corners[0]
+    for factor, r in zip(options.subdivisions(), options.radii(1.0)):
+        assert np.isclose(radii, r).sum() == factor * (corner.p + corner.q)
+    outer = template.points[template.outer_points[template.sides[1]]]
+    assert np.isclose(np.arctan2(outer[1], outer[0]), corner.angle)
+
+    # The lines of the outer ring bound one surface, the others two.
+    uses = np.zeros(len(template.lines), dtype=int)
+    for loop, _, _ in template.surfaces:
+        uses[np.abs(loop) - 1] += 1
+    outer_lines = np.abs(template.outer_lines) - 1
+    assert np.all(uses[outer_lines] == 1)
+    assert np.sum(uses == 2) == len(template.lines) - len(outer_lines)
+
+    boundary = lsm.circular_boundary([polygon], 0.25, "background")
+    geometry = lsm.Geometry.from_polygon(polygon, boundary)
+    before = lsm.mesh.corner_template_info()
+    lsm.mesh_locally_structured(geometry, mesh_size, corner_options=options)
+    after = lsm.mesh.corner_template_info()
+    assert after.hits - before.hits == 8
+    assert after.misses == before.misses
+    assert 0 < after.hit_rate() <= 1
+
+    # The mesh does not depend on the templates being cached or not.
+    sizes = []
+    for cache in ("cold", "warm"):
+        if cache == "cold":
+            _corner_template.cache_clear()
+        filename = lsm.mesh_locally_structured(
+            geometry,
+            mesh_size,
+            lsm.GmshOptions(filename=f"tests/corner_patch_{cache}.msh"),
+            corner_options=options,
+        )
+        assert filename is not None
+        mesh_data = lsm.MeshData.from_msh(filename)
+        sizes.append((mesh_data.nodes.shape[0], mesh_data.triangles.shape[0]))
+    assert sizes[0] == sizes[1]
+
+    return None
+
+
+def test_corner_patch() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_corner_patch()
@@ -0,0 +1,64 @@
+"""Tests for the meshes of higher order."""
+
+import meshio
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+
+
+def main(mesh_size: float) -> None:
+    square = lsm.MeshData(
+        np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]),
+        np.array([[0, 1, 2], [0, 2, 3]]),
+        np.array([1, 2]),
+    )
+    with pytest.raises(ValueError):
+        lsm.elevate_order(square, 0)
+    assert lsm.elevate_order(square, 1) is square
+
+    # 4 vertices, 5 edges, 2 triangles.
+    for order, nb_nodes in ((2, 4 + 5), (3, 4 + 5 * 2 + 2), (4, 4 + 5 * 3 + 2 * 3)):
+        mesh = lsm.elevate_order(square, order)
+        assert mesh.order() == order
+        assert mesh.nodes.shape[0] == nb_nodes
+        assert np.array_equal(mesh.vertices(), square.triangles)
+
+        # The nodes of the shared edge are shared.
+        a, b = set(mesh.triangles[0]), set(mesh.triangles[1])
+        assert len(a & b) == order + 1
+
+    with pytest.raises(ValueError):
+        lsm.elevate_order(lsm.elevate_order(square, 2), 3)
+
+    polygon = lsm.Polygon.from_vertices(
+        np.array([[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]]), "L"
+    )
+    boundary = lsm.rectangular_boundary([polygon], 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygon(polygon, boundary)
+
+    filename = lsm.mesh_locally_structured(
+        geometry, mesh_size, lsm.GmshOptions(filename="tests/elevate_p1.msh")
+    )
+    assert filename is not None
+    for order in (2, 3):
+        reference = lsm.mesh_locally_structured(
+            geometry,
+            mesh_size,
+            lsm.GmshOptions(
+                filename=f"tests/elevate_p{order}.msh", element_order=order
+            ),
+        )
+        assert reference is not None
+        mesh = lsm.elevate_order(filename, order)
+        assert mesh.nodes.shape[0] == meshio.read(reference).points.shape[0]
+
+    return None
+
+
+def test_elevate() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_elevate()
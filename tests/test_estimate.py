@@ -0,0 +1,75 @@
+"""Tests for the mesh size estimate."""
+
+import json
+
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+
+
+def main(mesh_size: float) -> None:
+    cocotte = np.array([[2, 0], [3, 1], [3, 2], [1, 2], [1, 3], [0, 2], [1, 1], [2, 1]])
+    fleche = np.array([[2, 0], [2, 1], [3, 1], [2, 2], [1, 2], [1, 3], [0, 3], [0, 2]])
+
+    polygons = [
+        lsm.Polygon.from_vertices(cocotte - np.array([3.2, 0]), "cocotte"),
+        lsm.Polygon.from_vertices(fleche + np.array([0.2, 0]), "fleche"),
+    ]
+    boundary = lsm.rectangular_boundary(polygons, 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygons(polygons, boundary)
+
+    for method in ("unstructured", "locally_structured"):
+        coarse = lsm.estimate_mesh(geometry, mesh_size, method)
+        fine = lsm.estimate_mesh(geometry, mesh_size / 2, method)
+
+        assert set(coarse.regions) == {"cocotte", "fleche", "background", "PML"}
+        assert sum(coarse.regions.values()) == coarse.nb_triangles
+        assert 2 * coarse.nb_triangles < fine.nb_triangles < 5 * coarse.nb_triangles
+        assert coarse.nb_dofs(1) == coarse.nb_nodes
+        assert coarse.nb_nodes < coarse.nb_dofs(2) < coarse.nb_dofs(3)
+
+    # 4(p + q) triangles per corner and 4(n - 1) per edge, at least 4 per edge.
+    lost = lsm.estimate_mesh(geometry, mesh_size)
+    nb_corners = sum(len(polygon.corners) for polygon in polygons)
+    assert lost.nb_structured >= 4 * nb_corners + 4 * nb_corners
+    assert lost.nb_structured % 4 == 0
+    assert lsm.estimate_mesh(geometry, mesh_size, "unstructured").nb_structured == 0
+    json.dumps(lost.regions)
+
+    # A single ring has 2(p + q) triangles per corner.
+    one_ring = lsm.estimate_mesh(
+        geometry, mesh_size, corner_options=lsm.CornerOptions(nb_rings=1)
+    )
+    assert lost.nb_structured - one_ring.nb_structured == sum(
+        2 * (corner.p + corner.q) for polygon in polygons for corner in polygon.corners
+    )
+
+    # The estimate is within a factor 3/2 of the mesh.
+    filename = lsm.mesh_locally_structured(
+        geometry, mesh_size, lsm.GmshOptions(filename="tests/estimate.msh")
+    )
+    assert filename is not None
+    mesh_data = lsm.MeshData.from_msh(filename)
+    assert 2 / 3 < lost.nb_nodes / mesh_data.nodes.shape[0] < 3 / 2
+    assert 2 / 3 < lost.nb_triangles / mesh_data.triangles.shape[0] < 3 / 2
+
+    # Two polygons almost touching limit the corner radius.
+    polygons[1] = lsm.Polygon.from_vertices(
+        fleche - np.array([0.2 - 1e-3, 0]), "fleche"
+    )
+    boundary = lsm.circular_boundary(polygons, 0.5, "background")
+    geometry = lsm.Geometry.from_polygons(polygons, boundary)
+    with pytest.warns(UserWarning, match="'cocotte' and .* of 'fleche'"):
+        tiny = lsm.estimate_mesh(geometry, mesh_size)
+    assert tiny.corner_radius is not None and tiny.corner_radius < 1e-3
+
+    return None
+
+
+def test_estimate() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_estimate()
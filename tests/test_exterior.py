@@ -0,0 +1,123 @@
+"""Tests for the partition of the exterior."""
+
+import gmsh
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+from lostinmsh.mesh.mesh_boundary import _cut_positions, mesh_exterior
+from lostinmsh.mesh.mesh_unst import mesh_unst_poly
+
+
+def main(mesh_size: float) -> None:
+    with pytest.raises(ValueError):
+        lsm.ExteriorOptions(partition=0)
+    with pytest.raises(ValueError):
+        lsm.ExteriorOptions(thickness_layers=0)
+    with pytest.raises(ValueError):
+        lsm.ExteriorOptions(growth_rate=1.2)
+    with pytest.raises(ValueError):
+        lsm.ExteriorOptions(growth_rate=0.8, max_size=1.0)
+
+    # The cuts are moved in the gaps between the inner loops.
+    cuts = _cut_positions((0.0, 4.0), np.ones_like, [(0.5, 1.5), (2.5, 3.5)], 2, 0.25)
+    assert cuts == [2.0]
+    cuts = _cut_positions((0.0, 4.0), np.ones_like, [(0.5, 2.5)], 2, 0.25)
+    assert cuts == [2.75]
+    assert _cut_positions((0.0, 4.0), np.ones_like, [(0.1, 3.9)], 4, 0.25) == []
+
+    polygons = [
+        lsm.Polygon.from_vertices(
+            np.array([[0, 0], [1, 0], [1, 1], [0, 1]]) + np.array([2 * k, 0]),
+            f"square_{k}",
+        )
+        for k in range(4)
+    ]
+
+    for boundary in (
+        lsm.rectangular_boundary(polygons, 0.25, "background", 0.25, "PML"),
+        lsm.circular_boundary(polygons, 0.25, "background", 0.25, "PML"),
+    ):
+        geometry = lsm.Geometry.from_polygons(polygons, boundary)
+        for mesh in (lsm.mesh_unstructured, lsm.mesh_locally_structured):
+            mesh(
+                geometry,
+                mesh_size,
+                lsm.GmshOptions(nb_threads=2),
+                exterior_options=lsm.ExteriorOptions(partition=4),
+            )
+            mesh(
+                geometry,
+                mesh_size,
+                exterior_options=lsm.ExteriorOptions(thickness_layers=3),
+            )
+            mesh(
+                geometry,
+                mesh_size,
+                exterior_options=lsm.ExteriorOptions(
+                    growth_rate=1.2, max_size=4 * mesh_size
+                ),
+            )
+
+        # One strip per square and a structured PML.
+        gmsh.initialize()
+        try:
+            gmsh.model.add("exterior")
+            loop_tags = [mesh_unst_poly(polygon, mesh_size)[0] for polygon in polygons]
+            domain_tags = mesh_exterior(
+                boundary,
+                mesh_size,
+                loop_tags,
+                inner_extents=[(2.0 * k, 2.0 * k + 1) for k in range(4)],
+                options=lsm.ExteriorOptions(partition=4, thickness_layers=3),
+            )
+            gmsh.model.geo.synchronize()
+        finally:
+            gmsh.finalize()
+        assert len(domain_tags[(2, "background")]) == 4
+        # One block per inner curve, and one per corner of the rectangle.
+        nb_blocks = len(domain_tags[(1, "background_boundary")])
+        if isinstance(boundary, lsm.RectangularBoundary):
+            nb_blocks += 4
+        assert len(domain_tags[(2, "PML")]) == nb_blocks
+
+    # The grading coarsens the background of a large box.
+    boundary = lsm.rectangular_boundary(polygons, 4.0, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygons(polygons, boundary)
+    nb_background = []
+    for name, exterior_options in (
+        ("uniform", lsm.ExteriorOptions()),
+        (
+            "graded",
+            lsm.ExteriorOptions(growth_rate=1.2, max_size=4 * mesh_size),
+        ),
+    ):
+        filename = lsm.mesh_unstructured(
+            geometry,
+            mesh_size,
+            lsm.GmshOptions(filename=f"tests/exterior_{name}.msh"),
+            exterior_options=exterior_options,
+        )
+        assert filename is not None
+        mesh_data = lsm.MeshData.from_msh(filename)
+        assert mesh_data.physical_tags is not None
+        (tag,) = [
+            tag
+            for tag, physical_name in mesh_data.physical_names.items()
+            if physical_name == "background"
+        ]
+        nb_background.append(np.count_nonzero(mesh_data.physical_tags == tag))
+    assert nb_background[1] < nb_background[0]
+
+    options = lsm.GmshOptions(nb_threads=4)
+    assert options.key_val["Mesh.MaxNumThreads2D"] == 4
+
+    return None
+
+
+def test_exterior() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_exterior()
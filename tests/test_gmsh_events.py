@@ -0,0 +1,59 @@
+"""Tests for the structured gmsh events."""
+
+import gmsh
+import numpy as np
+
+import lostinmsh as lsm
+from lostinmsh.mesh import GmshEvent
+from lostinmsh.mesh.gmsh_events import GmshEventParser
+
+
+def main(nb_side: int, mesh_size: float) -> None:
+    parsed: list[GmshEvent] = []
+    parser = GmshEventParser(parsed.append)
+    event = parser.parse("Info: [ 40%] Meshing surface 3 (Plane, Delaunay)")
+    assert (event.kind, event.dim, event.entity, event.progress) == (
+        "entity",
+        2,
+        3,
+        40,
+    )
+    event = parser.parse("Info: Done meshing 2D (Wall 0.5s, CPU 0.4s)")
+    assert (event.kind, event.dim, event.wall_time) == ("done", 2, 0.5)
+    event = parser.parse("Info: 1234 nodes 2000 elements")
+    assert (event.nb_nodes, event.nb_elements, event.throughput) == (1234, 2000, 4000)
+    assert parser.parse("Warning: Something odd").kind == "warning"
+
+    # The messages logged between start and stop go to the handler.
+    gmsh.initialize()
+    try:
+        parser.start()
+        gmsh.logger.write("Something odd", "warning")
+        parser.stop()
+    finally:
+        gmsh.finalize()
+    assert [(e.kind, e.message) for e in parsed] == [("warning", "Something odd")]
+
+    t = np.linspace(0, 2 * np.pi, nb_side, endpoint=False)
+    polygon = lsm.Polygon.from_vertices(np.vstack((np.cos(t), np.sin(t))).T, "cavity")
+    boundary = lsm.circular_boundary([polygon], 0.25, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygon(polygon, boundary)
+
+    events: list[GmshEvent] = []
+    lsm.mesh_locally_structured(
+        geometry, mesh_size, lsm.GmshOptions(event_handler=events.append)
+    )
+    assert any(event.kind == "done" and event.dim == 2 for event in events)
+
+    surfaces = [e for e in events if e.kind == "entity" and e.dim == 2]
+    assert all(e.index is not None and e.index <= e.total for e in surfaces)
+
+    return None
+
+
+def test_gmsh_events() -> None:
+    main(5, 0.25)
+
+
+if __name__ == "__main__":
+    test_gmsh_events()
@@ -0,0 +1,40 @@
+"""Tests for the corner-graded unstructured mesh."""
+
+import numpy as np
+
+import lostinmsh as lsm
+from lostinmsh.mesh.size_field import CornerSource, singular_exponent
+
+
+def main(mesh_size: float) -> None:
+    polygon = lsm.Polygon.from_vertices(
+        np.array([[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]]), "L"
+    )
+    exponents = [singular_exponent(corner) for corner in polygon.corners]
+    assert np.allclose(exponents, [2 / 3, 2 / 3, 2 / 3, 2 / 3, 2 / 3, 2 / 3])
+
+    # The first element of the graded region has the size of the field there.
+    source = CornerSource(1, mesh_size, 1.0, 2 / 3)
+    h = source.min_size()
+    assert h < mesh_size
+    assert np.isclose(h, mesh_size * (h / source.radius) ** (1 - source.exponent))
+
+    boundary = lsm.rectangular_boundary([polygon], 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygon(polygon, boundary)
+    lsm.mesh_unstructured(geometry, mesh_size, graded_corners=True)
+    lsm.mesh_unstructured(
+        geometry,
+        mesh_size,
+        exterior_options=lsm.ExteriorOptions(growth_rate=1.2, max_size=2 * mesh_size),
+        graded_corners=True,
+    )
+
+    return None
+
+
+def test_graded_corners() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_graded_corners()
@@ -0,0 +1,35 @@
+"""Tests for the graded edges of the locally structured mesh."""
+
+import numpy as np
+
+import lostinmsh as lsm
+from lostinmsh.mesh.lost_parameters import edge_subdivision, graded_edge_subdivision
+
+
+def main(mesh_size: float) -> None:
+    # Long edge with small corners: fewer points than the uniform edge.
+    uniform = edge_subdivision(10.0, 0.1, 0.1, 0.01, 0.01, mesh_size)
+    graded, coef = graded_edge_subdivision(10.0, 0.1, 0.1, 0.01, 0.01, mesh_size)
+    assert graded < uniform
+    assert np.isclose(coef, np.sqrt(0.01 / mesh_size))
+
+    # Corners coarser than the edge: no grading.
+    graded, coef = graded_edge_subdivision(1.0, 0.1, 0.1, 1.0, 1.0, mesh_size)
+    assert coef == 1.0
+    assert graded == edge_subdivision(1.0, 0.1, 0.1, 1.0, 1.0, mesh_size)
+
+    vertices = np.array([[0, 0], [8, 0], [8, 1], [0, 1]])
+    polygon = lsm.Polygon.from_vertices(vertices, "bar")
+    boundary = lsm.rectangular_boundary([polygon], 0.5, "background")
+    geometry = lsm.Geometry.from_polygon(polygon, boundary)
+    lsm.mesh_locally_structured(geometry, mesh_size, graded_edges=True)
+
+    return None
+
+
+def test_graded_edges() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_graded_edges()
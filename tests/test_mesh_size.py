@@ -0,0 +1,58 @@
+"""Tests for the mesh size of each region."""
+
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+from lostinmsh.mesh.mesh_size import MeshSizes
+
+
+def main(mesh_size: float) -> None:
+    square = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    polygons = [
+        lsm.Polygon.from_vertices(square, "coarse"),
+        lsm.Polygon.from_vertices(square + np.array([2, 0]), "fine"),
+    ]
+    boundary = lsm.rectangular_boundary(polygons, 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygons(polygons, boundary)
+
+    sizes = MeshSizes.from_mesh_size(geometry, mesh_size)
+    assert sizes["fine"] == sizes["PML"] == mesh_size
+    assert sizes.get("PML") is None
+
+    mapping = {"background": mesh_size, "fine": mesh_size / 4, "PML": 2 * mesh_size}
+    sizes = MeshSizes.from_mesh_size(geometry, mapping)
+    assert sizes["coarse"] == mesh_size
+    assert sizes["fine"] == mesh_size / 4
+    assert sizes.get("PML") == 2 * mesh_size
+
+    with pytest.raises(ValueError):
+        MeshSizes.from_mesh_size(geometry, {"fine": mesh_size})
+    with pytest.raises(ValueError):
+        MeshSizes.from_mesh_size(geometry, {"background": mesh_size, "cavity": 1})
+    with pytest.raises(ValueError):
+        MeshSizes.from_mesh_size(geometry, {"background": 0.0})
+
+    for mesh in (lsm.mesh_unstructured, lsm.mesh_locally_structured):
+        mesh(geometry, mapping)
+        mesh(
+            geometry,
+            mapping,
+            exterior_options=lsm.ExteriorOptions(
+                thickness_layers=2, growth_rate=1.3, max_size=4 * mesh_size
+            ),
+        )
+        with pytest.raises(ValueError):
+            mesh(geometry, mapping, target_elements=1000)
+        with pytest.raises(ValueError):
+            mesh(geometry, {"fine": mesh_size})
+
+    return None
+
+
+def test_mesh_size() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_mesh_size()
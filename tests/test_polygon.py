@@ -0,0 +1,31 @@
+"""Tests for the corners of the polygons."""
+
+import numpy as np
+
+import lostinmsh as lsm
+from lostinmsh.geometry.polygon import _compute_pq
+
+
+def main(mesh_size: float) -> None:
+    # The angles close to π are subdivided once on each side.
+    for angle in (np.pi - 1e-3, np.pi, np.pi + 1e-3):
+        assert _compute_pq(angle, 16) == (1, 1)
+
+    # Nearly flat vertex in the middle of the bottom edge.
+    polygon = lsm.Polygon.from_vertices(
+        np.array([[0, 0], [1, 1e-3], [2, 0], [2, 1], [0, 1]]), "flat"
+    )
+    assert (polygon.corners[1].p, polygon.corners[1].q) == (1, 1)
+
+    boundary = lsm.circular_boundary([polygon], 0.25, "background")
+    lsm.mesh_locally_structured(lsm.Geometry.from_polygon(polygon, boundary), mesh_size)
+
+    return None
+
+
+def test_polygon() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_polygon()
@@ -0,0 +1,78 @@
+"""Tests for the profiling of mesh runs."""
+
+import numpy as np
+
+import lostinmsh as lsm
+
+
+def main(mesh_size: float) -> None:
+    a = 3 * np.pi / 4
+    c, s = np.cos(a / 2), np.sin(a / 2)
+    vertices = np.array([[0.0, 0.0], [c, s], [c, -s]])
+
+    polygons = [
+        lsm.Polygon.from_vertices(np.array([0.1, 0.0]) + vertices, "right"),
+        lsm.Polygon.from_vertices(np.array([-0.1, 0.0]) - vertices, "left"),
+    ]
+    boundary = lsm.rectangular_boundary(polygons, 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygons(polygons, boundary)
+
+    spans: list[str] = []
+    profiler = lsm.Profiler(span=lambda name: _Span(spans, name))
+
+    lsm.mesh_unstructured(geometry, mesh_size, lsm.GmshOptions(profiler=profiler))
+    lsm.mesh_locally_structured(geometry, mesh_size, lsm.GmshOptions(profiler=profiler))
+    assert len(profiler.reports) == 2
+
+    unst, lost = profiler.reports
+    for report in (unst, lost):
+        names = [phase.name for phase in report.phases]
+        assert names == [
+            "cad",
+            "synchronize",
+            "physical_groups",
+            "generate",
+            "renumber",
+        ]
+        assert all(phase.wall_time >= 0 for phase in report.phases)
+        assert report.nb_nodes > 0
+        assert sum(report.nb_elements.values()) > 0
+        assert np.isclose(
+            report.wall_time, sum(phase.wall_time for phase in report.phases)
+        )
+        assert report.api_calls["geo.add_point"] > 0
+        text = str(report)
+        assert all(f"  {name}" in text for name in names)
+
+    assert unst.api_calls["geo.add_point"] < lost.api_calls["geo.add_point"]
+    assert spans == 2 * [
+        "cad",
+        "synchronize",
+        "physical_groups",
+        "generate",
+        "renumber",
+    ]
+
+    return None
+
+
+class _Span:
+    """Minimal tracing backend recording the phase names."""
+
+    def __init__(self, spans: list[str], name: str) -> None:
+        self.spans = spans
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.spans.append(self.name)
+
+    def __exit__(self, *args: object) -> None:
+        return None
+
+
+def test_profiling() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_profiling()
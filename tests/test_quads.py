@@ -0,0 +1,46 @@
+"""Tests for the quadrangles of the locally structured mesh."""
+
+import matplotlib.pyplot as plt
+import meshio
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+
+
+def main(mesh_size: float) -> None:
+    polygons = [
+        lsm.Polygon.from_vertices(np.array([[0, 0], [1, 0], [1, 1], [0, 1]]), "square")
+    ]
+    boundary = lsm.rectangular_boundary(polygons, 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygons(polygons, boundary)
+
+    with pytest.raises(ValueError):
+        lsm.mesh_locally_structured(geometry, mesh_size, recombine="quads")
+
+    for recombine in (None, "structured", "all"):
+        filename = lsm.mesh_locally_structured(
+            geometry,
+            mesh_size,
+            lsm.GmshOptions(filename=f"tests/quads_{recombine}.msh"),
+            corner_options=lsm.CornerOptions(nb_rings=3, angular_refinement=1),
+            recombine=recombine,
+        )
+        assert filename is not None
+
+        cell_types = meshio.read(filename).cells_dict.keys()
+        assert any(key.startswith("triangle") for key in cell_types)
+        assert any(key.startswith("quad") for key in cell_types) == bool(recombine)
+
+        lsm.plot_mesh(filename)
+        plt.close()
+
+    return None
+
+
+def test_quads() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_quads()
@@ -0,0 +1,60 @@
+"""Tests for the nested meshes by uniform refinement."""
+
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+from lostinmsh.mesh import refine_uniformly
+
+
+def main(mesh_size: float) -> None:
+    square = lsm.MeshData(
+        np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]),
+        np.array([[0, 1, 2], [0, 2, 3]]),
+        np.array([1, 2]),
+        np.array([1, 2]),
+        {1: "lower", 2: "upper"},
+    )
+    fine, prolongation = refine_uniformly(square)
+    assert fine.nodes.shape == (9, 2)
+    assert fine.triangles.shape == (8, 3)
+    assert fine.physical_tags is not None
+    assert fine.physical_tags.tolist() == [1, 1, 1, 1, 2, 2, 2, 2]
+    assert np.allclose(fine.areas(), 1 / 8)
+    assert prolongation.shape == (9, 4)
+
+    # The prolongation is exact on the affine functions.
+    def affine(points):
+        return 1 + 2 * points[:, 0] - 3 * points[:, 1]
+
+    assert np.allclose(prolongation @ affine(square.nodes), affine(fine.nodes))
+
+    with pytest.raises(ValueError):
+        lsm.mesh_hierarchy(square, -1)
+
+    polygon = lsm.Polygon.from_vertices(
+        np.array([[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]]), "L"
+    )
+    boundary = lsm.circular_boundary([polygon], 0.5, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygon(polygon, boundary)
+    filename = lsm.mesh_locally_structured(
+        geometry, mesh_size, lsm.GmshOptions(filename="tests/hierarchy.msh")
+    )
+    assert filename is not None
+
+    meshes, prolongations = lsm.mesh_hierarchy(filename, 2)
+    assert len(meshes) == 3 and len(prolongations) == 2
+    for coarse, fine, prolongation in zip(meshes, meshes[1:], prolongations):
+        assert fine.triangles.shape[0] == 4 * coarse.triangles.shape[0]
+        assert np.isclose(fine.areas().sum(), coarse.areas().sum())
+        assert np.allclose(prolongation @ coarse.nodes, fine.nodes)
+
+    return None
+
+
+def test_refine() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_refine()
@@ -0,0 +1,66 @@
+"""Tests for the local meshing server."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+
+import numpy as np
+
+import lostinmsh as lsm
+from lostinmsh.geometry import geometry_from_dict, geometry_to_dict
+from lostinmsh.jobs import MeshJob
+from lostinmsh.serve import MeshService, make_server, request_mesh, send_request
+
+
+def main(mesh_size: float) -> None:
+    cocotte = np.array([[2, 0], [3, 1], [3, 2], [1, 2], [1, 3], [0, 2], [1, 1], [2, 1]])
+    polygon = lsm.Polygon.from_vertices(cocotte, "cocotte")
+    boundary = lsm.rectangular_boundary([polygon], 0.25, "background", 0.25, "PML")
+    geometry = lsm.Geometry.from_polygon(polygon, boundary)
+
+    copy = geometry_from_dict(geometry_to_dict(geometry))
+    assert np.allclose(copy.polygons[0].vertices, polygon.vertices)
+    assert geometry_to_dict(copy) == geometry_to_dict(geometry)
+
+    job = MeshJob.from_geometry(geometry, mesh_size, "unstructured", element_order=2)
+    assert job.key() == MeshJob.from_dict(job.to_dict()).key()
+
+    with TemporaryDirectory() as tmp:
+        address = str(Path(tmp) / "lostinmsh.sock")
+        service = MeshService(Path(tmp) / "cache", workers=2)
+        server = make_server(address, service)
+        Thread(target=server.serve_forever, daemon=True).start()
+
+        try:
+            with ThreadPoolExecutor(2) as pool:
+                responses = list(pool.map(lambda _: request_mesh(address, job), [0, 1]))
+            assert {r["status"] for r in responses} <= {
+                "meshed",
+                "deduplicated",
+                "cached",
+            }
+            assert Path(responses[0]["path"]).exists()
+
+            response = request_mesh(address, job, inline=True)
+            assert response["status"] == "cached"
+            assert response["mesh_base64"]
+
+            stats = send_request(address, {"command": "stats"})["stats"]
+            assert stats["requests"] == 3
+            assert stats["completed"] == 1
+            assert stats["queue_depth"] == 0
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.shutdown()
+
+    return None
+
+
+def test_serve() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_serve()
@@ -0,0 +1,86 @@
+"""Tests for the locally structured mesh of polygons sharing edges."""
+
+import numpy as np
+import pytest
+from scipy.spatial import KDTree
+
+import lostinmsh as lsm
+from lostinmsh.mesh.corner_patch import junction_template
+from lostinmsh.mesh.estimate import polygon_area
+from lostinmsh.mesh.lost_parameters import corner_radius
+from lostinmsh.mesh.shared_edges import has_shared_vertices
+
+
+def main(mesh_size: float) -> None:
+    square = lsm.Polygon.from_vertices(np.array([[0, 0], [1, 0], [1, 1], [0, 1]]), "a")
+
+    # Checkerboard of 3 x 3 squares without the center.
+    polygons = [
+        square.transformed(lsm.Similarity(translation=(i, j)), name="ab"[(i + j) % 2])
+        for i in range(3)
+        for j in range(3)
+        if (i, j) != (1, 1)
+    ]
+    boundary = lsm.rectangular_boundary(polygons, 0.5, "background")
+    geometry = lsm.Geometry.from_polygons(polygons, boundary)
+    assert has_shared_vertices(geometry)
+    # The shared vertices count once in the corner radius.
+    assert corner_radius(geometry, mesh_size) > mesh_size / 2
+
+    # The sectors of a vertex shared by 4 squares.
+    options = lsm.CornerOptions()
+    template = junction_template([np.pi / 2] * 4, [1] * 4, options)
+    assert len(template.sides) == len(template.boundary) == 4
+    assert {sector for _, sector, _ in template.surfaces} == {0, 1, 2, 3}
+    sides = template.points[[template.outer_points[s] for s in template.sides]]
+    assert np.allclose(
+        np.arctan2(sides[:, 1], sides[:, 0]) % (2 * np.pi),
+        np.arange(4) * np.pi / 2,
+    )
+
+    filename = lsm.mesh_locally_structured(
+        geometry, mesh_size, lsm.GmshOptions(filename="tests/shared_edges.msh")
+    )
+    lsm.mesh_locally_structured(geometry, mesh_size, recombine="all")
+
+    # Each region is meshed once, without gaps nor duplicate nodes.
+    assert filename is not None
+    mesh = lsm.MeshData.from_msh(filename)
+    assert mesh.physical_tags is not None
+    areas = mesh.areas()
+    for tag, name in mesh.physical_names.items():
+        expected = sum(polygon_area(p) for p in polygons if p.name == name)
+        if name == "background":
+            low, high = boundary.corner_low, boundary.corner_high
+            expected = float(np.prod(high - low)) - sum(map(polygon_area, polygons))
+        assert np.isclose(areas[mesh.physical_tags == tag].sum(), expected)
+    assert len(KDTree(mesh.nodes).query_pairs(1e-8)) == 0
+
+    # The edges of a single triangle are on the exterior box.
+    edges, triangle_edges = mesh.edges()
+    single = edges[np.bincount(triangle_edges.ravel()) == 1]
+    points = mesh.nodes[single.ravel()]
+    on_box = np.isclose(points, boundary.corner_low) | np.isclose(
+        points, boundary.corner_high
+    )
+    assert on_box.any(axis=1).all()
+
+    # Overlapping polygons and vertices inside an edge are not supported.
+    below = lsm.Polygon.from_vertices([[0, 0], [0, -1], [1, -1], [1, 0]], "b")
+    for pair in (
+        [square, square],
+        [square.transformed(lsm.Similarity(scale=2)), below],
+    ):
+        geometry = lsm.Geometry.from_polygons(pair, boundary)
+        with pytest.raises(ValueError):
+            lsm.mesh_locally_structured(geometry, mesh_size)
+
+    return None
+
+
+def test_shared_edges() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_shared_edges()
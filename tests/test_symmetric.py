@@ -0,0 +1,88 @@
+"""Tests for the meshes of symmetric geometries."""
+
+import numpy as np
+import pytest
+from scipy.spatial import KDTree
+
+import lostinmsh as lsm
+
+
+def main(mesh_size: float) -> None:
+    t = np.linspace(0, 2 * np.pi, 6, endpoint=False)
+    hexagon = lsm.Polygon.from_vertices(np.vstack((np.cos(t), np.sin(t))).T, "cavity")
+    geometry = lsm.Geometry.from_polygon(
+        hexagon, lsm.circular_boundary([hexagon], 0.25, "background", 0.25, "PML")
+    )
+
+    symmetry = lsm.find_symmetry(geometry)
+    assert symmetry.order == 6 and symmetry.reflections
+    assert symmetry.size() == 12
+
+    # The L shape is only symmetric about its diagonal.
+    polygon = lsm.Polygon.from_vertices(
+        np.array([[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]]), "L"
+    )
+    symmetry = lsm.find_symmetry(
+        lsm.Geometry.from_polygon(
+            polygon, lsm.rectangular_boundary([polygon], 0.5, "background")
+        )
+    )
+    assert symmetry.order == 1 and symmetry.reflections
+    assert np.isclose(symmetry.angle, np.pi / 4)
+
+    # Without symmetry.
+    triangle = lsm.Polygon.from_vertices(np.array([[0, 0], [2, 0], [0, 1]]), "T")
+    no_symmetry = lsm.Geometry.from_polygon(
+        triangle, lsm.circular_boundary([triangle], 0.5, "background")
+    )
+    assert lsm.find_symmetry(no_symmetry).size() == 1
+    with pytest.raises(ValueError):
+        lsm.mesh_symmetric(no_symmetry, mesh_size)
+
+    # Three blades, symmetric by rotation only.
+    blade = np.array([[0.5, -0.15], [1.0, -0.15], [0.6, 0.15]])
+    polygons = [
+        lsm.Polygon.from_vertices(
+            blade @ np.array([[np.cos(a), np.sin(a)], [-np.sin(a), np.cos(a)]]),
+            "blade",
+        )
+        for a in 2 * np.pi * np.arange(3) / 3
+    ]
+    pinwheel = lsm.Geometry.from_polygons(
+        polygons, lsm.circular_boundary(polygons, 0.5, "background")
+    )
+    symmetry = lsm.find_symmetry(pinwheel)
+    assert symmetry.order == 3 and not symmetry.reflections
+
+    for shape in (geometry, pinwheel):
+        symmetry = lsm.find_symmetry(shape)
+        mesh = lsm.mesh_symmetric(
+            shape, mesh_size, lsm.GmshOptions(filename="tests/symmetric.msh")
+        )
+
+        # The nodes are mapped onto nodes by the symmetries, without duplicates.
+        tree = KDTree(mesh.nodes)
+        assert len(tree.query_pairs(1e-8)) == 0
+        for matrix in symmetry.transforms():
+            image = symmetry.center + (mesh.nodes - symmetry.center) @ matrix.T
+            distances, _ = tree.query(image)
+            assert distances.max() < 1e-8
+
+        # The mesh is conforming: the boundary edges are on the exterior circle.
+        edges, triangle_edges = mesh.edges()
+        on_boundary = np.bincount(triangle_edges.ravel()) == 1
+        radii = np.linalg.norm(mesh.nodes[edges[on_boundary]], axis=2)
+        assert np.allclose(radii, radii.max())
+
+        reread = lsm.MeshData.from_msh("tests/symmetric.msh")
+        assert reread.triangles.shape == mesh.triangles.shape
+
+    return None
+
+
+def test_symmetric() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_symmetric()
@@ -0,0 +1,77 @@
+"""Tests for the periodic tilings."""
+
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+
+
+def main(mesh_size: float) -> None:
+    square = lsm.MeshData(
+        np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]),
+        np.array([[0, 1, 2], [0, 2, 3]]),
+        np.array([1, 2]),
+        np.array([1, 1]),
+        {1: "cell"},
+    )
+    tiling = lsm.mesh.tile_mesh(square, (1.0, 1.0), (3, 2))
+    assert tiling.nodes.shape[0] == 4 * 3
+    assert tiling.triangles.shape[0] == 2 * 3 * 2
+    assert np.isclose(tiling.areas().sum(), 6)
+    assert np.array_equal(tiling.physical_tags, np.ones(12))
+
+    polygon = lsm.Polygon.from_vertices(
+        np.array([[0.25, 0.25], [0.75, 0.25], [0.5, 0.75]]), "inclusion"
+    )
+    cell = lsm.Geometry.from_polygon(
+        polygon,
+        lsm.RectangularBoundary(
+            corner_low=np.array([0.0, 0.0]),
+            corner_high=np.array([1.0, 1.0]),
+            background_name="background",
+        ),
+    )
+    with pytest.raises(ValueError):
+        lsm.mesh_tiling(cell, mesh_size, (0, 1))
+    with pytest.raises(ValueError):
+        lsm.mesh_tiling(
+            lsm.Geometry.from_polygon(
+                polygon, lsm.circular_boundary([polygon], 0.5, "background")
+            ),
+            mesh_size,
+            (2, 2),
+        )
+
+    for method in ("unstructured", "locally_structured"):
+        mesh = lsm.mesh_tiling(
+            cell,
+            mesh_size,
+            (3, 2),
+            lsm.GmshOptions(filename=f"tests/tiling_{method}.msh"),
+            method=method,
+        )
+        assert np.isclose(mesh.areas().sum(), 6)
+
+        # The sides of the copies are conforming: the boundary edges are on
+        # the boundary of the tiling.
+        edges, triangle_edges = mesh.edges()
+        on_boundary = np.bincount(triangle_edges.ravel()) == 1
+        points = mesh.nodes[edges[on_boundary]].mean(axis=1)
+        assert np.all(
+            np.isclose(points, 0).any(axis=1)
+            | np.isclose(points[:, 0], 3)
+            | np.isclose(points[:, 1], 2)
+        )
+
+        reread = lsm.MeshData.from_msh(f"tests/tiling_{method}.msh")
+        assert reread.triangles.shape == mesh.triangles.shape
+
+    return None
+
+
+def test_tiling() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_tiling()
@@ -0,0 +1,66 @@
+"""Tests for the similarities of polygons and geometries."""
+
+import numpy as np
+import pytest
+
+import lostinmsh as lsm
+
+
+def main(mesh_size: float) -> None:
+    polygon = lsm.Polygon.from_vertices(
+        np.array([[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]]), "L"
+    )
+
+    with pytest.raises(ValueError):
+        lsm.Similarity(scale=0)
+
+    # Same polygon as from its transformed vertices.
+    for similarity in (
+        lsm.Similarity(scale=2.5, angle=0.7, translation=(1.0, -3.0)),
+        lsm.Similarity(scale=0.3, angle=2.0, translation=(5.0, 1.0), reflection=True),
+    ):
+        image = polygon.transformed(similarity, name="copy")
+        reference = lsm.Polygon.from_vertices(
+            similarity.apply(polygon.vertices), "copy"
+        )
+        assert image.name == "copy"
+        assert np.allclose(image.vertices, reference.vertices)
+        assert np.allclose(image.lengths, reference.lengths)
+        for a, b in zip(image.corners, reference.corners):
+            assert np.isclose(a.angle, b.angle) and (a.p, a.q) == (b.p, b.q)
+            assert np.allclose(a.axis, b.axis)
+
+    similarity = lsm.Similarity(scale=2.0, angle=np.pi / 2, translation=(1.0, 1.0))
+    geometry = lsm.Geometry.from_polygon(
+        polygon, lsm.rectangular_boundary([polygon], 0.5, "background", 0.25, "PML")
+    )
+    image = geometry.transformed(similarity)
+    assert isinstance(image.boundary, lsm.RectangularBoundary)
+    assert np.isclose(
+        image.boundary.dist_to_inner_boundary(image.polygons[0].vertices),
+        2 * geometry.boundary.dist_to_inner_boundary(polygon.vertices),
+    )
+    with pytest.raises(ValueError):
+        geometry.transformed(lsm.Similarity(angle=0.3))
+
+    geometry = lsm.Geometry.from_polygon(
+        polygon, lsm.circular_boundary([polygon], 0.5, "background", 0.25, "PML")
+    )
+    image = geometry.transformed(
+        lsm.Similarity(scale=0.5, angle=0.3, translation=(1.0, 0.0), reflection=True)
+    )
+    assert isinstance(image.boundary, lsm.CircularBoundary)
+    assert np.isclose(image.boundary.radius, geometry.boundary.radius / 2)
+    assert image.boundary.thickness == geometry.boundary.thickness / 2
+
+    lsm.mesh_locally_structured(image, mesh_size / 2)
+
+    return None
+
+
+def test_transformed() -> None:
+    main(0.25)
+
+
+if __name__ == "__main__":
+    test_transformed()